@@ -0,0 +1,33 @@
+"""Synthetic SWC generators shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def synthetic_swc(rows: int, *, seed: int = 0, branch_prob: float = 0.02) -> str:
+    """Return SWC text for a random tree with `rows` nodes.
+
+    Most nodes continue from the previous one; with probability `branch_prob`
+    a node instead attaches to a random earlier node, creating a branch point.
+    """
+    rng = np.random.default_rng(seed)
+    ids = np.arange(1, rows + 1)
+    parent = ids - 1
+    branch = rng.random(rows) < branch_prob
+    branch[0] = False
+    parent[branch] = rng.integers(1, ids[branch])
+    parent[0] = -1
+    xyz = np.cumsum(rng.normal(scale=2.0, size=(rows, 3)), axis=0)
+    r = rng.uniform(0.2, 2.0, size=rows)
+    t = np.full(rows, 3)
+    t[0] = 1
+
+    lines = ["# synthetic tree", f"# nodes={rows}"]
+    lines.extend(
+        f"{n} {tt} {x:.6f} {y:.6f} {z:.6f} {rr:.6f} {p}"
+        for n, tt, (x, y, z), rr, p in zip(
+            ids.tolist(), t.tolist(), xyz.tolist(), r.tolist(), parent.tolist()
+        )
+    )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,72 @@
+"""Ancestor index build cost and batched query throughput.
+
+For each size, a synthetic tree is indexed with `AncestorIndex.from_arrays`,
+then depth, LCA, distance and path-to-root queries are timed over random
+node batches. The per-node `SWCModel.path_to_root` walk is timed on a
+small sample as the baseline ("distance to soma for every node").
+
+Run from the repository root:
+
+    python benchmarks/bench_ancestors.py [rows ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _synth import synthetic_swc  # noqa: E402
+from swcviz import AncestorIndex, MorphologyArrays, SWCModel, parse_swc  # noqa: E402
+
+
+def _time(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(sizes: list[int], queries: int = 1_000_000, walk_sample: int = 200) -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'rows':>9} {'operation':<28} {'time [s]':>9} {'queries/s':>12}")
+    for rows in sizes:
+        result = parse_swc(synthetic_swc(rows), backend="numpy")
+        arrays = MorphologyArrays.from_table(result.table)
+        dt = _time(lambda: AncestorIndex.from_arrays(arrays))
+        index = AncestorIndex.from_arrays(arrays)
+        print(
+            f"{rows:>9} {'build':<28} {dt:>9.3f} {'':>12}"
+            f"  levels={index.levels} max_depth={index.max_depth}"
+        )
+
+        a = rng.choice(arrays.ids, queries)
+        b = rng.choice(arrays.ids, queries)
+        soma = np.full(queries, arrays.ids[0])
+        ops = {
+            "depth_of": lambda: index.depth_of(a),
+            "lca": lambda: index.lca(a, b),
+            "distance": lambda: index.distance(a, b),
+            "distance to soma": lambda: index.distance(a, soma),
+        }
+        for name, op in ops.items():
+            dt = _time(op)
+            print(f"{rows:>9} {name:<28} {dt:>9.3f} {queries / dt:>12.0f}")
+
+        sample = a[:walk_sample]
+        dt = _time(lambda: index.paths_to_root(sample))
+        print(f"{rows:>9} {'paths_to_root':<28} {dt:>9.3f} {walk_sample / dt:>12.0f}")
+        model = SWCModel.from_parse_result(result)
+        dt = _time(lambda: [model.path_to_root(int(n)) for n in sample], repeat=1)
+        print(f"{rows:>9} {'SWCModel.path_to_root walk':<28} {dt:>9.3f} {walk_sample / dt:>12.0f}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,86 @@
+"""Throughput and event-loop stalls under N concurrent async loads.
+
+Each run serves `files` load requests concurrently from one event loop
+while a ticker task measures how late the loop wakes it up (the worst
+stall a concurrent request would see). Compared are blocking
+`parse_swc` calls inside coroutines, `aload_many` on the default thread
+pool, and `aload_many` on a process pool.
+
+Run from the repository root:
+
+    python benchmarks/bench_async.py [files] [rows_per_file]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _synth import synthetic_swc  # noqa: E402
+from swcviz import aload_many, parse_swc  # noqa: E402
+
+
+async def _ticker(stop: asyncio.Event, period: float = 0.005) -> float:
+    """Return the largest delay between expected and actual wake-ups."""
+    worst = 0.0
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(period)
+        worst = max(worst, time.perf_counter() - t0 - period)
+    return worst
+
+
+async def _blocking(paths):
+    async def one(p):
+        return parse_swc(p, backend="numpy")
+
+    return await asyncio.gather(*(one(p) for p in paths))
+
+
+async def _measure(label: str, make, files: int) -> None:
+    stop = asyncio.Event()
+    ticker = asyncio.ensure_future(_ticker(stop))
+    await asyncio.sleep(0)
+    t0 = time.perf_counter()
+    await make()
+    dt = time.perf_counter() - t0
+    stop.set()
+    stall = await ticker
+    print(f"{label:<28} {dt:>7.2f} s {files / dt:>9.1f} files/s  max loop stall {stall * 1e3:>8.1f} ms")
+
+
+async def main(files: int, rows: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for k in range(files):
+            p = Path(tmp) / f"cell{k}.swc"
+            p.write_text(synthetic_swc(rows, seed=k))
+            paths.append(p)
+
+        await _measure("blocking parse_swc", lambda: _blocking(paths), files)
+        for limit in (1, 8):
+            await _measure(
+                f"aload_many threads limit={limit}",
+                lambda: aload_many(paths, limit=limit, model="raw"),
+                files,
+            )
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            await _measure(
+                f"aload_many processes={workers}",
+                lambda: aload_many(paths, limit=2 * workers, model="raw", executor=pool),
+                files,
+            )
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    asyncio.run(main(*(args + [100, 20_000][len(args):])))
@@ -0,0 +1,50 @@
+"""Parse throughput of `parse_swc` on plain and compressed SWC files.
+
+Run from the repository root:
+
+    python benchmarks/bench_compression.py [rows]
+"""
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import lzma
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _synth import synthetic_swc  # noqa: E402
+from swcviz import parse_swc  # noqa: E402
+
+
+CODECS = {
+    "plain": (".swc", lambda data: data),
+    "gzip": (".swc.gz", gzip.compress),
+    "bz2": (".swc.bz2", bz2.compress),
+    "xz": (".swc.xz", lzma.compress),
+}
+
+
+def main(rows: int) -> None:
+    text = synthetic_swc(rows).encode("utf-8")
+    mb = len(text) / 1e6
+    print(f"{rows} rows, {mb:.1f} MB uncompressed")
+    print(f"{'codec':>6} {'file [MB]':>10} {'time [s]':>9} {'MB/s':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, (suffix, compress) in CODECS.items():
+            path = Path(tmp) / f"bench{suffix}"
+            path.write_bytes(compress(text))
+            t0 = time.perf_counter()
+            parse_swc(path, backend="numpy")
+            dt = time.perf_counter() - t0
+            size = path.stat().st_size / 1e6
+            print(f"{name:>6} {size:>10.1f} {dt:>9.3f} {mb / dt:>8.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
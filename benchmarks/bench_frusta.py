@@ -0,0 +1,93 @@
+"""Frustum meshing throughput across segment counts and ring resolutions.
+
+Times `batch_frusta_array` (vectorized engine), the list-returning
+`batch_frusta` wrapper and `FrustaSet.from_general_model` on the edges of
+synthetic morphologies. A scalar per-vertex construction (the former pure
+Python engine) is timed on a sample of 2000 segments and extrapolated as
+the baseline.
+
+Run from the repository root:
+
+    python benchmarks/bench_frusta.py [segments ...]
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _synth import synthetic_swc  # noqa: E402
+from swcviz import (  # noqa: E402
+    FrustaSet,
+    MorphologyArrays,
+    Segment,
+    batch_frusta,
+    batch_frusta_array,
+    parse_swc,
+)
+from swcviz.geometry import v_add, v_cross, v_mul, v_unit  # noqa: E402
+
+_SAMPLE = 2000
+
+
+def _scalar_frusta(segments: list[Segment], sides: int) -> int:
+    """Per-vertex tuple math as in the original engine; returns the vertex count."""
+    count = 0
+    for seg in segments:
+        W = v_unit(seg.vector())
+        U = v_unit(v_cross((1.0, 0.0, 0.0) if abs(W[0]) <= 0.9 else (0.0, 1.0, 0.0), W))
+        V = v_cross(W, U)
+        verts = []
+        for center, r in ((seg.a, seg.ra), (seg.b, seg.rb)):
+            for k in range(sides):
+                t = 2.0 * math.pi * (k / sides)
+                verts.append(v_add(center, v_add(v_mul(U, r * math.cos(t)), v_mul(V, r * math.sin(t)))))
+        faces = []
+        for i in range(sides):
+            i1 = (i + 1) % sides
+            faces += [
+                (i + count, i + sides + count, i1 + sides + count),
+                (i + count, i1 + sides + count, i1 + count),
+            ]
+        count += len(verts)
+    return count
+
+
+def _time(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main(sizes: list[int], sides_list: tuple[int, ...] = (8, 16, 32)) -> None:
+    print(
+        f"{'segments':>9} {'sides':>5} {'array [s]':>10} {'lists [s]':>10}"
+        f" {'FrustaSet [s]':>14} {'scalar est. [s]':>16}"
+    )
+    for size in sizes:
+        arrays = MorphologyArrays.from_table(parse_swc(synthetic_swc(size + 1), backend="numpy").table)
+        u, v = arrays.edges[:, 0], arrays.edges[:, 1]
+        a, b, ra, rb = arrays.xyz[u], arrays.xyz[v], arrays.r[u], arrays.r[v]
+        segments = [
+            Segment(tuple(p), tuple(q), r0, r1)  # type: ignore[arg-type]
+            for p, q, r0, r1 in zip(a.tolist(), b.tolist(), ra.tolist(), rb.tolist())
+        ]
+        sample = segments[:_SAMPLE]
+        for sides in sides_list:
+            t_array = _time(lambda: batch_frusta_array(a, b, ra, rb, sides=sides))
+            t_lists = _time(lambda: batch_frusta(segments, sides=sides))
+            t_set = _time(lambda: FrustaSet.from_general_model(arrays, sides=sides))
+            t_scalar = _time(lambda: _scalar_frusta(sample, sides)) * len(segments) / len(sample)
+            print(
+                f"{len(segments):>9} {sides:>5} {t_array:>10.3f} {t_lists:>10.3f}"
+                f" {t_set:>14.3f} {t_scalar:>16.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000])
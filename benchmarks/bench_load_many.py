@@ -0,0 +1,47 @@
+"""Serial `parse_swc` loop versus `load_many` over a directory of files.
+
+Run from the repository root:
+
+    python benchmarks/bench_load_many.py [files] [rows_per_file]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _synth import synthetic_swc  # noqa: E402
+from swcviz import load_many, parse_swc  # noqa: E402
+
+
+def main(files: int, rows: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for k in range(files):
+            p = Path(tmp) / f"cell{k}.swc"
+            p.write_text(synthetic_swc(rows, seed=k))
+            paths.append(p)
+
+        t0 = time.perf_counter()
+        for p in paths:
+            parse_swc(p, backend="numpy")
+        t_serial = time.perf_counter() - t0
+        print(f"serial parse_swc loop: {t_serial:.2f} s")
+
+        for workers in sorted({2, 4, os.cpu_count() or 1}):
+            t0 = time.perf_counter()
+            results = load_many(paths, workers=workers, model="raw")
+            dt = time.perf_counter() - t0
+            assert all(r.ok for r in results)
+            print(f"load_many workers={workers:<3d}: {dt:.2f} s ({t_serial / dt:.1f}x)")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(*(args + [200, 20_000][len(args):]))
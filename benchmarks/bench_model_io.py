@@ -0,0 +1,68 @@
+"""GeneralModel save/load versus pickle and SWC parsing.
+
+For each size, a synthetic morphology is written as SWC, loaded into a
+`GeneralModel` (with provenance), then saved and reloaded with
+`GeneralModel.save` / `load` / `load_arrays` and with pickle. Reports
+times and on-disk sizes.
+
+Run from the repository root:
+
+    python benchmarks/bench_model_io.py [rows ...]
+"""
+
+from __future__ import annotations
+
+import pickle
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _synth import synthetic_swc  # noqa: E402
+from swcviz import GeneralModel  # noqa: E402
+
+
+def _size(path: Path) -> int:
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.iterdir())
+    return path.stat().st_size
+
+
+def main(sizes: list[int]) -> None:
+    print(f"{'rows':>9} {'operation':<22} {'time [s]':>9} {'size [MB]':>10}")
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            swc, saved, pickled = Path(tmp, "m.swc"), Path(tmp, "model"), Path(tmp, "m.pkl")
+            swc.write_text(synthetic_swc(rows))
+            t0 = time.perf_counter()
+            gm = GeneralModel.from_swc_file(str(swc), backend="numpy")
+            t1 = time.perf_counter()
+            gm.save(saved)
+            t2 = time.perf_counter()
+            with open(pickled, "wb") as f:
+                pickle.dump(gm, f, protocol=pickle.HIGHEST_PROTOCOL)
+            t3 = time.perf_counter()
+            GeneralModel.load(saved)
+            t4 = time.perf_counter()
+            GeneralModel.load_arrays(saved)
+            t5 = time.perf_counter()
+            with open(pickled, "rb") as f:
+                pickle.load(f)
+            t6 = time.perf_counter()
+            for name, dt, size in [
+                ("parse SWC", t1 - t0, _size(swc)),
+                ("save", t2 - t1, _size(saved)),
+                ("pickle.dump", t3 - t2, _size(pickled)),
+                ("load", t4 - t3, None),
+                ("load_arrays", t5 - t4, None),
+                ("pickle.load", t6 - t5, None),
+            ]:
+                mb = f"{size / 1e6:>10.1f}" if size is not None else ""
+                print(f"{rows:>9} {name:<22} {dt:>9.3f} {mb}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
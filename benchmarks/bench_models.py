@@ -0,0 +1,73 @@
+"""Model build time and peak memory versus node count.
+
+For each size, a synthetic tree (with a few reconnection merges) is parsed
+once; then each builder is timed, and run again under `tracemalloc` for
+its peak allocation. `MorphologyArrays.from_table` is included as the
+array-only baseline without a graph layer.
+
+Run from the repository root:
+
+    python benchmarks/bench_models.py [rows ...]
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _synth import synthetic_swc  # noqa: E402
+from swcviz import GeneralModel, MorphologyArrays, SWCModel, parse_swc  # noqa: E402
+
+
+def _with_merges(text: str, rows: int, every: int = 100) -> str:
+    """Append duplicate rows of every `every`-th node plus reconnect directives."""
+    body = text.splitlines()
+    header = [ln for ln in body if ln.startswith("#")]
+    data = [ln for ln in body if not ln.startswith("#")]
+    extra, directives = [], []
+    for k, n in enumerate(range(every, rows, every), start=1):
+        parts = data[n - 1].split()
+        dup = rows + k
+        extra.append(" ".join([str(dup), parts[1], *parts[2:6], str(n)]))
+        directives.append(f"# CYCLE_BREAK reconnect {n} {dup}")
+    return "\n".join(header + directives + data + extra)
+
+
+def _measure(build) -> tuple[float, float]:
+    gc.collect()
+    t0 = time.perf_counter()
+    obj = build()
+    dt = time.perf_counter() - t0
+    del obj
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del obj
+    return dt, peak / 1e6
+
+
+def main(sizes: list[int]) -> None:
+    builders = {
+        "MorphologyArrays.from_table": lambda r: MorphologyArrays.from_table(r.table),
+        "SWCModel.from_parse_result": lambda r: SWCModel.from_parse_result(r),
+        "GeneralModel (provenance)": lambda r: GeneralModel.from_parse_result(r),
+        "GeneralModel (no provenance)": lambda r: GeneralModel.from_parse_result(r, provenance=False),
+    }
+    print(f"{'rows':>9} {'builder':<30} {'time [s]':>9} {'peak [MB]':>10} {'B/node':>8}")
+    for rows in sizes:
+        result = parse_swc(_with_merges(synthetic_swc(rows), rows), backend="numpy")
+        for name, build in builders.items():
+            dt, peak = _measure(lambda: build(result))
+            print(f"{rows:>9} {name:<30} {dt:>9.3f} {peak:>10.1f} {peak * 1e6 / rows:>8.0f}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,75 @@
+"""Morphometrics throughput: vectorized module versus networkx traversals.
+
+For each size, per-node path length, per-section metrics and a Sholl
+profile are computed with `swcviz.morphometrics`; the networkx baseline
+computes path length to the soma with a per-node `shortest_path_length`
+(Dijkstra) traversal. The batch row stacks many small cells.
+
+Run from the repository root:
+
+    python benchmarks/bench_morphometrics.py [rows ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _synth import synthetic_swc  # noqa: E402
+from swcviz import (  # noqa: E402
+    MorphologyArrays,
+    SWCModel,
+    node_metrics,
+    node_metrics_many,
+    parse_swc,
+    section_metrics,
+    sholl,
+)
+
+
+def _time(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def _networkx_path_length(model: SWCModel) -> dict:
+    def length(u, v, _):
+        a, b = model.nodes[u], model.nodes[v]
+        return ((a["x"] - b["x"]) ** 2 + (a["y"] - b["y"]) ** 2 + (a["z"] - b["z"]) ** 2) ** 0.5
+
+    root = model.roots()[0]
+    return nx.single_source_dijkstra_path_length(model, root, weight=length)
+
+
+def main(sizes: list[int], cells: int = 1000) -> None:
+    print(f"{'rows':>9} {'operation':<32} {'time [s]':>9}")
+    for rows in sizes:
+        result = parse_swc(synthetic_swc(rows), backend="numpy")
+        arrays = MorphologyArrays.from_table(result.table)
+        radii = np.linspace(10.0, 500.0, 50)
+        for name, op in {
+            "node_metrics": lambda: node_metrics(arrays),
+            "section_metrics": lambda: section_metrics(arrays),
+            "sholl (50 radii)": lambda: sholl(arrays, radii),
+        }.items():
+            print(f"{rows:>9} {name:<32} {_time(op):>9.3f}")
+        model = SWCModel.from_parse_result(result)
+        print(f"{rows:>9} {'networkx path length':<32} {_time(lambda: _networkx_path_length(model)):>9.3f}")
+
+    small = MorphologyArrays.from_table(parse_swc(synthetic_swc(500), backend="numpy").table)
+    dt_batch = _time(lambda: node_metrics_many([small] * cells))
+    dt_loop = _time(lambda: [node_metrics(small) for _ in range(cells)])
+    print(f"{cells * 500:>9} {f'node_metrics_many ({cells} cells)':<32} {dt_batch:>9.3f}")
+    print(f"{cells * 500:>9} {f'node_metrics loop ({cells} cells)':<32} {dt_loop:>9.3f}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,49 @@
+"""Compare `parse_swc` backends on synthetic SWC files.
+
+Run from the repository root:
+
+    python benchmarks/bench_parse.py [rows ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _synth import synthetic_swc  # noqa: E402
+from swcviz import parse_swc  # noqa: E402
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(sizes: list[int]) -> None:
+    print(
+        f"{'rows':>10} {'python [s]':>12} {'numpy [s]':>12} {'speedup':>9} {'table [MB]':>11}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            path = Path(tmp) / f"bench_{rows}.swc"
+            path.write_text(synthetic_swc(rows))
+            repeat = 3 if rows <= 100_000 else 1
+            t_py = _best_of(lambda: parse_swc(path, backend="python"), repeat)
+            t_np = _best_of(lambda: parse_swc(path, backend="numpy"), repeat)
+            table_mb = parse_swc(path, backend="numpy").table.nbytes / 1e6
+            print(
+                f"{rows:>10} {t_py:>12.3f} {t_np:>12.3f} {t_py / t_np:>8.1f}x {table_mb:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,43 @@
+"""Time `PointSet.from_txt` (bulk arrays) against the list-based `from_points`.
+
+Run from the repository root:
+
+    python benchmarks/bench_points.py [points ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from swcviz import PointSet  # noqa: E402
+
+
+def main(sizes: list[int]) -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'points':>10} {'from_txt [s]':>13} {'from_points [s]':>16}")
+    for size in sizes:
+        xyz = rng.uniform(-500, 500, size=(size, 3))
+        extra = rng.uniform(0.1, 2.0, size=size)
+        text = "\n".join(
+            f"{x:.4f} {y:.4f} {z:.4f} {s:.3f}" for (x, y, z), s in zip(xyz.tolist(), extra.tolist())
+        )
+        t0 = time.perf_counter()
+        ps = PointSet.from_txt(text, column_names=["size"])
+        t_bulk = time.perf_counter() - t0
+        assert ps.points.shape == (size, 3) and ps.columns["size"].shape == (size,)
+        t_list = float("nan")
+        if size <= 100_000:
+            t0 = time.perf_counter()
+            PointSet.from_points([tuple(p) for p in ps.points.tolist()])
+            t_list = time.perf_counter() - t0
+        print(f"{size:>10} {t_bulk:>13.3f} {t_list:>16.3f}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
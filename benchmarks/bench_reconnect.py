@@ -0,0 +1,54 @@
+"""Benchmark reconnection candidate detection.
+
+Takes synthetic morphologies, duplicates 1% of their points under fresh ids
+(unannotated cycle breaks) and times `find_reconnections`; the all-pairs
+comparison it replaces would need ``N**2 / 2`` comparisons.
+
+Run from the repository root:
+
+    python benchmarks/bench_reconnect.py [rows ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _synth import synthetic_swc  # noqa: E402
+from swcviz import SWCTable, find_reconnections, parse_swc  # noqa: E402
+
+
+def _with_duplicates(table: SWCTable, fraction: float, rng: np.random.Generator) -> SWCTable:
+    rows = rng.choice(len(table), size=max(int(len(table) * fraction), 1), replace=False)
+    n = np.arange(len(table) + 1, len(table) + rows.size + 1, dtype=np.int64)
+    return SWCTable(
+        n=np.concatenate([table.n, n]),
+        t=np.concatenate([table.t, table.t[rows]]),
+        x=np.concatenate([table.x, table.x[rows]]),
+        y=np.concatenate([table.y, table.y[rows]]),
+        z=np.concatenate([table.z, table.z[rows]]),
+        r=np.concatenate([table.r, table.r[rows]]),
+        parent=np.concatenate([table.parent, np.full(rows.size, -1, dtype=np.int64)]),
+        line=np.concatenate([table.line, np.zeros(rows.size, dtype=np.int64)]),
+    )
+
+
+def main(sizes: list[int]) -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'rows':>9} {'pairs':>8} {'time [s]':>9} {'rows/s':>12}")
+    for rows in sizes:
+        table = _with_duplicates(parse_swc(synthetic_swc(rows), backend="numpy").table, 0.01, rng)
+        t0 = time.perf_counter()
+        pairs = find_reconnections(table)
+        dt = time.perf_counter() - t0
+        print(f"{len(table):>9} {pairs.shape[0]:>8} {dt:>9.3f} {len(table) / dt:>12.0f}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,60 @@
+"""Radius-scaling cost for slider frames: remeshing vs moving vertices.
+
+For each size, builds a `FrustaSet` and times the vertices of a 21-step
+slider computed by the former `scaled` (rebuild scaled `Segment` objects and
+remesh them), with `scaled_many`, and with `scaled` per step (array math
+only: vertices, radial offsets and radii). Also times `PointSet.scaled`.
+
+Run from the repository root:
+
+    python benchmarks/bench_scaling.py [segments ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import numpy as np  # noqa: E402
+
+from _synth import synthetic_swc  # noqa: E402
+from swcviz import FrustaSet, MorphologyArrays, PointSet, Segment, batch_frusta_array, parse_swc  # noqa: E402
+from swcviz.geometry import _segment_arrays  # noqa: E402
+
+_STEPS = 21
+
+
+def _time(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def _remesh(fr: FrustaSet, s: float):
+    segments = [Segment(a=g.a, b=g.b, ra=g.ra * s, rb=g.rb * s) for g in fr.segments]
+    return batch_frusta_array(*_segment_arrays(segments), sides=fr.sides, end_caps=fr.end_caps)
+
+
+def main(sizes: list[int], sides: int = 16) -> None:
+    scales = np.linspace(0.0, 1.0, _STEPS).tolist()
+    print(
+        f"{'segments':>9} {'remesh x21 [s]':>15} {'scaled_many [s]':>16}"
+        f" {'scaled x21 [s]':>15} {'points scaled [s]':>18}"
+    )
+    for size in sizes:
+        arrays = MorphologyArrays.from_table(parse_swc(synthetic_swc(size + 1), backend="numpy").table)
+        fr = FrustaSet.from_general_model(arrays, sides=sides)
+        ps = PointSet.from_array(arrays.xyz)
+        t_remesh = _time(lambda: [_remesh(fr, s) for s in scales])
+        t_many = _time(lambda: fr.scaled_many(scales))
+        t_scaled = _time(lambda: [fr.scaled(s) for s in scales])
+        t_points = _time(lambda: ps.scaled(2.0))
+        print(f"{fr.segment_count:>9} {t_remesh:>15.3f} {t_many:>16.3f} {t_scaled:>15.3f} {t_points:>18.3f}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000])
@@ -0,0 +1,67 @@
+"""Spatial index build time and batched query throughput.
+
+For each size, node and segment indices of a synthetic morphology are
+built, then nearest-node, nearest-segment and radius queries are timed for
+synapse-like points (nodes jittered by a few microns). A smaller batch of
+points drawn uniformly from the bounding box shows the far-field cost,
+which grows with the distance to the nearest item. A brute-force NumPy
+scan over all nodes is timed on a small sample as the baseline.
+
+Run from the repository root:
+
+    python benchmarks/bench_spatial.py [rows ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _synth import synthetic_swc  # noqa: E402
+from swcviz import MorphologyArrays, SpatialIndex, parse_swc  # noqa: E402
+
+
+def _time(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main(sizes: list[int], queries: int = 100_000, brute_sample: int = 100) -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'rows':>9} {'operation':<26} {'time [s]':>9} {'queries/s':>12}")
+    for rows in sizes:
+        arrays = MorphologyArrays.from_table(parse_swc(synthetic_swc(rows), backend="numpy").table)
+        u, v = arrays.edges[:, 0], arrays.edges[:, 1]
+        t0 = time.perf_counter()
+        nodes = SpatialIndex.from_points(arrays.xyz)
+        t1 = time.perf_counter()
+        segments = SpatialIndex(arrays.xyz[u], arrays.xyz[v], arrays.r[u], arrays.r[v])
+        t2 = time.perf_counter()
+        print(f"{rows:>9} {'build (nodes)':<26} {t1 - t0:>9.3f}")
+        print(f"{rows:>9} {'build (segments)':<26} {t2 - t1:>9.3f}")
+
+        points = arrays.xyz[rng.integers(0, rows, queries)] + rng.normal(0.0, 3.0, size=(queries, 3))
+        far = rng.uniform(arrays.xyz.min(axis=0), arrays.xyz.max(axis=0), size=(queries // 20, 3))
+        for name, op, count in [
+            ("nearest node", lambda: nodes.nearest(points), queries),
+            ("nearest segment", lambda: segments.nearest(points), queries),
+            ("nodes within 5", lambda: nodes.within(points, 5.0), queries),
+            ("nearest node (far field)", lambda: nodes.nearest(far), far.shape[0]),
+        ]:
+            dt = _time(op)
+            print(f"{rows:>9} {name:<26} {dt:>9.3f} {count / dt:>12.0f}")
+
+        sample = points[:brute_sample]
+        dt = _time(lambda: [np.linalg.norm(arrays.xyz - p, axis=1).argmin() for p in sample])
+        print(f"{rows:>9} {'brute-force nearest node':<26} {dt:>9.3f} {brute_sample / dt:>12.0f}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,96 @@
+"""Instanced sphere meshing for large point sets.
+
+Times `PointSet.from_array` with one radius and with per-point radii and
+`PointSet.scaled` (float32 vertices, so a 1M-marker set and its scaled copy
+fit in memory), and the list-returning `batch_spheres`. A per-point scalar
+construction (the former `batch_spheres` loop) is timed on a sample of 2000
+points and extrapolated as the baseline.
+
+Run from the repository root:
+
+    python benchmarks/bench_spheres.py [points ...]
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from swcviz import PointSet  # noqa: E402
+from swcviz.geometry import batch_spheres  # noqa: E402
+
+_SAMPLE = 2000
+
+
+def _scalar_spheres(
+    points: list[tuple[float, float, float]], radius: float, stacks: int = 6, slices: int = 12
+) -> int:
+    """Per-sphere trig and Python face re-indexing as in the original engine."""
+    all_vertices: list[tuple[float, float, float]] = []
+    all_faces: list[tuple[int, int, int]] = []
+    for cx, cy, cz in points:
+        verts = []
+        for i in range(1, stacks):
+            theta = math.pi * (i / stacks)
+            st, ct = math.sin(theta), math.cos(theta)
+            for j in range(slices):
+                phi = 2.0 * math.pi * (j / slices)
+                x = cx + radius * st * math.cos(phi)
+                y = cy + radius * st * math.sin(phi)
+                verts.append((x, y, cz + radius * ct))
+        north, south = len(verts), len(verts) + 1
+        verts += [(cx, cy, cz + radius), (cx, cy, cz - radius)]
+        faces = []
+        for i in range(stacks - 2):
+            for j in range(slices):
+                a, b = i * slices + j, i * slices + (j + 1) % slices
+                faces += [(a, a + slices, b + slices), (a, b + slices, b)]
+        base = (stacks - 2) * slices
+        for j in range(slices):
+            faces += [(north, j, (j + 1) % slices), (south, base + (j + 1) % slices, base + j)]
+        offset = len(all_vertices)
+        all_vertices.extend(verts)
+        all_faces.extend([(a + offset, b + offset, c + offset) for (a, b, c) in faces])
+    return len(all_vertices)
+
+
+def _time(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main(sizes: list[int]) -> None:
+    rng = np.random.default_rng(0)
+    print(
+        f"{'points':>9} {'from_array [s]':>15} {'radii [s]':>10} {'scaled [s]':>11}"
+        f" {'lists [s]':>10} {'scalar est. [s]':>16}"
+    )
+    for size in sizes:
+        xyz = rng.uniform(-500, 500, size=(size, 3))
+        radii = rng.uniform(0.5, 2.0, size=size)
+        t_array = _time(lambda: PointSet.from_array(xyz, dtype=np.float32))
+        t0 = time.perf_counter()
+        ps = PointSet.from_array(xyz, radii=radii, dtype=np.float32)
+        t_radii = time.perf_counter() - t0
+        t_scaled = _time(lambda: ps.scaled(2.0))
+        del ps
+        t_lists = float("nan")
+        if size <= 100_000:
+            t_lists = _time(lambda: batch_spheres(xyz.tolist()))
+        sample = [tuple(p) for p in xyz[:_SAMPLE].tolist()]
+        t_scalar = _time(lambda: _scalar_spheres(sample, 1.0)) * size / len(sample)
+        print(
+            f"{size:>9} {t_array:>15.3f} {t_radii:>10.3f} {t_scaled:>11.3f}"
+            f" {t_lists:>10.3f} {t_scalar:>16.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
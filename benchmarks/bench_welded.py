@@ -0,0 +1,49 @@
+"""Welded tubes vs per-edge frusta: build time, vertex count and payload.
+
+Builds `FrustaSet.from_general_model` with and without `weld=True` on
+synthetic morphologies and reports the time, the vertex count and the
+mesh payload (vertex plus face bytes) of each.
+
+Run from the repository root:
+
+    python benchmarks/bench_welded.py [segments ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _synth import synthetic_swc  # noqa: E402
+from swcviz import FrustaSet, MorphologyArrays, parse_swc  # noqa: E402
+
+
+def _build(arrays: MorphologyArrays, sides: int, weld: bool) -> tuple[float, FrustaSet]:
+    t0 = time.perf_counter()
+    fr = FrustaSet.from_general_model(arrays, sides=sides, weld=weld)
+    return time.perf_counter() - t0, fr
+
+
+def main(sizes: list[int], sides: int = 16) -> None:
+    print(
+        f"{'segments':>9} {'frusta [s]':>11} {'welded [s]':>11} {'frusta verts':>13} {'welded verts':>13}"
+        f" {'frusta MB':>10} {'welded MB':>10}"
+    )
+    for size in sizes:
+        arrays = MorphologyArrays.from_table(parse_swc(synthetic_swc(size + 1), backend="numpy").table)
+        t_plain, plain = _build(arrays, sides, False)
+        t_weld, weld = _build(arrays, sides, True)
+        mb = [(fr.vertices.nbytes + fr.faces.nbytes) / 1e6 for fr in (plain, weld)]
+        print(
+            f"{plain.segment_count:>9} {t_plain:>11.3f} {t_weld:>11.3f}"
+            f" {len(plain.vertices):>13} {len(weld.vertices):>13}"
+            f" {mb[0]:>10.1f} {mb[1]:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000])
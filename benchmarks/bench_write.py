@@ -0,0 +1,39 @@
+"""Time `write_swc` on synthetic tables and check the round trip.
+
+Run from the repository root:
+
+    python benchmarks/bench_write.py [rows ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _synth import synthetic_swc  # noqa: E402
+from swcviz import parse_swc, write_swc  # noqa: E402
+
+
+def main(sizes: list[int]) -> None:
+    print(f"{'rows':>10} {'write [s]':>10} {'write .gz [s]':>14} {'round trip':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            result = parse_swc(synthetic_swc(rows), backend="numpy")
+            out = Path(tmp) / "out.swc"
+            t0 = time.perf_counter()
+            write_swc(result, out)
+            t_plain = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            write_swc(result, out.with_suffix(".swc.gz"))
+            t_gz = time.perf_counter() - t0
+            same = parse_swc(out, backend="numpy").table.x.tolist() == result.table.x.tolist()
+            print(f"{rows:>10} {t_plain:>10.3f} {t_gz:>14.3f} {str(same):>11}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
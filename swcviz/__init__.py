@@ -3,21 +3,91 @@
 Public API is evolving; currently exposes SWC parsing utilities and models.
 """
 
-from .io import SWCRecord, SWCParseResult, parse_swc
+from .io import (
+    SWCRecord,
+    SWCTable,
+    SWCRecordView,
+    SWCParseResult,
+    SWCChunk,
+    parse_swc,
+    aparse_swc,
+    iter_swc_chunks,
+    write_swc,
+)
+from .validate import Violation, ValidationReport, validate_table, validate_swc
+from .cache import ParseCache, CacheStats
+from .arrays import MorphologyArrays
+from .ancestors import AncestorIndex
+from .sections import SectionIndex
+from .spatial import SpatialIndex
+from .reconnect import find_reconnections, reconnection_lines, with_reconnections
 from .model import SWCModel, GeneralModel
-from .geometry import Segment, frustum_mesh, batch_frusta, FrustaSet, PointSet
+from .morphometrics import (
+    NodeMetrics,
+    SectionMetrics,
+    node_metrics,
+    section_metrics,
+    sholl,
+    node_metrics_many,
+    section_metrics_many,
+    sholl_many,
+)
+from .batch import LoadResult, load_many, iter_load_many, aload_many, aiter_load_many
+from .geometry import (
+    Segment,
+    frustum_mesh,
+    batch_frusta,
+    batch_frusta_array,
+    welded_tubes_array,
+    FrustaSet,
+    PointSet,
+)
 from .viz import plot_centroid, plot_frusta, plot_frusta_with_centroid, plot_frusta_slider, plot_model
 from .config import get_config, set_config, apply_layout
 
 __all__ = [
     "SWCRecord",
+    "SWCTable",
+    "SWCRecordView",
     "SWCParseResult",
+    "SWCChunk",
     "parse_swc",
+    "aparse_swc",
+    "iter_swc_chunks",
+    "write_swc",
+    "Violation",
+    "ValidationReport",
+    "validate_table",
+    "validate_swc",
+    "ParseCache",
+    "CacheStats",
+    "MorphologyArrays",
+    "AncestorIndex",
+    "SectionIndex",
+    "SpatialIndex",
+    "find_reconnections",
+    "reconnection_lines",
+    "with_reconnections",
     "SWCModel",
     "GeneralModel",
+    "NodeMetrics",
+    "SectionMetrics",
+    "node_metrics",
+    "section_metrics",
+    "sholl",
+    "node_metrics_many",
+    "section_metrics_many",
+    "sholl_many",
+    "LoadResult",
+    "load_many",
+    "iter_load_many",
+    "aload_many",
+    "aiter_load_many",
     "Segment",
     "frustum_mesh",
     "batch_frusta",
+    "batch_frusta_array",
+    "welded_tubes_array",
     "PointSet",
     "FrustaSet",
     "plot_centroid",
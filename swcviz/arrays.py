@@ -0,0 +1,257 @@
+"""Array-backed morphology representation.
+
+`MorphologyArrays` holds a morphology as a handful of contiguous NumPy
+arrays instead of one attribute dict per node:
+
+- ``ids``: node keys (SWC ids or merged representatives)
+- ``xyz``, ``r``, ``t``, ``line``: per-node coordinates, radius, type and
+  source line
+- ``parent``: row index of each node's parent (``-1`` for roots)
+- ``edges``: ``(E, 2)`` row indices of the graph edges
+
+Both `SWCModel` and `GeneralModel` convert to it (`model.to_arrays()`) and
+can be rebuilt from it (`SWCModel.from_arrays`, `GeneralModel.from_arrays`),
+and the geometry/visualization entry points accept it in place of a model,
+so large morphologies can be meshed and plotted without materializing a
+networkx graph. `to_networkx()` provides the graph view when needed.
+
+Example
+-------
+>>> from swcviz import parse_swc, MorphologyArrays, FrustaSet
+>>> arrays = MorphologyArrays.from_table(parse_swc("data/example.swc").table)
+>>> frusta = FrustaSet.from_general_model(arrays, sides=8)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Iterable, Tuple
+
+import networkx as nx
+import numpy as np
+
+from ._util import bfs_forest, isin_sorted
+from .io import SWCTable
+
+
+@dataclass(frozen=True, eq=False)
+class MorphologyArrays:
+    """Struct-of-arrays morphology with an id -> row index.
+
+    Attributes
+    ----------
+    ids: np.ndarray
+        int64 ``(N,)`` node keys, one per row.
+    xyz: np.ndarray
+        float64 ``(N, 3)`` coordinates.
+    r: np.ndarray
+        float64 ``(N,)`` radii.
+    t: np.ndarray
+        int32 ``(N,)`` SWC structure types.
+    parent: np.ndarray
+        int64 ``(N,)`` parent row per node, ``-1`` for roots. Directed inputs
+        use the SWC parent; undirected graphs use a breadth-first spanning
+        forest rooted at the smallest id of each component.
+    edges: np.ndarray
+        int64 ``(E, 2)`` row pairs; ``(parent, child)`` when `directed`.
+    directed: bool
+        Whether `edges` are oriented parent -> child.
+    line: np.ndarray
+        int64 ``(N,)`` source line numbers (0 when unknown).
+    """
+
+    ids: np.ndarray
+    xyz: np.ndarray
+    r: np.ndarray
+    t: np.ndarray
+    parent: np.ndarray
+    edges: np.ndarray
+    directed: bool = True
+    line: np.ndarray = None  # type: ignore[assignment]
+    _order: np.ndarray = field(init=False, repr=False)
+    _sorted_ids: np.ndarray = field(init=False, repr=False)
+    _sections: Any = field(init=False, repr=False, default=None)
+
+    def __post_init__(self) -> None:
+        ids = np.ascontiguousarray(self.ids, dtype=np.int64).reshape(-1)
+        size = ids.size
+        line = np.zeros(size, dtype=np.int64) if self.line is None else self.line
+        columns = {
+            "ids": ids,
+            "xyz": np.ascontiguousarray(self.xyz, dtype=np.float64).reshape(-1, 3),
+            "r": np.ascontiguousarray(self.r, dtype=np.float64).reshape(-1),
+            "t": np.ascontiguousarray(self.t, dtype=np.int32).reshape(-1),
+            "parent": np.ascontiguousarray(self.parent, dtype=np.int64).reshape(-1),
+            "line": np.ascontiguousarray(line, dtype=np.int64).reshape(-1),
+        }
+        for name, col in columns.items():
+            if col.shape[0] != size:
+                raise ValueError(
+                    f"MorphologyArrays column '{name}' has {col.shape[0]} rows, expected {size}"
+                )
+            object.__setattr__(self, name, col)
+        edges = np.ascontiguousarray(self.edges, dtype=np.int64).reshape(-1, 2)
+        if edges.size and (edges.min() < 0 or edges.max() >= size):
+            raise ValueError("MorphologyArrays edges must index rows in [0, N)")
+        object.__setattr__(self, "edges", edges)
+        object.__setattr__(self, "directed", bool(self.directed))
+        order = np.argsort(ids, kind="stable")
+        object.__setattr__(self, "_order", order)
+        object.__setattr__(self, "_sorted_ids", ids[order])
+
+    # ---- Construction --------------------------------------------------------------------------
+
+    @classmethod
+    def from_table(cls, table: SWCTable) -> "MorphologyArrays":
+        """Directed arrays from SWC rows (edges parent -> child, in row order).
+
+        Parent ids that are not defined in the table (only possible with
+        ``strict=False``) are treated as roots.
+        """
+        known = (table.parent != -1) & table.contains(table.parent)
+        parent = np.full(len(table), -1, dtype=np.int64)
+        parent[known] = table.rows_of(table.parent[known])
+        children = np.flatnonzero(known)
+        return cls(
+            ids=table.n,
+            xyz=np.column_stack([table.x, table.y, table.z]),
+            r=table.r,
+            t=table.t,
+            parent=parent,
+            edges=np.column_stack([parent[children], children]),
+            directed=True,
+            line=table.line,
+        )
+
+    @classmethod
+    def from_graph(cls, G: nx.Graph) -> "MorphologyArrays":
+        """Gather node attributes ``x, y, z, r`` (and ``t``, ``line``) of a graph.
+
+        Rows follow ``G.nodes`` order and edges follow ``G.edges`` order. Nodes
+        without ``line`` use the first entry of ``lines`` (GeneralModel
+        provenance) or 0.
+        """
+        keys = list(G.nodes)
+        nodes = G.nodes
+        attrs = [nodes[n] for n in keys]
+        xyz = np.array([(a["x"], a["y"], a["z"]) for a in attrs], dtype=np.float64)
+        r = np.array([a["r"] for a in attrs], dtype=np.float64)
+        t = np.array([a.get("t", 0) for a in attrs], dtype=np.int32)
+        line = np.array(
+            [a["line"] if "line" in a else (a["lines"][0] if a.get("lines") else 0) for a in attrs],
+            dtype=np.int64,
+        )
+        ids = np.asarray(keys, dtype=np.int64)
+        order = np.argsort(ids, kind="stable")
+        sorted_ids = ids[order]
+
+        def rows(values: np.ndarray) -> np.ndarray:
+            return order[np.searchsorted(sorted_ids, values)]
+
+        edge_ids = np.asarray(list(G.edges()), dtype=np.int64).reshape(-1, 2)
+        edges = rows(edge_ids) if edge_ids.size else edge_ids
+        parent = np.full(ids.size, -1, dtype=np.int64)
+        directed = G.is_directed()
+        if directed:
+            parent[edges[:, 1]] = edges[:, 0]
+        else:
+            _, parent_of = bfs_forest(G._adj, keys)
+            child = np.asarray([n for n in keys if parent_of[n] != -1], dtype=np.int64)
+            if child.size:
+                parent[rows(child)] = rows(np.asarray([parent_of[n] for n in child.tolist()]))
+        return cls(
+            ids=ids, xyz=xyz, r=r, t=t, parent=parent, edges=edges, directed=directed, line=line
+        )
+
+    @classmethod
+    def coerce(cls, obj: Any) -> "MorphologyArrays":
+        """Return `obj` as `MorphologyArrays` (model, networkx graph or arrays)."""
+        if isinstance(obj, MorphologyArrays):
+            return obj
+        if hasattr(obj, "to_arrays"):
+            return obj.to_arrays()
+        if isinstance(obj, nx.Graph):
+            return cls.from_graph(obj)
+        raise TypeError(
+            f"Expected MorphologyArrays, a model or a networkx graph, got {type(obj).__name__}"
+        )
+
+    # ---- Views ---------------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return int(self.ids.size)
+
+    def __repr__(self) -> str:
+        kind = "directed" if self.directed else "undirected"
+        return f"MorphologyArrays(nodes={len(self)}, edges={self.edge_count}, {kind})"
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.xyz[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.xyz[:, 1]
+
+    @property
+    def z(self) -> np.ndarray:
+        return self.xyz[:, 2]
+
+    @property
+    def edge_count(self) -> int:
+        return int(self.edges.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes held by the arrays and the id index."""
+        return sum(
+            getattr(self, name).nbytes
+            for name in ("ids", "xyz", "r", "t", "parent", "edges", "line", "_order", "_sorted_ids")
+        )
+
+    def rows_of(self, ids: Iterable[int] | np.ndarray) -> np.ndarray:
+        """Return row indices for node ids (KeyError if any is absent)."""
+        ids = np.asarray(ids, dtype=np.int64)
+        found = isin_sorted(ids, self._sorted_ids)
+        if not found.all():
+            raise KeyError(int(ids[~found].reshape(-1)[0]))
+        return self._order[np.searchsorted(self._sorted_ids, ids)]
+
+    def edge_ids(self) -> np.ndarray:
+        """``(E, 2)`` edges as node ids instead of rows."""
+        return self.ids[self.edges]
+
+    def degree(self) -> np.ndarray:
+        """Undirected degree per row (self-loops count twice, as in networkx)."""
+        return np.bincount(self.edges.ravel(), minlength=len(self)).astype(np.int64)
+
+    def sections(self) -> Any:
+        """Return the `SectionIndex` of `parent`, computed once per instance."""
+        if self._sections is None:
+            from .sections import SectionIndex
+
+            object.__setattr__(self, "_sections", SectionIndex.from_arrays(self))
+        return self._sections
+
+    def to_networkx(self) -> nx.Graph:
+        """Materialize a plain ``DiGraph``/``Graph`` with ``t, x, y, z, r, line`` node attributes."""
+        G: nx.Graph = nx.DiGraph() if self.directed else nx.Graph()
+        G.add_nodes_from(self._node_items())
+        G.add_edges_from(self.edge_ids().tolist())
+        return G
+
+    def _node_items(self) -> Iterable[Tuple[Hashable, Dict[str, Any]]]:
+        """(id, attribute dict) pairs in row order, for bulk graph insertion."""
+        return (
+            (n, {"t": t, "x": x, "y": y, "z": z, "r": r, "line": line})
+            for n, t, (x, y, z), r, line in zip(
+                self.ids.tolist(),
+                self.t.tolist(),
+                self.xyz.tolist(),
+                self.r.tolist(),
+                self.line.tolist(),
+            )
+        )
+
+
+__all__ = ["MorphologyArrays"]
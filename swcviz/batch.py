@@ -0,0 +1,304 @@
+"""Loading many SWC files at once.
+
+`load_many` fans parsing out over a process pool. Workers run the bulk
+NumPy parser and send back `SWCParseResult` objects, whose `SWCTable`
+columns pickle as flat array buffers (no per-record objects cross the
+process boundary). Graph models are then assembled in the parent.
+
+Per-file failures are captured in the returned `LoadResult` instead of
+aborting the batch.
+
+`aload_many` / `aiter_load_many` are the asyncio counterparts: they bound
+the number of files in flight with a semaphore and run parsing in an
+executor, so an event loop can serve many concurrent loads without
+stalling.
+
+Example
+-------
+>>> from pathlib import Path
+>>> from swcviz import load_many
+>>> results = load_many(sorted(Path("data/swc").glob("*.swc")), workers=4)
+>>> [r.source for r in results if not r.ok]
+[]
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Optional, Union
+import asyncio
+import os
+
+from .io import SWCParseResult, parse_swc
+from .cache import ParseCache
+from .model import SWCModel, GeneralModel
+
+
+_MODELS = ("general", "swc", "raw")
+
+
+@dataclass(frozen=True)
+class LoadResult:
+    """Outcome of loading one file in a batch.
+
+    Attributes
+    ----------
+    index: int
+        Position of the file in the input sequence.
+    source: str
+        The path as given (converted with `os.fspath`).
+    value: Any
+        `GeneralModel`, `SWCModel` or `SWCParseResult` depending on `model`;
+        None if loading failed.
+    error: BaseException | None
+        The exception raised while parsing or building, if any.
+    """
+
+    index: int
+    source: str
+    value: Any
+    error: Optional[BaseException]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> Any:
+        """Return `value`, re-raising the captured error if loading failed."""
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def iter_load_many(
+    paths: Iterable[Union[str, os.PathLike]],
+    *,
+    workers: Optional[int] = None,
+    model: str = "general",
+    strict: bool = True,
+    validate_reconnections: bool = True,
+    float_tol: float = 1e-9,
+    cache: Optional[ParseCache] = None,
+    executor: Optional[Executor] = None,
+) -> Iterator[LoadResult]:
+    """Load SWC files in parallel, yielding results as they complete.
+
+    Parameters
+    ----------
+    paths
+        SWC file paths.
+    workers
+        Number of worker processes (default: `os.cpu_count()`). With
+        `workers <= 1` files are loaded serially in the calling process.
+    model
+        ``"general"`` (`GeneralModel`), ``"swc"`` (`SWCModel`) or ``"raw"``
+        (`SWCParseResult`).
+    strict, validate_reconnections, float_tol
+        Forwarded to `parse_swc` and the model builders.
+    cache
+        Optional `ParseCache` used by the workers. Hit/miss counters are
+        tracked per process, so the parent's `cache.stats()` only reflects
+        serial loads.
+    executor
+        Use this executor instead of creating a process pool.
+    """
+    if model not in _MODELS:
+        raise ValueError(f"Unknown model {model!r}; expected one of {_MODELS}")
+    sources = [os.fspath(p) for p in paths]
+    options = {
+        "strict": strict,
+        "validate_reconnections": validate_reconnections,
+        "float_tol": float_tol,
+    }
+
+    if executor is None and (workers if workers is not None else os.cpu_count() or 1) <= 1:
+        for index, source in enumerate(sources):
+            try:
+                result = _parse_one(source, options, cache)
+            except Exception as e:  # noqa: BLE001
+                yield LoadResult(index=index, source=source, value=None, error=e)
+            else:
+                yield _finish(index, source, result, model, options)
+        return
+
+    own_pool = executor is None
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = {
+            pool.submit(_parse_one, source, options, cache): index
+            for index, source in enumerate(sources)
+        }
+        for fut in as_completed(futures):
+            index = futures[fut]
+            error = fut.exception()
+            if error is not None:
+                yield LoadResult(index=index, source=sources[index], value=None, error=error)
+            else:
+                yield _finish(index, sources[index], fut.result(), model, options)
+    finally:
+        if own_pool:
+            pool.shutdown(cancel_futures=True)
+
+
+def load_many(
+    paths: Iterable[Union[str, os.PathLike]],
+    *,
+    workers: Optional[int] = None,
+    model: str = "general",
+    strict: bool = True,
+    validate_reconnections: bool = True,
+    float_tol: float = 1e-9,
+    cache: Optional[ParseCache] = None,
+    executor: Optional[Executor] = None,
+) -> List[LoadResult]:
+    """Load SWC files in parallel and return results in input order.
+
+    See `iter_load_many` for the parameters; use it directly to consume
+    results as they complete.
+    """
+    results = list(
+        iter_load_many(
+            paths,
+            workers=workers,
+            model=model,
+            strict=strict,
+            validate_reconnections=validate_reconnections,
+            float_tol=float_tol,
+            cache=cache,
+            executor=executor,
+        )
+    )
+    results.sort(key=lambda r: r.index)
+    return results
+
+
+async def aiter_load_many(
+    paths: Iterable[Union[str, os.PathLike]],
+    *,
+    limit: int = 8,
+    model: str = "general",
+    strict: bool = True,
+    validate_reconnections: bool = True,
+    float_tol: float = 1e-9,
+    cache: Optional[ParseCache] = None,
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[LoadResult]:
+    """Load SWC files without blocking the event loop, yielding as they complete.
+
+    Parameters
+    ----------
+    paths
+        SWC file paths.
+    limit
+        Maximum number of files being read/parsed at the same time.
+    executor
+        Executor for reading and parsing (default: the loop's thread pool,
+        which overlaps file reads; a ``ProcessPoolExecutor`` also parallelizes
+        the parsing). Models are built in the loop's default thread pool.
+    model, strict, validate_reconnections, float_tol, cache
+        As in `iter_load_many`.
+    """
+    if model not in _MODELS:
+        raise ValueError(f"Unknown model {model!r}; expected one of {_MODELS}")
+    if limit < 1:
+        raise ValueError(f"limit must be >= 1, got {limit}")
+    sources = [os.fspath(p) for p in paths]
+    options = {
+        "strict": strict,
+        "validate_reconnections": validate_reconnections,
+        "float_tol": float_tol,
+    }
+    loop = asyncio.get_running_loop()
+    gate = asyncio.Semaphore(limit)
+
+    async def load(index: int, source: str) -> LoadResult:
+        async with gate:
+            try:
+                result = await loop.run_in_executor(executor, _parse_one, source, options, cache)
+            except Exception as e:  # noqa: BLE001
+                return LoadResult(index=index, source=source, value=None, error=e)
+            return await loop.run_in_executor(
+                None, _finish, index, source, result, model, options
+            )
+
+    tasks = [asyncio.ensure_future(load(i, source)) for i, source in enumerate(sources)]
+    try:
+        for fut in asyncio.as_completed(tasks):
+            yield await fut
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def aload_many(
+    paths: Iterable[Union[str, os.PathLike]],
+    *,
+    limit: int = 8,
+    model: str = "general",
+    strict: bool = True,
+    validate_reconnections: bool = True,
+    float_tol: float = 1e-9,
+    cache: Optional[ParseCache] = None,
+    executor: Optional[Executor] = None,
+) -> List[LoadResult]:
+    """Asynchronous `load_many`: results in input order.
+
+    See `aiter_load_many` for the parameters.
+
+    Example
+    -------
+    >>> results = await aload_many(paths, limit=16)  # doctest: +SKIP
+    """
+    results = [
+        r
+        async for r in aiter_load_many(
+            paths,
+            limit=limit,
+            model=model,
+            strict=strict,
+            validate_reconnections=validate_reconnections,
+            float_tol=float_tol,
+            cache=cache,
+            executor=executor,
+        )
+    ]
+    results.sort(key=lambda r: r.index)
+    return results
+
+
+# ----------------------------------------------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------------------------------------------
+def _parse_one(source: str, options: dict, cache: Optional[ParseCache]) -> SWCParseResult:
+    """Worker entry point: parse one file into columns.
+
+    Sources are always paths here; `parse_swc` would read a missing one as
+    SWC text.
+    """
+    if not os.path.exists(source):
+        raise FileNotFoundError(f"Path does not exist: {source}")
+    return parse_swc(source, backend="numpy", cache=cache, **options)
+
+
+def _finish(
+    index: int, source: str, result: SWCParseResult, model: str, options: dict
+) -> LoadResult:
+    """Build the requested model in the parent, capturing any error."""
+    try:
+        if model == "raw":
+            value: Any = result
+        elif model == "swc":
+            value = SWCModel.from_parse_result(result)
+        else:
+            value = GeneralModel.from_parse_result(
+                result,
+                validate_reconnections=options["validate_reconnections"],
+                float_tol=options["float_tol"],
+            )
+    except Exception as e:  # noqa: BLE001
+        return LoadResult(index=index, source=source, value=None, error=e)
+    return LoadResult(index=index, source=source, value=value, error=None)
+
+
+__all__ = ["LoadResult", "load_many", "iter_load_many", "aload_many", "aiter_load_many"]
@@ -0,0 +1,285 @@
+"""On-disk cache of parsed SWC files.
+
+`ParseCache` stores the columns of an `SWCTable`, the reconnection pairs and
+the header comments of each parsed file as `.npy` sidecars in a cache
+directory, and reloads them via memory mapping instead of re-parsing text.
+
+Entries are keyed by the absolute source path and the parse options. Each
+entry records the source size, modification time and a BLAKE2 content hash:
+a matching size/mtime is a hit without reading the source; a changed mtime
+with identical content (e.g. after `touch` or a copy) is still a hit; any
+other change invalidates the entry and the file is parsed again.
+
+Example
+-------
+>>> from swcviz import ParseCache, GeneralModel
+>>> cache = ParseCache("~/.cache/swcviz", max_bytes=2 << 30)
+>>> gm = GeneralModel.from_swc_file("data/swc/TS2_s10.swc", cache=cache)
+>>> cache.stats()
+CacheStats(hits=0, misses=1, bytes_saved=0, evictions=0)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import List, Optional, Tuple, Union
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+
+from ._util import META_FILE, read_arrays, read_meta, write_arrays, write_meta
+from .io import SWCParseResult, SWCTable, parse_swc
+
+
+_COLUMNS = ("n", "t", "x", "y", "z", "r", "parent", "line")
+_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters for a `ParseCache`.
+
+    Attributes
+    ----------
+    hits, misses: int
+        Lookups served from the cache / parsed from text.
+    bytes_saved: int
+        Total size of the source files served from the cache, i.e. text that
+        did not have to be parsed again.
+    evictions: int
+        Entries removed to stay under `max_bytes`.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+    evictions: int = 0
+
+
+class ParseCache:
+    """Opt-in binary cache around `parse_swc` for files on disk.
+
+    Parameters
+    ----------
+    cache_dir
+        Directory holding the entries; created on demand. Defaults to
+        ``$XDG_CACHE_HOME/swcviz/parse`` (``~/.cache/swcviz/parse``).
+    max_bytes
+        Upper bound on the total size of the cache. Least recently used
+        entries are evicted after each store. ``None`` disables eviction.
+    mmap
+        If True, cached columns are loaded with ``np.load(mmap_mode="r")``.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, os.PathLike, None] = None,
+        *,
+        max_bytes: Optional[int] = 1 << 30,
+        mmap: bool = True,
+    ) -> None:
+        if cache_dir is None:
+            base = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+            cache_dir = os.path.join(base, "swcviz", "parse")
+        self.cache_dir = os.path.abspath(os.path.expanduser(os.fspath(cache_dir)))
+        self.max_bytes = max_bytes
+        self.mmap = mmap
+        self._stats = CacheStats()
+
+    # ------------------------------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------------------------------
+    def parse(
+        self,
+        source: Union[str, os.PathLike],
+        *,
+        strict: bool = True,
+        validate_reconnections: bool = True,
+        float_tol: float = 1e-9,
+        backend: str = "numpy",
+    ) -> SWCParseResult:
+        """Return the parse result for an SWC file, from the cache when valid.
+
+        Sources that are not existing file paths (content strings, file-like
+        objects, iterables) are parsed directly and bypass the cache.
+        """
+        options = {
+            "strict": bool(strict),
+            "validate_reconnections": bool(validate_reconnections),
+            "float_tol": float(float_tol),
+        }
+        path = _existing_path(source)
+        if path is None:
+            return parse_swc(source, backend=backend, **options)  # type: ignore[arg-type]
+
+        st = os.stat(path)
+        entry = os.path.join(self.cache_dir, _entry_key(path, options))
+        meta = _read_meta(entry)
+        if meta is not None:
+            fresh = meta["size"] == st.st_size and meta["mtime_ns"] == st.st_mtime_ns
+            if not fresh and meta["size"] == st.st_size:
+                fresh = meta["digest"] == _file_digest(path)
+                if fresh:
+                    meta["mtime_ns"] = st.st_mtime_ns
+                    try:
+                        write_meta(entry, meta)
+                    except OSError:
+                        pass  # served anyway; the digest is checked again next time
+            if fresh:
+                try:
+                    result = self._load(entry, meta)
+                except (OSError, ValueError):
+                    result = None
+                if result is not None:
+                    try:
+                        os.utime(os.path.join(entry, META_FILE))  # LRU bookkeeping
+                    except OSError:
+                        pass
+                    self._stats = replace(
+                        self._stats,
+                        hits=self._stats.hits + 1,
+                        bytes_saved=self._stats.bytes_saved + st.st_size,
+                    )
+                    return result
+
+        result = parse_swc(path, backend=backend, **options)  # type: ignore[arg-type]
+        self._stats = replace(self._stats, misses=self._stats.misses + 1)
+        # Caching is best effort: an unwritable or full cache directory must
+        # not fail a parse that succeeded
+        try:
+            self._store(entry, path, st, options, result)
+        except OSError:
+            return result
+        if self.max_bytes is not None:
+            self.evict(self.max_bytes)
+        return result
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the hit/miss counters."""
+        return self._stats
+
+    def reset_stats(self) -> None:
+        self._stats = CacheStats()
+
+    def size_bytes(self) -> int:
+        """Total on-disk size of all entries."""
+        return sum(size for _, _, size in self._entries())
+
+    def evict(self, max_bytes: int) -> int:
+        """Remove least recently used entries until the cache fits `max_bytes`.
+
+        Returns the number of entries removed.
+        """
+        entries = sorted(self._entries(), key=lambda e: e[1])
+        total = sum(size for _, _, size in entries)
+        removed = 0
+        for entry, _, size in entries:
+            if total <= max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            removed += 1
+        if removed:
+            self._stats = replace(self._stats, evictions=self._stats.evictions + removed)
+        return removed
+
+    def clear(self) -> None:
+        """Delete every entry in the cache directory."""
+        for entry, _, _ in self._entries():
+            shutil.rmtree(entry, ignore_errors=True)
+
+    def __repr__(self) -> str:
+        return f"ParseCache(cache_dir={self.cache_dir!r}, max_bytes={self.max_bytes})"
+
+    # ------------------------------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------------------------------
+    def _load(self, entry: str, meta: dict) -> SWCParseResult:
+        arrays = read_arrays(entry, _COLUMNS + ("reconnections",), mmap=self.mmap)
+        table = SWCTable(**{name: arrays[name] for name in _COLUMNS})
+        pairs = [(int(a), int(b)) for a, b in np.asarray(arrays["reconnections"]).tolist()]
+        return SWCParseResult(table=table, reconnections=pairs, comments=list(meta["comments"]))
+
+    def _store(
+        self,
+        entry: str,
+        path: str,
+        st: os.stat_result,
+        options: dict,
+        result: SWCParseResult,
+    ) -> None:
+        arrays = {name: getattr(result.table, name) for name in _COLUMNS}
+        arrays["reconnections"] = np.asarray(result.reconnections, dtype=np.int64).reshape(-1, 2)
+        meta = {
+            "version": _FORMAT_VERSION,
+            "source": path,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "digest": _file_digest(path),
+            "options": options,
+            "comments": result.comments,
+        }
+        os.makedirs(self.cache_dir, exist_ok=True)
+        write_arrays(entry, arrays, meta)
+
+    def _entries(self) -> List[Tuple[str, float, int]]:
+        """List (entry dir, last access time, size in bytes) for all entries."""
+        out: List[Tuple[str, float, int]] = []
+        if not os.path.isdir(self.cache_dir):
+            return out
+        for name in os.listdir(self.cache_dir):
+            entry = os.path.join(self.cache_dir, name)
+            meta_path = os.path.join(entry, META_FILE)
+            if name.startswith(".") or not os.path.isfile(meta_path):
+                continue
+            try:
+                size = sum(
+                    os.path.getsize(os.path.join(entry, f)) for f in os.listdir(entry)
+                )
+                out.append((entry, os.path.getmtime(meta_path), size))
+            except OSError:
+                continue
+        return out
+
+
+# ----------------------------------------------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------------------------------------------
+def _existing_path(source: object) -> Optional[str]:
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if isinstance(path, str) and os.path.isfile(path):
+            return os.path.abspath(path)
+    return None
+
+
+def _entry_key(path: str, options: dict) -> str:
+    blob = json.dumps([path, options], sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+
+def _file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _read_meta(entry: str) -> Optional[dict]:
+    try:
+        meta = read_meta(entry)
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != _FORMAT_VERSION:
+        return None
+    return meta
+
+
+__all__ = ["ParseCache", "CacheStats"]
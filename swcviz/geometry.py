@@ -3,20 +3,33 @@
 - Segment: oriented frustum defined by two points with radii
 - frustum_mesh: build vertices/faces for a single frustum
 - batch_frusta: combine multiple frusta into one mesh
-
-Implementation is pure-Python (standard library math), returning lists
-of vertices and triangular faces suitable for Plotly Mesh3d or other
-renderers after light conversion.
+- batch_frusta_array: the same for (N, 3) end point / (N,) radius arrays
+- welded_tubes_array: tubes sharing one ring per node along sections
+
+`batch_frusta_array` builds the frusta of all segments at once with NumPy:
+one orthonormal frame per segment, a shared cos/sin table for the rings and
+a single face template shifted by each segment's vertex offset. The list
+functions (`frustum_mesh`, `batch_frusta`) wrap it and return lists of
+vertex and face tuples with the same layout. Sphere batches for large
+point sets (`batch_spheres_array`, `PointSet.from_array`) are built the
+same way.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Tuple, Any, Optional, Union
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Sequence, Tuple, Any, Optional, Union
 import os
 import io
 import math
 
+import numpy as np
+
+from .arrays import MorphologyArrays
+from .sections import SectionIndex
+from .spatial import SpatialIndex
+from ._util import open_text
+
 # Types
 Point3 = Tuple[float, float, float]
 Vec3 = Tuple[float, float, float]
@@ -104,40 +117,63 @@ class Segment:
 # --------------------------------------------------------------------------------------
 
 
-def _orthonormal_frame(z_axis: Vec3) -> Tuple[Vec3, Vec3, Vec3]:
-    """Return (U, V, W) forming a right-handed orthonormal basis with W along z_axis.
+def _cross(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row-wise cross product, term for term like `v_cross`."""
+    return np.stack(
+        [
+            a[..., 1] * b[..., 2] - a[..., 2] * b[..., 1],
+            a[..., 2] * b[..., 0] - a[..., 0] * b[..., 2],
+            a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0],
+        ],
+        axis=-1,
+    )
+
 
-    Handles near-colinearity by choosing a stable temporary axis.
+def _unit(a: np.ndarray, eps: float = 1e-12) -> np.ndarray:
+    """Row-wise `v_unit`: zero rows (norm below `eps`) stay zero."""
+    n = np.sqrt(a[:, 0] * a[:, 0] + a[:, 1] * a[:, 1] + a[:, 2] * a[:, 2])
+    small = n < eps
+    return np.where(small[:, None], 0.0, a / np.where(small, 1.0, n)[:, None])
+
+
+def _frames(axes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Right-handed orthonormal frames ``(U, V, W)`` with ``W`` along each axis.
+
+    ``(N, 3)`` in, three ``(N, 3)`` arrays out. Zero axes use ``W = +z``; the
+    helper axis is ``x`` unless ``|W_x| > 0.9`` (then ``y``), with ``y`` as a
+    fallback if the cross product degenerates.
     """
-    W = v_unit(z_axis)
-    # Fallback if zero vector
-    if W == (0.0, 0.0, 0.0):
-        W = (0.0, 0.0, 1.0)
-
-    # Pick a vector not parallel to W
-    abs_w = tuple(abs(c) for c in W)
-    tmp = (1.0, 0.0, 0.0) if abs_w[0] <= 0.9 else (0.0, 1.0, 0.0)
-    U = v_cross(tmp, W)
-    U = v_unit(U)
-    # If still degenerate (happens when tmp ~ W), switch tmp
-    if U == (0.0, 0.0, 0.0):
-        tmp = (0.0, 1.0, 0.0)
-        U = v_unit(v_cross(tmp, W))
-    V = v_cross(W, U)
-    return U, V, W
-
-
-def _circle_ring(
-    center: Point3, radius: float, U: Vec3, V: Vec3, sides: int
-) -> List[Point3]:
-    pts: List[Point3] = []
-    for k in range(sides):
-        theta = 2.0 * math.pi * (k / sides)
-        c = math.cos(theta)
-        s = math.sin(theta)
-        offset = v_add(v_mul(U, radius * c), v_mul(V, radius * s))
-        pts.append(v_add(center, offset))
-    return pts
+    W = _unit(axes)
+    W[~W.any(axis=1)] = (0.0, 0.0, 1.0)
+    tmp = np.where((np.abs(W[:, 0]) <= 0.9)[:, None], (1.0, 0.0, 0.0), (0.0, 1.0, 0.0))
+    U = _unit(_cross(tmp, W))
+    bad = ~U.any(axis=1)
+    if bad.any():
+        U[bad] = _unit(_cross(np.array([[0.0, 1.0, 0.0]]), W[bad]))
+    return U, _cross(W, U), W
+
+
+def _ring_table(sides: int) -> Tuple[np.ndarray, np.ndarray]:
+    """cos/sin of the ``sides`` ring angles ``2 pi k / sides``."""
+    theta = 2.0 * math.pi * (np.arange(sides) / sides)
+    return np.cos(theta), np.sin(theta)
+
+
+def _ring_offsets(
+    radii: np.ndarray, U: np.ndarray, V: np.ndarray, cos: np.ndarray, sin: np.ndarray
+) -> np.ndarray:
+    """``(N, sides, 3)`` radial ring offsets ``U * (r cos) + V * (r sin)``."""
+    rc = (radii[:, None] * cos)[:, :, None]
+    rs = (radii[:, None] * sin)[:, :, None]
+    return U[:, None, :] * rc + V[:, None, :] * rs
+
+
+def _side_faces(sides: int) -> np.ndarray:
+    """``(2 * sides, 3)`` side triangles of one frustum (ring a, then ring b)."""
+    i = np.arange(sides)
+    a0, a1 = i, (i + 1) % sides
+    b0, b1 = a0 + sides, a1 + sides
+    return np.stack([np.stack([a0, b0, b1], -1), np.stack([a0, b1, a1], -1)], axis=1).reshape(-1, 3)
 
 
 # --------------------------------------------------------------------------------------
@@ -150,52 +186,17 @@ def frustum_mesh(
 ) -> Tuple[List[Point3], List[Face]]:
     """Generate a frustum mesh for a single `Segment`.
 
+    Vertices are ring ``a``, ring ``b`` (``sides`` each), then the cap
+    centers; faces are the side quads as two triangles each, then the caps
+    (only for ends with a positive radius).
+
     Returns
     -------
     (vertices, faces):
         - vertices: List[Point3]
         - faces: List[Face], each = (i, j, k) indexing into `vertices`
     """
-    # Local frame
-    U, V, W = _orthonormal_frame(seg.vector())
-
-    ring_a = _circle_ring(seg.a, seg.ra, U, V, sides)
-    ring_b = _circle_ring(seg.b, seg.rb, U, V, sides)
-
-    vertices: List[Point3] = []
-    vertices.extend(ring_a)
-    vertices.extend(ring_b)
-
-    faces: List[Face] = []
-
-    # Side faces (two triangles per quad)
-    for i in range(sides):
-        a0 = i
-        a1 = (i + 1) % sides
-        b0 = i + sides
-        b1 = ((i + 1) % sides) + sides
-        faces.append((a0, b0, b1))
-        faces.append((a0, b1, a1))
-
-    # Optional end caps
-    if end_caps and seg.ra > 0.0:
-        ca = len(vertices)
-        vertices.append(seg.a)
-        for i in range(sides):
-            a0 = i
-            a1 = (i + 1) % sides
-            # Wind towards center for cap
-            faces.append((ca, a1, a0))
-
-    if end_caps and seg.rb > 0.0:
-        cb = len(vertices)
-        vertices.append(seg.b)
-        for i in range(sides):
-            b0 = i + sides
-            b1 = ((i + 1) % sides) + sides
-            faces.append((cb, b0, b1))
-
-    return vertices, faces
+    return batch_frusta([seg], sides=sides, end_caps=end_caps)
 
 
 def batch_frusta(
@@ -203,20 +204,270 @@ def batch_frusta(
 ) -> Tuple[List[Point3], List[Face]]:
     """Batch multiple frusta into a single mesh.
 
-    Returns a concatenated list of `vertices` and `faces` with the proper index offsets.
+    Returns a concatenated list of `vertices` and `faces` with the proper index
+    offsets; see `batch_frusta_array` for the array version.
+    """
+    verts, faces = batch_frusta_array(*_segment_arrays(segments), sides=sides, end_caps=end_caps)
+    return _as_lists(verts, faces)
+
+
+def _segment_arrays(segments: Iterable[Segment]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """End points ``(N, 3)`` and radii ``(N,)`` of `Segment` objects."""
+    segments = list(segments)
+    return (
+        np.array([s.a for s in segments], dtype=np.float64).reshape(-1, 3),
+        np.array([s.b for s in segments], dtype=np.float64).reshape(-1, 3),
+        np.array([s.ra for s in segments], dtype=np.float64),
+        np.array([s.rb for s in segments], dtype=np.float64),
+    )
+
+
+def _as_lists(verts: np.ndarray, faces: np.ndarray) -> Tuple[List[Point3], List[Face]]:
+    """Array mesh as lists of vertex and face tuples (built column-wise by `zip`)."""
+    return list(zip(*(c.tolist() for c in verts.T))), list(zip(*(c.tolist() for c in faces.T)))
+
+
+def batch_frusta_array(
+    a: np.ndarray,
+    b: np.ndarray,
+    ra: np.ndarray,
+    rb: np.ndarray,
+    *,
+    sides: int = 16,
+    end_caps: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Array counterpart of `batch_frusta` for ``N`` segments.
+
+    Parameters
+    ----------
+    a, b
+        ``(N, 3)`` segment end points.
+    ra, rb
+        ``(N,)`` radii at `a` and `b`.
+
+    Returns
+    -------
+    (vertices, faces)
+        ``(V, 3)`` float64 vertices and ``(F, 3)`` int64 faces, laid out
+        segment by segment exactly like `batch_frusta` (same topology and
+        vertex order).
+    """
+    verts, faces, _ = _frusta_arrays(a, b, ra, rb, sides=sides, end_caps=end_caps)
+    return verts, faces
+
+
+def _frusta_arrays(
+    a: np.ndarray, b: np.ndarray, ra: np.ndarray, rb: np.ndarray, *, sides: int, end_caps: bool
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """`batch_frusta_array` plus the ``(V, 3)`` radial offset of every vertex.
+
+    Ring vertices are ``center + offset`` with ``offset = r (cos U + sin V)``
+    and cap centers have a zero offset, so the mesh with all radii scaled by
+    ``s`` has vertices ``vertices + (s - 1) * offsets`` and the same faces.
     """
-    all_vertices: List[Point3] = []
-    all_faces: List[Face] = []
-    offset = 0
+    a = np.asarray(a, dtype=np.float64).reshape(-1, 3)
+    b = np.asarray(b, dtype=np.float64).reshape(-1, 3)
+    ra = np.asarray(ra, dtype=np.float64).reshape(-1)
+    rb = np.asarray(rb, dtype=np.float64).reshape(-1)
+    count = a.shape[0]
+    U, V, _ = _frames(b - a)
+    cos, sin = _ring_table(sides)
+    radial = np.stack([_ring_offsets(ra, U, V, cos, sin), _ring_offsets(rb, U, V, cos, sin)], axis=1)
+    rings = np.stack([a, b], axis=1)[:, :, None, :] + radial
+    sides_tri = _side_faces(sides)
+    if not end_caps:
+        offsets = np.arange(count, dtype=np.int64)[:, None, None] * (2 * sides)
+        return rings.reshape(-1, 3), (sides_tri[None, :, :] + offsets).reshape(-1, 3), radial.reshape(-1, 3)
+
+    # Caps are optional per segment, so vertex and face counts vary: place
+    # every block at its cumulative offset.
+    cap_a, cap_b = ra > 0.0, rb > 0.0
+    nv = 2 * sides + cap_a + cap_b
+    nf = 2 * sides + sides * (cap_a.astype(np.int64) + cap_b)
+    v0 = np.cumsum(nv) - nv
+    f0 = np.cumsum(nf) - nf
+    verts = np.empty((int(nv.sum()), 3))
+    faces = np.empty((int(nf.sum()), 3), dtype=np.int64)
+    offsets = np.zeros_like(verts)
+
+    ring_rows = v0[:, None] + np.arange(2 * sides)
+    verts[ring_rows.reshape(-1)] = rings.reshape(-1, 3)
+    offsets[ring_rows.reshape(-1)] = radial.reshape(-1, 3)
+    side_rows = (f0[:, None] + np.arange(2 * sides)).reshape(-1)
+    faces[side_rows] = (sides_tri[None] + v0[:, None, None]).reshape(-1, 3)
+
+    # Cap a: center after both rings, triangles (ca, a1, a0) after the sides.
+    # Cap b: center and triangles (cb, b0, b1) after those of cap a.
+    i = np.arange(sides)
+    center_id = np.zeros(sides, dtype=np.int64)
+    shift = cap_a.astype(np.int64)
+    for cap, centers, template, skip in (
+        (cap_a, a, np.stack([center_id, (i + 1) % sides, i], -1), 0 * shift),
+        (cap_b, b, np.stack([center_id, i + sides, (i + 1) % sides + sides], -1), shift),
+    ):
+        seg = np.flatnonzero(cap)
+        vid = v0[seg] + 2 * sides + skip[seg]
+        verts[vid] = centers[seg]
+        tri = template[None, :, :] + v0[seg, None, None]
+        tri[:, :, 0] = vid[:, None]
+        rows = f0[seg] + 2 * sides + sides * skip[seg]
+        faces[(rows[:, None] + i).reshape(-1)] = tri.reshape(-1, 3)
+    return verts, faces, offsets
+
 
-    for seg in segments:
-        v, f = frustum_mesh(seg, sides=sides, end_caps=end_caps)
-        all_vertices.extend(v)
-        # Re-index faces
-        all_faces.extend([(a + offset, b + offset, c + offset) for (a, b, c) in f])
-        offset += len(v)
+# --------------------------------------------------------------------------------------
+# Welded tubes along unbranched sections
+# --------------------------------------------------------------------------------------
 
-    return all_vertices, all_faces
+
+def welded_tubes_array(
+    source: Any, *, sides: int = 16, end_caps: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Tube mesh with one shared ring per node along unbranched sections.
+
+    Where `batch_frusta_array` gives every edge its own two rings, this walks
+    each section of the cached `SectionIndex` and places a single ring at
+    every node, oriented along the bisector of the adjacent edges. Ring
+    frames are carried from the section start by parallel transport (the
+    minimal rotation between consecutive tangents), so rings do not twist.
+    Sections meeting at a branch point each start with their own ring.
+    Edges outside the parent forest (cycle edges) are meshed as frusta.
+
+    Parameters
+    ----------
+    source
+        A model or `MorphologyArrays` (anything `FrustaSet.from_general_model` takes).
+    sides
+        Ring resolution.
+    end_caps
+        Close the first and last ring of every section (where its radius is
+        > 0) with a fan around the node.
+
+    Returns
+    -------
+    (vertices, faces)
+        ``(V, 3)`` float64 vertices and ``(F, 3)`` int64 faces: ``2 * sides``
+        side triangles per edge as for frusta, but only ``E + S`` rings for
+        ``E`` edges in ``S`` sections instead of ``2 * E``.
+    """
+    arrays = MorphologyArrays.coerce(source)
+    sections = SectionIndex.of(source if hasattr(source, "section_index") else arrays)
+    verts, faces, _ = _tube_arrays(arrays, sections, sides=sides, end_caps=end_caps)
+    return verts, faces
+
+
+def _tube_arrays(
+    arrays: MorphologyArrays, sections: SectionIndex, *, sides: int, end_caps: bool
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """`welded_tubes_array` plus radial vertex offsets (see `_frusta_arrays`)."""
+    nodes = sections.nodes
+    count = nodes.size
+    first, last = sections.offsets[:-1], sections.offsets[1:] - 1
+    is_last = np.zeros(count, dtype=bool)
+    is_last[last] = True
+    pos = arrays.xyz[nodes]
+
+    # Ring normals: bisector of the incoming and outgoing edge directions,
+    # falling back to either one at kinks, section ends and zero-length edges.
+    out_dir = np.zeros((count, 3))
+    inner = np.flatnonzero(~is_last)
+    out_dir[inner] = _unit(pos[inner + 1] - pos[inner])
+    in_dir = np.zeros((count, 3))
+    in_dir[1:] = out_dir[:-1]
+    in_dir[first] = 0.0
+    W = _unit(in_dir + out_dir)
+    for fallback in (out_dir, in_dir):
+        flat = ~W.any(axis=1)
+        W[flat] = fallback[flat]
+    W[~W.any(axis=1)] = (0.0, 0.0, 1.0)
+
+    # Parallel transport: rotate each section's start frame through the
+    # chain of minimal rotations between consecutive normals.
+    U0, _, _ = _frames(W[first])
+    U = _rotate(_transport(W, first), np.repeat(U0, sections.lengths, axis=0))
+    U = _unit(U - np.sum(U * W, axis=1)[:, None] * W)
+    lost = ~U.any(axis=1)
+    if lost.any():
+        U[lost] = _frames(W[lost])[0]
+    V = _cross(W, U)
+
+    cos, sin = _ring_table(sides)
+    radial = _ring_offsets(arrays.r[nodes], U, V, cos, sin)
+    verts = [(pos[:, None, :] + radial).reshape(-1, 3)]
+    radials = [radial.reshape(-1, 3)]
+    faces = [(_side_faces(sides)[None, :, :] + (inner * sides)[:, None, None]).reshape(-1, 3)]
+    size = count * sides
+
+    if end_caps:
+        i = np.arange(sides)
+        for ends, template in (
+            (first, np.stack([np.zeros(sides, dtype=np.int64), (i + 1) % sides, i], -1)),
+            (last, np.stack([np.zeros(sides, dtype=np.int64), i, (i + 1) % sides], -1)),
+        ):
+            ends = ends[arrays.r[nodes[ends]] > 0.0]
+            center = size + np.arange(ends.size)
+            tri = template[None, :, :] + (ends * sides)[:, None, None]
+            tri[:, :, 0] = center[:, None]
+            verts.append(pos[ends])
+            radials.append(np.zeros((ends.size, 3)))
+            faces.append(tri.reshape(-1, 3))
+            size += ends.size
+
+    loose = arrays.edges[sections.edge_sections(arrays.edges) < 0]
+    if loose.size:
+        u, v = loose[:, 0], loose[:, 1]
+        fv, ff, fr = _frusta_arrays(
+            arrays.xyz[u], arrays.xyz[v], arrays.r[u], arrays.r[v], sides=sides, end_caps=end_caps
+        )
+        verts.append(fv)
+        radials.append(fr)
+        faces.append(ff + size)
+    return np.concatenate(verts), np.concatenate(faces).astype(np.int64), np.concatenate(radials)
+
+
+def _transport(W: np.ndarray, first: np.ndarray) -> np.ndarray:
+    """``(N, 4)`` quaternions rotating each section's first normal onto `W`.
+
+    Rows are section positions in CSR order and `first` the row of each
+    section start. The per-step minimal rotations are composed with a
+    prefix product by pointer doubling (``log2`` of the longest section
+    passes), as `SectionIndex` resolves section ends.
+    """
+    count = W.shape[0]
+    step = np.zeros((count, 4))
+    step[:, 0] = 1.0
+    prev = np.arange(count, dtype=np.int64) - 1
+    prev[first] = first
+    rows = np.flatnonzero(prev != np.arange(count))
+    a, b = W[prev[rows]], W[rows]
+    q = np.column_stack([1.0 + np.sum(a * b, axis=1), _cross(a, b)])
+    # Opposite normals: half turn about any axis perpendicular to both
+    flip = q[:, 0] < 1e-12
+    if flip.any():
+        q[flip] = np.column_stack([np.zeros(int(flip.sum())), _frames(a[flip])[0]])
+    step[rows] = q / np.linalg.norm(q, axis=1)[:, None]
+
+    total = step
+    while True:
+        nxt = prev[prev]
+        if np.array_equal(nxt, prev):
+            return total
+        total = _qmul(total, total[prev])
+        prev = nxt
+
+
+def _qmul(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """Row-wise quaternion product ``p q`` (rotate by `q`, then by `p`)."""
+    w1, v1 = p[:, :1], p[:, 1:]
+    w2, v2 = q[:, :1], q[:, 1:]
+    return np.column_stack([w1 * w2 - np.sum(v1 * v2, axis=1)[:, None], w1 * v2 + w2 * v1 + _cross(v1, v2)])
+
+
+def _rotate(q: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Rotate rows of `v` by the unit quaternions `q`."""
+    w, u = q[:, :1], q[:, 1:]
+    t = 2.0 * _cross(u, v)
+    return v + w * t + _cross(u, t)
 
 
 # --------------------------------------------------------------------------------------
@@ -229,6 +480,8 @@ def sphere_mesh(
 ) -> Tuple[List[Point3], List[Face]]:
     """Generate a low-res UV sphere mesh at `center` with given `radius`.
 
+    The `sphere_template` unit sphere, scaled and translated.
+
     Parameters
     ----------
     stacks: int
@@ -236,61 +489,8 @@ def sphere_mesh(
     slices: int
         Number of longitudinal divisions (>= 3).
     """
-    stacks = max(2, int(stacks))
-    slices = max(3, int(slices))
-
-    verts: List[Point3] = []
-    faces: List[Face] = []
-
-    # Generate vertices (excluding poles initially)
-    for i in range(1, stacks):
-        theta = math.pi * (i / stacks)  # (0, pi)
-        st = math.sin(theta)
-        ct = math.cos(theta)
-        for j in range(slices):
-            phi = 2.0 * math.pi * (j / slices)
-            sp = math.sin(phi)
-            cp = math.cos(phi)
-            x = center[0] + radius * st * cp
-            y = center[1] + radius * st * sp
-            z = center[2] + radius * ct
-            verts.append((x, y, z))
-
-    # Add poles
-    north_idx = len(verts)
-    verts.append((center[0], center[1], center[2] + radius))
-    south_idx = len(verts)
-    verts.append((center[0], center[1], center[2] - radius))
-
-    # Index helper for ring vertices
-    def vid(i: int, j: int) -> int:
-        # i in [0, stacks-2], j in [0, slices-1]
-        return i * slices + (j % slices)
-
-    # Faces between rings
-    for i in range(stacks - 2):
-        for j in range(slices):
-            a = vid(i, j)
-            b = vid(i, j + 1)
-            c = vid(i + 1, j)
-            d = vid(i + 1, j + 1)
-            faces.append((a, c, d))
-            faces.append((a, d, b))
-
-    # Triangles to poles
-    # Top ring (i = 0) connects to north pole
-    for j in range(slices):
-        a = vid(0, j)
-        b = vid(0, j + 1)
-        faces.append((north_idx, a, b))
-    # Bottom ring (i = stacks-2) connects to south pole
-    base = stacks - 2
-    for j in range(slices):
-        a = vid(base, j)
-        b = vid(base, j + 1)
-        faces.append((south_idx, b, a))
-
-    return verts, faces
+    verts, faces = batch_spheres_array([center], radius=radius, stacks=stacks, slices=slices)
+    return _as_lists(verts, faces)
 
 
 def batch_spheres(
@@ -298,31 +498,152 @@ def batch_spheres(
 ) -> Tuple[List[Point3], List[Face]]:
     """Batch multiple spheres into a single mesh.
 
-    Returns concatenated `vertices` and reindexed `faces`.
+    Returns concatenated `vertices` and reindexed `faces`; see
+    `batch_spheres_array` for the array version.
+    """
+    centers = np.array([tuple(p) for p in points], dtype=np.float64).reshape(-1, 3)
+    return _as_lists(*batch_spheres_array(centers, radius=radius, stacks=stacks, slices=slices))
+
+
+def sphere_template(stacks: int = 6, slices: int = 12) -> Tuple[np.ndarray, np.ndarray]:
+    """Unit sphere with the vertex and face layout of `sphere_mesh`.
+
+    Returns
+    -------
+    (vertices, faces)
+        ``(V, 3)`` float64 offsets for a sphere of radius 1 at the origin and
+        ``(F, 3)`` int64 faces, in the same order `sphere_mesh` produces them.
     """
-    all_vertices: List[Point3] = []
-    all_faces: List[Face] = []
-    offset = 0
+    stacks = max(2, int(stacks))
+    slices = max(3, int(slices))
 
-    for p in points:
-        v, f = sphere_mesh(p, radius, stacks=stacks, slices=slices)
-        all_vertices.extend(v)
-        all_faces.extend([(a + offset, b + offset, c + offset) for (a, b, c) in f])
-        offset += len(v)
+    theta = math.pi * (np.arange(1, stacks) / stacks)
+    phi = 2.0 * math.pi * (np.arange(slices) / slices)
+    st = np.sin(theta)[:, None]
+    ring = np.stack(
+        [
+            (st * np.cos(phi)).ravel(),
+            (st * np.sin(phi)).ravel(),
+            np.repeat(np.cos(theta), slices),
+        ],
+        axis=1,
+    )
+    verts = np.vstack([ring, [[0.0, 0.0, 1.0], [0.0, 0.0, -1.0]]])
+    north, south = ring.shape[0], ring.shape[0] + 1
+
+    j = np.arange(slices)
+    jn = (j + 1) % slices
+    i = np.arange(stacks - 2)[:, None]
+    a = i * slices + j
+    b = i * slices + jn
+    c = (i + 1) * slices + j
+    d = (i + 1) * slices + jn
+    quads = np.stack([np.stack([a, c, d], -1), np.stack([a, d, b], -1)], axis=2).reshape(-1, 3)
+    base = (stacks - 2) * slices
+    top = np.stack([np.full(slices, north), j, jn], axis=1)
+    bottom = np.stack([np.full(slices, south), base + jn, base + j], axis=1)
+    faces = np.vstack([quads, top, bottom]).astype(np.int64)
+    return verts, faces
 
-    return all_vertices, all_faces
 
+def batch_spheres_array(
+    centers: np.ndarray,
+    *,
+    radius: float | np.ndarray = 1.0,
+    stacks: int = 6,
+    slices: int = 12,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Array counterpart of `batch_spheres`.
 
-@dataclass(frozen=True)
+    Every sphere is the `sphere_template` unit sphere scaled and translated
+    by broadcasting; faces are the template faces tiled with per-sphere
+    vertex offsets.
+
+    Parameters
+    ----------
+    centers
+        ``(N, 3)`` sphere centers.
+    radius
+        One radius for all spheres or ``(N,)`` per-point radii.
+
+    Returns
+    -------
+    (vertices, faces)
+        ``(N * V, 3)`` float64 vertices and ``(N * F, 3)`` int64 faces, laid out
+        sphere by sphere exactly like `batch_spheres`.
+    """
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 3)
+    unit, tri = sphere_template(stacks, slices)
+    verts = _sphere_vertices(centers, radius, unit, np.float64)
+    return verts, _sphere_faces(centers.shape[0], tri, unit.shape[0], np.int64)
+
+
+def _sphere_vertices(
+    centers: np.ndarray, radius: Any, unit: np.ndarray, dtype: Any, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """``(N * V, 3)`` vertices ``center + radius * unit`` of `dtype`, built in place.
+
+    `radius` is a scalar or ``(N,)`` array; `out` is an optional contiguous
+    ``(N * V, 3)`` target.
+    """
+    radius = np.asarray(radius, dtype=np.float64)
+    if radius.ndim and radius.shape != (centers.shape[0],):
+        raise ValueError(f"Expected {centers.shape[0]} radii, got shape {radius.shape}")
+    shape = (centers.shape[0],) + unit.shape
+    out = np.empty(shape, dtype=dtype) if out is None else out.reshape(shape)
+    if radius.ndim:
+        np.multiply(radius[:, None, None], unit, out=out, casting="same_kind")
+        out += centers[:, None, :]
+    else:
+        np.add(centers[:, None, :], radius * unit, out=out, casting="same_kind")
+    return out.reshape(-1, 3)
+
+
+def _sphere_faces(count: int, tri: np.ndarray, nverts: int, dtype: Any) -> np.ndarray:
+    """``(count * F, 3)`` template faces tiled with vertex offsets, built in place."""
+    out = np.empty((count,) + tri.shape, dtype=dtype)
+    out[...] = tri
+    out += (np.arange(count, dtype=dtype) * nverts)[:, None, None]
+    return out.reshape(-1, 3)
+
+
+def _mesh_arrays(
+    verts: np.ndarray, faces: np.ndarray, dtype: Any = np.float64
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Contiguous ``(V, 3)`` vertices of `dtype` and ``(F, 3)`` faces, int32
+    unless the vertex count needs int64."""
+    verts = np.ascontiguousarray(verts, dtype=dtype).reshape(-1, 3)
+    index = np.int32 if verts.shape[0] <= np.iinfo(np.int32).max else np.int64
+    return verts, np.ascontiguousarray(faces, dtype=index).reshape(-1, 3)
+
+
+def _mesh3d_columns(
+    verts: np.ndarray, faces: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """x, y, z, i, j, k column views of a vertex and a face array."""
+    return verts[:, 0], verts[:, 1], verts[:, 2], faces[:, 0], faces[:, 1], faces[:, 2]
+
+
+@dataclass(frozen=True, eq=False)
 class PointSet:
-    """A batched mesh of small spheres placed at given 3D points."""
+    """A batched mesh of small spheres placed at given 3D points.
+
+    ``vertices`` is a contiguous ``(V, 3)`` float array, ``faces`` an
+    ``(F, 3)`` int32 array (int64 only past ``2**31`` vertices) and
+    ``points`` the ``(N, 3)`` sphere centers; ``columns`` holds any extra
+    per-point columns of the input. ``radii`` holds optional per-point
+    radii, used instead of ``base_radius``. Sets compare by identity, not
+    by their arrays.
+    """
 
-    vertices: List[Point3]
-    faces: List[Face]
-    points: List[Point3]
+    vertices: np.ndarray
+    faces: np.ndarray
+    points: np.ndarray
     base_radius: float
     stacks: int
     slices: int
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+    radii: Optional[np.ndarray] = field(default=None, compare=False, repr=False)
 
     @classmethod
     def from_points(
@@ -332,17 +653,59 @@ class PointSet:
         base_radius: float = 1.0,
         stacks: int = 6,
         slices: int = 12,
+        dtype: Any = np.float64,
+        radii: Optional[Sequence[float]] = None,
     ) -> "PointSet":
-        verts, faces = batch_spheres(
-            points, radius=base_radius, stacks=stacks, slices=slices
+        """Build a `PointSet` from a sequence of ``(x, y, z)`` points (see `from_array`)."""
+        pts = np.array(points, dtype=np.float64).reshape(-1, 3)
+        return cls.from_array(
+            pts, base_radius=base_radius, stacks=stacks, slices=slices, dtype=dtype, radii=radii
         )
+
+    @classmethod
+    def from_array(
+        cls,
+        points: np.ndarray,
+        *,
+        base_radius: float = 1.0,
+        stacks: int = 6,
+        slices: int = 12,
+        columns: Optional[Dict[str, np.ndarray]] = None,
+        dtype: Any = np.float64,
+        radii: Optional[np.ndarray] = None,
+    ) -> "PointSet":
+        """Build a `PointSet` from an ``(N, 3)`` array.
+
+        Vertices and faces are written straight into arrays of their final
+        dtype from the `sphere_template` unit sphere (as `batch_spheres_array`
+        lays them out). `columns` holds optional per-point arrays (length N),
+        e.g. sizes or labels. `radii` gives each sphere its own radius in
+        place of `base_radius`. `dtype` is the vertex dtype (``np.float32``
+        halves the mesh memory).
+        """
+        pts = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 3)
+        columns = dict(columns or {})
+        for name, col in columns.items():
+            if len(col) != pts.shape[0]:
+                raise ValueError(
+                    f"Column '{name}' has {len(col)} values, expected {pts.shape[0]}"
+                )
+        if radii is not None:
+            radii = np.ascontiguousarray(radii, dtype=np.float64).reshape(-1)
+            if radii.size != pts.shape[0]:
+                raise ValueError(f"Got {radii.size} radii, expected {pts.shape[0]}")
+        unit, tri = sphere_template(stacks, slices)
+        size = pts.shape[0] * unit.shape[0]
+        index = np.int32 if size <= np.iinfo(np.int32).max else np.int64
         return cls(
-            vertices=verts,
-            faces=faces,
-            points=list(points),
+            vertices=_sphere_vertices(pts, base_radius if radii is None else radii, unit, dtype),
+            faces=_sphere_faces(pts.shape[0], tri, unit.shape[0], index),
+            points=pts,
             base_radius=base_radius,
             stacks=stacks,
             slices=slices,
+            columns=columns,
+            radii=radii,
         )
 
     @classmethod
@@ -354,12 +717,23 @@ class PointSet:
         stacks: int = 6,
         slices: int = 12,
         allow_extra_columns: bool = True,
+        column_names: Optional[Sequence[str]] = None,
+        radius_column: Optional[str] = None,
     ) -> "PointSet":
         """Load a simple text format with `x y z` coordinates per non-empty line.
 
+        - Paths ending in `.gz`, `.bz2` or `.xz` (or carrying their magic bytes)
+          are decompressed on the fly.
         - Lines beginning with `#` or blank lines are ignored.
-        - If `allow_extra_columns=True`, extra columns after the first three are ignored.
+        - If `allow_extra_columns=True`, extra columns after the first three are
+          kept in ``columns`` when every row has the same number of them: named by
+          `column_names`, else ``"col3"``, ``"col4"``, ... (0-based column index).
+          Numeric columns become float arrays, others string arrays.
+        - `radius_column` names a numeric extra column to use as per-point radii.
         - Raises `ValueError` on malformed lines.
+
+        Coordinates are parsed in bulk into an ``(N, 3)`` array and meshed with
+        `batch_spheres_array` (see `from_array`).
         """
 
         # Normalize to an iterator of lines
@@ -371,7 +745,7 @@ class PointSet:
             # path or text
             p = str(source)
             if os.path.exists(p):
-                with open(p, "r", encoding="utf-8") as f:
+                with open_text(p) as f:
                     content = f.read().splitlines()
                 lines = content
             else:
@@ -379,76 +753,157 @@ class PointSet:
         else:
             lines = source
 
-        pts: List[Point3] = []
+        body: List[str] = []
+        body_lines: List[int] = []
         for idx, raw in enumerate(lines, start=1):
             s = raw.strip()
             if not s or s.startswith("#"):
                 continue
-            parts = s.split()
-            if len(parts) < 3:
-                raise ValueError(
-                    f"Line {idx}: expected at least 3 columns for x y z, got {len(parts)}"
-                )
-            if not allow_extra_columns and len(parts) != 3:
-                raise ValueError(
-                    f"Line {idx}: expected exactly 3 columns for x y z, got {len(parts)}"
-                )
-            try:
-                x = float(parts[0])
-                y = float(parts[1])
-                z = float(parts[2])
-            except Exception as e:
-                raise ValueError(f"Line {idx}: could not parse floats: {e}")
-            pts.append((x, y, z))
-
-        return cls.from_points(
-            pts, base_radius=base_radius, stacks=stacks, slices=slices
+            body.append(s)
+            body_lines.append(idx)
+
+        pts = _points_from_body(body, body_lines, allow_extra_columns)
+        columns: Dict[str, np.ndarray] = {}
+        if allow_extra_columns and body:
+            columns = _extra_columns(body, column_names)
+        radii = None
+        if radius_column is not None:
+            radii = columns.get(radius_column)
+            if radii is None or radii.dtype.kind != "f":
+                raise ValueError(f"No numeric column '{radius_column}' for radii")
+        return cls.from_array(
+            pts, base_radius=base_radius, stacks=stacks, slices=slices, columns=columns, radii=radii
         )
 
     def to_mesh3d_arrays(
         self,
-    ) -> Tuple[List[float], List[float], List[float], List[int], List[int], List[int]]:
-        x = [p[0] for p in self.vertices]
-        y = [p[1] for p in self.vertices]
-        z = [p[2] for p in self.vertices]
-        i = [f[0] for f in self.faces]
-        j = [f[1] for f in self.faces]
-        k = [f[2] for f in self.faces]
-        return x, y, z, i, j, k
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return Plotly Mesh3d arrays x, y, z, i, j, k as column views (no copies)."""
+        return _mesh3d_columns(self.vertices, self.faces)
 
     def scaled(self, radius_scale: float) -> "PointSet":
-        """Return a new `PointSet` with all sphere radii scaled by `radius_scale`."""
+        """Return a new `PointSet` with all sphere radii scaled by `radius_scale`.
+
+        Only the vertices are recomputed (centers plus the scaled unit sphere);
+        the faces are shared.
+        """
         if radius_scale == 1.0:
             return self
-        r = self.base_radius * radius_scale
-        verts, faces = batch_spheres(
-            self.points, radius=r, stacks=self.stacks, slices=self.slices
-        )
         return PointSet(
-            vertices=verts,
-            faces=faces,
+            vertices=self.scaled_many([radius_scale])[0],
+            faces=self.faces,
             points=self.points,
             base_radius=self.base_radius,
             stacks=self.stacks,
             slices=self.slices,
+            columns=self.columns,
+            radii=self.radii,
         )
 
+    def scaled_many(self, scales: Sequence[float]) -> np.ndarray:
+        """Vertices for several radius scales at once (see `FrustaSet.scaled_many`).
+
+        Returns an ``(S, V, 3)`` array of the vertex dtype whose entry ``k``
+        equals ``scaled(scales[k]).vertices``.
+        """
+        unit, _ = sphere_template(self.stacks, self.slices)
+        base = self.base_radius if self.radii is None else self.radii
+        scales = np.asarray(scales, dtype=np.float64).reshape(-1)
+        out = np.empty((scales.size,) + self.vertices.shape, dtype=self.vertices.dtype)
+        for frame, scale in zip(out, scales.tolist()):
+            _sphere_vertices(self.points, base * scale, unit, frame.dtype, out=frame)
+        return out
+
+
+def _points_from_body(
+    body: List[str], body_lines: List[int], allow_extra_columns: bool
+) -> np.ndarray:
+    """Parse x y z from stripped data rows in one `np.loadtxt` call.
+
+    If NumPy rejects the rows, they are re-scanned one by one so the error
+    names the first offending line.
+    """
+    if not body:
+        return np.zeros((0, 3), dtype=np.float64)
+    try:
+        pts = np.loadtxt(
+            body,
+            dtype=np.float64,
+            comments=None,
+            ndmin=2,
+            usecols=(0, 1, 2) if allow_extra_columns else None,
+        )
+    except ValueError:
+        pts = None
+    if pts is not None and pts.shape[1] == 3:
+        return pts
+
+    for idx, s in zip(body_lines, body):
+        parts = s.split()
+        if len(parts) < 3:
+            raise ValueError(
+                f"Line {idx}: expected at least 3 columns for x y z, got {len(parts)}"
+            )
+        if not allow_extra_columns and len(parts) != 3:
+            raise ValueError(
+                f"Line {idx}: expected exactly 3 columns for x y z, got {len(parts)}"
+            )
+        try:
+            float(parts[0])
+            float(parts[1])
+            float(parts[2])
+        except Exception as e:
+            raise ValueError(f"Line {idx}: could not parse floats: {e}")
+    raise ValueError("could not parse point coordinates")
+
+
+def _extra_columns(
+    body: List[str], column_names: Optional[Sequence[str]]
+) -> Dict[str, np.ndarray]:
+    """Columns after x y z as arrays, or {} if rows disagree on their count."""
+    width = len(body[0].split())
+    if width <= 3:
+        return {}
+    usecols = range(3, width)
+    try:
+        data = np.loadtxt(body, dtype=np.float64, comments=None, ndmin=2, usecols=usecols)
+        cols = [data[:, k] for k in range(width - 3)]
+    except ValueError:
+        try:
+            text = np.loadtxt(body, dtype=str, comments=None, ndmin=2, usecols=usecols)
+        except ValueError:
+            return {}
+        cols = [_numeric_or_text(text[:, k]) for k in range(width - 3)]
+    names = list(column_names or [])
+    names += [f"col{k}" for k in range(3 + len(names), width)]
+    return {name: np.ascontiguousarray(col) for name, col in zip(names, cols)}
+
+
+def _numeric_or_text(col: np.ndarray) -> np.ndarray:
+    try:
+        return col.astype(np.float64)
+    except ValueError:
+        return col
+
 
 # --------------------------------------------------------------------------------------
 # Frusta set derived from a GeneralModel
 # --------------------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class FrustaSet:
     """A batched frusta mesh derived from a `GeneralModel`.
 
+    Sets compare by identity, not by their arrays.
+
     Attributes
     ----------
-    vertices: List[Point3]
-        Concatenated vertices for all frusta.
-    faces: List[Face]
-        Triangular faces indexing into `vertices`.
+    vertices: np.ndarray
+        Contiguous ``(V, 3)`` vertices of all frusta (float64 by default).
+    faces: np.ndarray
+        ``(F, 3)`` int32 triangles indexing into `vertices` (int64 only past
+        ``2**31`` vertices).
     sides: int
         Circumferential resolution used per frustum.
     end_caps: bool
@@ -457,15 +912,38 @@ class FrustaSet:
         Number of segments used (one per graph edge).
     edge_count: int
         Alias for `segment_count` for clarity.
+    a, b: np.ndarray
+        ``(E, 3)`` segment end points, in segment order.
+    ra, rb: np.ndarray
+        ``(E,)`` radii at `a` and `b`; `segments` builds `Segment` objects
+        from these arrays on first access.
+    sections: np.ndarray | None
+        Unbranched section of each segment (from the cached `SectionIndex`),
+        ``-1`` for edges that close cycles; for coloring or grouping by section.
+    radial: np.ndarray | None
+        ``(V, 3)`` offset of each vertex from its ring center, ``r (cos U + sin V)``
+        (zero for cap centers). `scaled` and `scaled_many` move vertices along
+        it instead of remeshing; derived from the segment arrays when not given.
+    welded: bool
+        Whether the mesh was built with `welded_tubes_array` (one ring per
+        node along sections) rather than one pair of rings per segment.
     """
 
-    vertices: List[Point3]
-    faces: List[Face]
+    vertices: np.ndarray
+    faces: np.ndarray
     sides: int
     end_caps: bool
     segment_count: int
     edge_count: int
-    segments: List[Segment]
+    a: np.ndarray = field(repr=False)
+    b: np.ndarray = field(repr=False)
+    ra: np.ndarray = field(repr=False)
+    rb: np.ndarray = field(repr=False)
+    sections: Optional[np.ndarray] = field(default=None, compare=False, repr=False)
+    radial: Optional[np.ndarray] = field(default=None, compare=False, repr=False)
+    welded: bool = False
+    _spatial: Optional[SpatialIndex] = field(default=None, init=False, compare=False, repr=False)
+    _segments: Optional[List[Segment]] = field(default=None, init=False, compare=False, repr=False)
 
     @classmethod
     def from_general_model(
@@ -474,72 +952,151 @@ class FrustaSet:
         *,
         sides: int = 16,
         end_caps: bool = False,
+        dtype: Any = np.float64,
+        weld: bool = False,
     ) -> "FrustaSet":
-        """Build a `FrustaSet` by converting each undirected edge into a `Segment`.
-
-        Expects nodes to have attributes `x, y, z, r`.
+        """Build a `FrustaSet` with one segment per undirected edge.
+
+        `gm` may be a `GeneralModel` (or any graph whose nodes have attributes
+        `x, y, z, r`) or `MorphologyArrays`; endpoints are gathered from the
+        coordinate and radius arrays, one edge per segment in edge order.
+        `dtype` is the vertex dtype (``np.float32`` halves the mesh memory).
+        With `weld=True` the mesh comes from `welded_tubes_array`: rings are
+        shared between consecutive edges of a section, which about halves
+        the vertex count and removes the seams at continuation nodes.
         """
-        segments: List[Segment] = []
-        for u, v in gm.edges:
-            xu, yu, zu = gm.nodes[u]["x"], gm.nodes[u]["y"], gm.nodes[u]["z"]
-            xv, yv, zv = gm.nodes[v]["x"], gm.nodes[v]["y"], gm.nodes[v]["z"]
-            ru, rv = float(gm.nodes[u]["r"]), float(gm.nodes[v]["r"])
-            segments.append(Segment(a=(xu, yu, zu), b=(xv, yv, zv), ra=ru, rb=rv))
-
-        vertices, faces = batch_frusta(segments, sides=sides, end_caps=end_caps)
+        arrays = MorphologyArrays.coerce(gm)
+        u, v = arrays.edges[:, 0], arrays.edges[:, 1]
+        a, b, ra, rb = arrays.xyz[u], arrays.xyz[v], arrays.r[u], arrays.r[v]
+        sections = SectionIndex.of(gm if hasattr(gm, "section_index") else arrays)
+
+        if weld:
+            verts, faces, radial = _tube_arrays(arrays, sections, sides=sides, end_caps=end_caps)
+        else:
+            verts, faces, radial = _frusta_arrays(a, b, ra, rb, sides=sides, end_caps=end_caps)
+        vertices, faces = _mesh_arrays(verts, faces, dtype)
         return cls(
             vertices=vertices,
             faces=faces,
             sides=sides,
             end_caps=end_caps,
-            segment_count=len(segments),
-            edge_count=len(segments),
-            segments=segments,
+            segment_count=len(ra),
+            edge_count=len(ra),
+            a=a,
+            b=b,
+            ra=ra,
+            rb=rb,
+            sections=sections.edge_sections(arrays.edges),
+            radial=np.ascontiguousarray(radial, dtype=dtype),
+            welded=weld,
         )
 
+    @classmethod
+    def from_segments(
+        cls, segments: Iterable[Segment], *, sides: int = 16, end_caps: bool = False, dtype: Any = np.float64
+    ) -> "FrustaSet":
+        """Build a `FrustaSet` from `Segment` objects (no sections)."""
+        a, b, ra, rb = _segment_arrays(segments)
+        verts, faces, radial = _frusta_arrays(a, b, ra, rb, sides=sides, end_caps=end_caps)
+        vertices, faces = _mesh_arrays(verts, faces, dtype)
+        return cls(
+            vertices=vertices,
+            faces=faces,
+            sides=sides,
+            end_caps=end_caps,
+            segment_count=len(ra),
+            edge_count=len(ra),
+            a=a,
+            b=b,
+            ra=ra,
+            rb=rb,
+            radial=np.ascontiguousarray(radial, dtype=dtype),
+        )
+
+    @property
+    def segments(self) -> List[Segment]:
+        """`Segment` objects for the segment arrays, built on first access."""
+        if self._segments is None:
+            segments = [
+                Segment(a=tuple(a), b=tuple(b), ra=ra, rb=rb)  # type: ignore[arg-type]
+                for a, b, ra, rb in zip(self.a.tolist(), self.b.tolist(), self.ra.tolist(), self.rb.tolist())
+            ]
+            object.__setattr__(self, "_segments", segments)
+        return self._segments
+
     def to_mesh3d_arrays(
         self,
-    ) -> Tuple[List[float], List[float], List[float], List[int], List[int], List[int]]:
-        """Return Plotly Mesh3d arrays: x, y, z, i, j, k."""
-        x = [p[0] for p in self.vertices]
-        y = [p[1] for p in self.vertices]
-        z = [p[2] for p in self.vertices]
-        i = [f[0] for f in self.faces]
-        j = [f[1] for f in self.faces]
-        k = [f[2] for f in self.faces]
-        return x, y, z, i, j, k
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return Plotly Mesh3d arrays x, y, z, i, j, k as column views (no copies)."""
+        return _mesh3d_columns(self.vertices, self.faces)
+
+    def spatial_index(self) -> SpatialIndex:
+        """Return a `SpatialIndex` over the segments (rows in segment order), built once."""
+        if self._spatial is None:
+            object.__setattr__(self, "_spatial", SpatialIndex(self.a, self.b, self.ra, self.rb))
+        return self._spatial
 
     def scaled(self, radius_scale: float) -> "FrustaSet":
         """Return a new FrustaSet with all segment radii scaled by `radius_scale`.
 
-        This rebuilds vertices/faces from the stored `segments` list.
+        Topology is unchanged, so the vertices are moved along `radial` and
+        the faces are shared; caps are kept even where a radius becomes 0.
         """
         if radius_scale == 1.0:
             return self
-        scaled_segments = [
-            Segment(a=s.a, b=s.b, ra=s.ra * radius_scale, rb=s.rb * radius_scale)
-            for s in self.segments
-        ]
-        vertices, faces = batch_frusta(
-            scaled_segments, sides=self.sides, end_caps=self.end_caps
-        )
+        radial = self._radial()
         return FrustaSet(
-            vertices=vertices,
-            faces=faces,
+            vertices=self.scaled_many([radius_scale])[0],
+            faces=self.faces,
             sides=self.sides,
             end_caps=self.end_caps,
             segment_count=self.segment_count,
             edge_count=self.edge_count,
-            segments=scaled_segments,
+            a=self.a,
+            b=self.b,
+            ra=self.ra * radius_scale,
+            rb=self.rb * radius_scale,
+            sections=self.sections,
+            radial=radial * np.asarray(radius_scale, dtype=radial.dtype),
+            welded=self.welded,
         )
 
+    def scaled_many(self, scales: Sequence[float]) -> np.ndarray:
+        """Vertices for several radius scales at once, e.g. for slider frames.
+
+        Returns an ``(S, V, 3)`` array of the vertex dtype whose entry ``k``
+        equals ``scaled(scales[k]).vertices``; all of them share `faces`.
+        """
+        radial = self._radial()
+        factors = np.asarray(scales, dtype=np.float64).reshape(-1) - 1.0
+        out = np.empty((factors.size,) + self.vertices.shape, dtype=self.vertices.dtype)
+        for frame, f in zip(out, factors.tolist()):
+            np.multiply(radial, f, out=frame, casting="same_kind")
+            frame += self.vertices
+        return out
+
+    def _radial(self) -> np.ndarray:
+        """`radial`, derived from the segment arrays on first use if it was not given."""
+        if self.radial is None:
+            if self.welded:
+                raise ValueError("A welded FrustaSet needs its radial offsets; rebuild it with weld=True")
+            _, _, radial = _frusta_arrays(
+                self.a, self.b, self.ra, self.rb, sides=self.sides, end_caps=self.end_caps
+            )
+            object.__setattr__(self, "radial", np.ascontiguousarray(radial, dtype=self.vertices.dtype))
+        return self.radial
+
 
 __all__ = [
     "Segment",
     "frustum_mesh",
     "batch_frusta",
+    "batch_frusta_array",
+    "welded_tubes_array",
     "sphere_mesh",
     "batch_spheres",
+    "sphere_template",
+    "batch_spheres_array",
     "PointSet",
     "FrustaSet",
 ]
@@ -1,12 +1,14 @@
 """SWC file parsing utilities.
 
 This module provides functions to parse SWC morphology files and extract:
-- records for each SWC node (n, T, x, y, z, r, parent)
+- records for each SWC node (n, T, x, y, z, r, parent), stored column-wise
+  in an `SWCTable` with a lazy `SWCRecord` view
 - header annotations for cycle break reconnections
 
 It performs basic validations (unique ids, parent references) and can
 optionally validate that requested reconnection node pairs share identical
-(x, y, z, r) values.
+(x, y, z, r) values. Validation fails fast on the first error; see
+`swcviz.validate` for a full report of every violation.
 
 Notes
 -----
@@ -28,13 +30,21 @@ True
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from math import isclose
-from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from collections.abc import Mapping, ValuesView, ItemsView
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import asyncio
+import functools
 import io
 import os
-import re
 
+import numpy as np
+
+from ._util import RECONNECT_RE, isin_sorted, open_for_writing, open_text
+
+if TYPE_CHECKING:
+    from .cache import ParseCache
 
 # Public data structures -------------------------------------------------------------------------
 
@@ -69,28 +79,289 @@ class SWCRecord:
     line: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
+class SWCTable:
+    """Struct-of-arrays SWC rows with an id -> row index.
+
+    Columns are contiguous NumPy arrays of equal length, one entry per row in
+    file order: ``n``, ``parent`` and ``line`` are int64, ``t`` is int32 and
+    ``x, y, z, r`` are float64. Row lookups by node id use a sorted copy of
+    ``n`` (binary search), so the index costs two arrays rather than a dict.
+
+    If ``n`` contains duplicates (only possible for hand-built tables), lookups
+    resolve to the first row carrying the id.
+    """
+
+    n: np.ndarray
+    t: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+    r: np.ndarray
+    parent: np.ndarray
+    line: np.ndarray
+    _order: np.ndarray = field(init=False, repr=False)
+    _sorted_ids: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        dtypes = {
+            "n": np.int64,
+            "t": np.int32,
+            "x": np.float64,
+            "y": np.float64,
+            "z": np.float64,
+            "r": np.float64,
+            "parent": np.int64,
+            "line": np.int64,
+        }
+        size = None
+        for name, dtype in dtypes.items():
+            col = getattr(self, name)
+            # Keep memory-mapped/read-only inputs as-is when already well-typed
+            if not (isinstance(col, np.ndarray) and col.dtype == dtype and col.ndim == 1):
+                col = np.ascontiguousarray(col, dtype=dtype).reshape(-1)
+                object.__setattr__(self, name, col)
+            if size is None:
+                size = col.size
+            elif col.size != size:
+                raise ValueError(
+                    f"SWCTable column '{name}' has {col.size} rows, expected {size}"
+                )
+        order = np.argsort(self.n, kind="stable")
+        object.__setattr__(self, "_order", order)
+        object.__setattr__(self, "_sorted_ids", self.n[order])
+
+    # ---- Construction --------------------------------------------------------------------------
+
+    @classmethod
+    def from_records(
+        cls, records: Union[Mapping[int, SWCRecord], Iterable[SWCRecord]]
+    ) -> "SWCTable":
+        """Build a table from SWC records (mapping of id->record or iterable).
+
+        A `SWCRecordView` returns the table it is backed by, without copying.
+        """
+        if isinstance(records, SWCRecordView):
+            return records._table
+        recs = list(records.values()) if isinstance(records, Mapping) else list(records)
+        return cls(
+            n=[rec.n for rec in recs],
+            t=[rec.t for rec in recs],
+            x=[rec.x for rec in recs],
+            y=[rec.y for rec in recs],
+            z=[rec.z for rec in recs],
+            r=[rec.r for rec in recs],
+            parent=[rec.parent for rec in recs],
+            line=[rec.line for rec in recs],
+        )
+
+    # ---- Lookups -------------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return int(self.n.size)
+
+    def __contains__(self, n: object) -> bool:
+        try:
+            key = int(n)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return False
+        return bool(self.contains(np.asarray([key]))[0])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SWCTable):
+            return NotImplemented
+        return all(
+            np.array_equal(getattr(self, name), getattr(other, name))
+            for name in ("n", "t", "x", "y", "z", "r", "parent", "line")
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __str__(self) -> str:
+        return f"SWCTable(rows={len(self)})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def contains(self, ids: Iterable[int] | np.ndarray) -> np.ndarray:
+        """Vectorized membership test: boolean array, True where the id exists."""
+        ids = np.asarray(ids, dtype=np.int64)
+        return isin_sorted(ids, self._sorted_ids)
+
+    def rows_of(self, ids: Iterable[int] | np.ndarray) -> np.ndarray:
+        """Return row indices for an array of node ids.
+
+        Raises
+        ------
+        KeyError
+            If any id is not present in the table.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        found = self.contains(ids)
+        if not found.all():
+            missing = ids[~found].reshape(-1)[0]
+            raise KeyError(int(missing))
+        pos = np.searchsorted(self._sorted_ids, ids)
+        return self._order[pos]
+
+    def row_of(self, n: int) -> int:
+        """Return the row index of node id `n` (KeyError if absent)."""
+        return int(self.rows_of(np.asarray([n]))[0])
+
+    def record_at(self, row: int) -> SWCRecord:
+        """Materialize the `SWCRecord` stored at row index `row`."""
+        return SWCRecord(
+            n=int(self.n[row]),
+            t=int(self.t[row]),
+            x=float(self.x[row]),
+            y=float(self.y[row]),
+            z=float(self.z[row]),
+            r=float(self.r[row]),
+            parent=int(self.parent[row]),
+            line=int(self.line[row]),
+        )
+
+    def record(self, n: int) -> SWCRecord:
+        """Materialize the `SWCRecord` for node id `n` (KeyError if absent)."""
+        return self.record_at(self.row_of(n))
+
+    def iter_records(self) -> Iterator[SWCRecord]:
+        """Yield `SWCRecord` objects in row order, one at a time."""
+        for n, t, x, y, z, r, parent, line in zip(
+            self.n.tolist(),
+            self.t.tolist(),
+            self.x.tolist(),
+            self.y.tolist(),
+            self.z.tolist(),
+            self.r.tolist(),
+            self.parent.tolist(),
+            self.line.tolist(),
+        ):
+            yield SWCRecord(n=n, t=t, x=x, y=y, z=z, r=r, parent=parent, line=line)
+
+    def records(self) -> "SWCRecordView":
+        """Return a lazy read-only mapping id -> `SWCRecord` over this table."""
+        return SWCRecordView(self)
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes held by the columns and the id index."""
+        return sum(
+            getattr(self, name).nbytes
+            for name in ("n", "t", "x", "y", "z", "r", "parent", "line", "_order", "_sorted_ids")
+        )
+
+
+class SWCRecordView(Mapping):
+    """Read-only mapping id -> `SWCRecord` backed by an `SWCTable`.
+
+    Records are created on access; nothing is stored per node. Iteration
+    follows file (row) order, matching the historical dict behaviour.
+    """
+
+    __slots__ = ("_table",)
+
+    def __init__(self, table: SWCTable) -> None:
+        self._table = table
+
+    def __getitem__(self, n: int) -> SWCRecord:
+        return self._table.record(n)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._table.n.tolist())
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __contains__(self, n: object) -> bool:
+        return n in self._table
+
+    def values(self) -> "_RecordValues":
+        return _RecordValues(self)
+
+    def items(self) -> "_RecordItems":
+        return _RecordItems(self)
+
+    def __repr__(self) -> str:
+        return f"SWCRecordView(rows={len(self)})"
+
+
+class _RecordValues(ValuesView):
+    def __iter__(self) -> Iterator[SWCRecord]:
+        return self._mapping._table.iter_records()
+
+
+class _RecordItems(ItemsView):
+    def __iter__(self) -> Iterator[Tuple[int, SWCRecord]]:
+        for rec in self._mapping._table.iter_records():
+            yield rec.n, rec
+
+
+@dataclass(frozen=True, init=False)
 class SWCParseResult:
-    """Parsed SWC content."""
+    """Parsed SWC content.
+
+    Rows are held column-wise in `table`; `records` is a lazy id -> `SWCRecord`
+    view over it for code that works with record objects.
+
+    For compatibility with the former record-based layout, the constructor
+    also takes ``records=`` (a mapping of id -> `SWCRecord` or an iterable of
+    records, converted with `SWCTable.from_records`), and a first positional
+    argument that is not an `SWCTable` is treated as records.
+    """
 
-    records: Dict[int, SWCRecord]
+    table: SWCTable
     reconnections: List[Tuple[int, int]]
     comments: List[str]
 
+    def __init__(
+        self,
+        table: Union[SWCTable, Mapping[int, SWCRecord], Iterable[SWCRecord], None] = None,
+        reconnections: Optional[List[Tuple[int, int]]] = None,
+        comments: Optional[List[str]] = None,
+        *,
+        records: Union[Mapping[int, SWCRecord], Iterable[SWCRecord], None] = None,
+    ) -> None:
+        if table is not None and not isinstance(table, SWCTable):
+            if records is not None:
+                raise ValueError("SWCParseResult got records both positionally and as `records=`")
+            table, records = None, table
+        if (table is None) == (records is None):
+            raise ValueError("SWCParseResult takes exactly one of `table` or `records`")
+        if table is None:
+            table = SWCTable.from_records(records)  # type: ignore[arg-type]
+        object.__setattr__(self, "table", table)
+        object.__setattr__(self, "reconnections", list(reconnections or []))
+        object.__setattr__(self, "comments", list(comments or []))
+
+    @property
+    def records(self) -> SWCRecordView:
+        return self.table.records()
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Union[Mapping[int, SWCRecord], Iterable[SWCRecord]],
+        reconnections: Optional[List[Tuple[int, int]]] = None,
+        comments: Optional[List[str]] = None,
+    ) -> "SWCParseResult":
+        """Build a result from record objects (e.g. hand-edited records)."""
+        return cls(
+            table=SWCTable.from_records(records),
+            reconnections=list(reconnections or []),
+            comments=list(comments or []),
+        )
+
     def __str__(self) -> str:
-        return f"SWCParseResult(records={len(self.records)}, reconnections={len(self.reconnections)}, comments={len(self.comments)})"
+        return (
+            f"SWCParseResult(records={len(self.table)}, "
+            f"reconnections={len(self.reconnections)}, comments={len(self.comments)})"
+        )
 
     def __repr__(self) -> str:
         return str(self)
 
 
-# Regex to capture reconnection directives in header comment lines
-_RECONNECT_RE = re.compile(
-    r"^\s*#\s*CYCLE_BREAK\s+reconnect\s+(?P<i>\d+)\s+(?P<j>\d+)\b",
-    re.IGNORECASE,
-)
-
-
 # Public API --------------------------------------------------------------------------------------
 
 
@@ -100,6 +371,8 @@ def parse_swc(
     strict: bool = True,
     validate_reconnections: bool = True,
     float_tol: float = 1e-9,
+    backend: str = "python",
+    cache: Optional["ParseCache"] = None,
 ) -> SWCParseResult:
     """Parse an SWC file or text stream.
 
@@ -114,6 +387,13 @@ def parse_swc(
         If True, ensure reconnection node pairs share identical (x, y, z, r).
     float_tol
         Tolerance used when comparing floating-point coordinates/radii.
+    backend
+        ``"python"`` parses row by row; ``"numpy"`` reads the numeric body in
+        bulk into typed columns and validates with array operations. Both
+        backends produce the same result and the same line-numbered errors.
+    cache
+        Optional `swcviz.cache.ParseCache`. File paths are then served from
+        (and stored into) the on-disk cache; other sources are parsed as usual.
 
     Returns
     -------
@@ -127,87 +407,538 @@ def parse_swc(
     FileNotFoundError
         If a string path is provided that does not exist.
     """
-    records: Dict[int, SWCRecord] = {}
+    if cache is not None:
+        return cache.parse(
+            source,  # type: ignore[arg-type]
+            strict=strict,
+            validate_reconnections=validate_reconnections,
+            float_tol=float_tol,
+            backend=backend,
+        )
+    if backend == "numpy":
+        return _parse_swc_numpy(
+            source,
+            strict=strict,
+            validate_reconnections=validate_reconnections,
+            float_tol=float_tol,
+        )
+    if backend != "python":
+        raise ValueError(
+            f"Unknown parse backend {backend!r}; expected 'python' or 'numpy'"
+        )
+
     comments: List[str] = []
     reconnections: List[Tuple[int, int]] = []
+    # Column buffers plus id -> row index (no per-node record objects)
+    rows: Dict[int, int] = {}
+    ns: List[int] = []
+    ts: List[int] = []
+    xs: List[float] = []
+    ys: List[float] = []
+    zs: List[float] = []
+    rs: List[float] = []
+    parents: List[int] = []
+    lines: List[int] = []
 
     for lineno, raw in _iter_lines(source):
         line = raw.strip()
         if not line:
             continue
         if line.startswith("#"):
-            comments.append(raw.rstrip("\n"))
-            m = _RECONNECT_RE.match(raw)
-            if m:
-                i = int(m.group("i"))
-                j = int(m.group("j"))
-                # Normalize order for stable results
-                a, b = sorted((i, j))
-                reconnections.append((a, b))
+            _collect_comment(raw, comments, reconnections)
             continue
 
-        parts = line.split()
-        if len(parts) < 7:
-            raise ValueError(
-                f"Line {lineno}: expected 7 columns 'n T x y z r parent', got {len(parts)}"
-            )
-        if strict and len(parts) > 7:
-            raise ValueError(
-                f"Line {lineno}: expected exactly 7 columns, got {len(parts)}"
-            )
+        n, t, x, y, z, r, parent = _parse_row(line.split(), lineno, strict)
 
-        try:
-            n = int(_coerce_int(parts[0]))
-            t = int(_coerce_int(parts[1]))
-            x = float(parts[2])
-            y = float(parts[3])
-            z = float(parts[4])
-            r = float(parts[5])
-            parent = int(_coerce_int(parts[6]))
-        except Exception as e:  # noqa: BLE001
-            raise ValueError(f"Line {lineno}: failed to parse values -> {e}") from e
-
-        if n in records:
-            prev = records[n]
+        if n in rows:
             raise ValueError(
-                f"Line {lineno}: duplicate node id {n} (previously defined at line {prev.line})"
+                f"Line {lineno}: duplicate node id {n} (previously defined at line {lines[rows[n]]})"
             )
 
-        records[n] = SWCRecord(n=n, t=t, x=x, y=y, z=z, r=r, parent=parent, line=lineno)
+        rows[n] = len(ns)
+        ns.append(n)
+        ts.append(t)
+        xs.append(x)
+        ys.append(y)
+        zs.append(z)
+        rs.append(r)
+        parents.append(parent)
+        lines.append(lineno)
 
-    # Validation: parent references
-    if strict:
-        for rec in records.values():
-            if rec.parent == -1:
-                continue
-            if rec.parent not in records:
-                raise ValueError(
-                    f"Line {rec.line}: parent id {rec.parent} does not exist for node {rec.n}"
-                )
+    table = SWCTable(n=ns, t=ts, x=xs, y=ys, z=zs, r=rs, parent=parents, line=lines)
+    # Parent references and reconnection xyzr are checked column-wise
+    _check_columns(
+        table,
+        reconnections,
+        strict=strict,
+        validate_reconnections=validate_reconnections,
+        float_tol=float_tol,
+    )
+    return SWCParseResult(table=table, reconnections=reconnections, comments=comments)
 
-    # Validation: reconnections require identical xyzr
-    if validate_reconnections and reconnections:
-        for a, b in reconnections:
-            if a not in records or b not in records:
-                raise ValueError(
-                    f"Reconnection pair ({a}, {b}) refers to undefined node id(s)"
-                )
-            ra, rb = records[a], records[b]
-            if not (
-                _close(ra.x, rb.x, float_tol)
-                and _close(ra.y, rb.y, float_tol)
-                and _close(ra.z, rb.z, float_tol)
-                and _close(ra.r, rb.r, float_tol)
-            ):
+
+async def aparse_swc(
+    source: Union[str, os.PathLike, Iterable[str], io.TextIOBase],
+    *,
+    strict: bool = True,
+    validate_reconnections: bool = True,
+    float_tol: float = 1e-9,
+    backend: str = "python",
+    cache: Optional["ParseCache"] = None,
+    executor: Optional[Executor] = None,
+) -> SWCParseResult:
+    """Asynchronous `parse_swc`: the read and parse run in `executor`.
+
+    The event loop is never blocked. With the default executor (the loop's
+    thread pool) concurrent calls overlap their file reads and
+    decompression; pass a ``ProcessPoolExecutor`` to also run the parsing
+    itself in parallel. The other parameters match `parse_swc`.
+
+    Example
+    -------
+    >>> result = await aparse_swc("data/example.swc")  # doctest: +SKIP
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(
+        parse_swc,
+        source,
+        strict=strict,
+        validate_reconnections=validate_reconnections,
+        float_tol=float_tol,
+        backend=backend,
+        cache=cache,
+    )
+    return await loop.run_in_executor(executor, call)
+
+
+@dataclass(frozen=True)
+class SWCChunk:
+    """A batch of consecutive SWC data rows yielded by `iter_swc_chunks`.
+
+    Attributes
+    ----------
+    table: SWCTable
+        Columns for up to `chunk_rows` rows, in file order.
+    reconnections: List[Tuple[int, int]]
+        `# CYCLE_BREAK reconnect` pairs read since the previous chunk.
+    comments: List[str]
+        Comment/header lines read since the previous chunk.
+    index: int
+        0-based chunk counter.
+    start_row: int
+        Global row index of the first row in `table`.
+    """
+
+    table: SWCTable
+    reconnections: List[Tuple[int, int]]
+    comments: List[str]
+    index: int
+    start_row: int
+
+    def __str__(self) -> str:
+        return f"SWCChunk(index={self.index}, start_row={self.start_row}, rows={len(self.table)})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+def iter_swc_chunks(
+    source: Union[str, os.PathLike, Iterable[str], io.TextIOBase],
+    *,
+    chunk_rows: int = 65536,
+    strict: bool = True,
+) -> Iterator[SWCChunk]:
+    """Stream an SWC source as fixed-size column batches.
+
+    Lines are read lazily and every `chunk_rows` data rows are converted in
+    bulk into an `SWCTable`, so memory stays proportional to the chunk size
+    rather than the file. Header directives and comments are attached to the
+    chunk that follows them; a source with no data rows yields a single
+    empty chunk carrying its comments.
+
+    Only row-level checks (column count, numeric values) are applied, with
+    the same line-numbered errors as `parse_swc`. Checks that need the whole
+    file (duplicate ids, parent references, reconnection coordinates) are
+    left to the consumer.
+
+    Example
+    -------
+    >>> total_r = 0.0
+    >>> for chunk in iter_swc_chunks("big.swc", chunk_rows=1_000_000):
+    ...     total_r += chunk.table.r.sum()
+    """
+    chunk_rows = int(chunk_rows)
+    if chunk_rows < 1:
+        raise ValueError(f"chunk_rows must be >= 1, got {chunk_rows}")
+
+    comments: List[str] = []
+    reconnections: List[Tuple[int, int]] = []
+    body: List[str] = []
+    body_lines: List[int] = []
+    index = 0
+    start_row = 0
+
+    def flush() -> SWCChunk:
+        return SWCChunk(
+            table=columns_from_body(body, body_lines, strict=strict),
+            reconnections=reconnections,
+            comments=comments,
+            index=index,
+            start_row=start_row,
+        )
+
+    for lineno, raw in _iter_lines(source):
+        line = raw.strip()
+        if not line:
+            continue
+        if line[0] == "#":
+            _collect_comment(raw, comments, reconnections)
+            continue
+        body.append(line)
+        body_lines.append(lineno)
+        if len(body) == chunk_rows:
+            yield flush()
+            index += 1
+            start_row += len(body)
+            comments, reconnections, body, body_lines = [], [], [], []
+
+    if body or comments or index == 0:
+        yield flush()
+
+
+def write_swc(
+    data: Union[SWCParseResult, SWCTable, object],
+    dest: Union[str, os.PathLike, io.IOBase],
+    *,
+    precision: Optional[int] = None,
+    comments: Optional[Iterable[str]] = None,
+) -> None:
+    """Write SWC rows to a file or stream.
+
+    Parameters
+    ----------
+    data
+        An `SWCParseResult`, an `SWCTable`, or any object with a
+        `to_parse_result()` method (e.g. `SWCModel`, `GeneralModel`).
+    dest
+        Output path or file-like object. Paths ending in `.gz`, `.bz2` or
+        `.xz` are compressed accordingly.
+    precision
+        Number of decimals for x, y, z, r. ``None`` (default) picks, per
+        column, the fewest decimals that reproduce every value exactly on
+        re-parse (falling back to shortest round-trip `repr`), so
+        ``parse_swc(write_swc(...))`` returns identical columns.
+    comments
+        Header lines to write instead of the ones carried by `data`. Lines
+        are prefixed with ``# `` if needed.
+
+    Notes
+    -----
+    Reconnection pairs of `data` that are not already present as
+    ``# CYCLE_BREAK reconnect i j`` comments are appended to the header.
+    Rows are formatted column-wise into a single byte buffer with array
+    operations (fixed-point digits), not one string per row.
+    """
+    if isinstance(data, SWCTable):
+        result = SWCParseResult(table=data, reconnections=[], comments=[])
+    elif isinstance(data, SWCParseResult):
+        result = data
+    elif hasattr(data, "to_parse_result"):
+        result = data.to_parse_result()  # type: ignore[attr-defined]
+    else:
+        raise TypeError(
+            "write_swc() expects an SWCParseResult, SWCTable, or an object with to_parse_result()"
+        )
+
+    header = _header_lines(
+        result.comments if comments is None else list(comments), result.reconnections
+    )
+    payload = "".join(line + "\n" for line in header).encode("utf-8")
+    payload += _format_rows(result.table, precision)
+
+    if isinstance(dest, (str, os.PathLike)):
+        with open_for_writing(os.fspath(dest)) as f:
+            f.write(payload)
+    elif isinstance(dest, io.TextIOBase):
+        dest.write(payload.decode("utf-8"))
+    else:
+        dest.write(payload)  # type: ignore[union-attr]
+
+
+# Writer ------------------------------------------------------------------------------------------
+
+
+# Largest integer magnitude a float64 represents exactly
+_EXACT_INT = float(2**53)
+
+
+def _header_lines(comments: List[str], reconnections: List[Tuple[int, int]]) -> List[str]:
+    """Comment lines plus directives for reconnections not already present."""
+    lines = [c if c.lstrip().startswith("#") else f"# {c}" for c in comments]
+    present = set()
+    for line in lines:
+        m = RECONNECT_RE.match(line)
+        if m:
+            present.add(tuple(sorted((int(m.group("i")), int(m.group("j"))))))
+    for a, b in reconnections:
+        if tuple(sorted((a, b))) not in present:
+            lines.append(f"# CYCLE_BREAK reconnect {a} {b}")
+    return lines
+
+
+def _format_rows(table: SWCTable, precision: Optional[int]) -> bytes:
+    """Format all rows as ``n T x y z r parent`` lines in one byte buffer.
+
+    Each column is rendered into a (width, rows) uint8 block of ASCII digits
+    with NUL padding; the blocks are stacked with separators, transposed to
+    row-major order, and the NUL bytes are dropped in a single pass.
+    """
+    rows = len(table)
+    if rows == 0:
+        return b""
+    sep = np.full((1, rows), ord(" "), dtype=np.uint8)
+    blocks: List[np.ndarray] = []
+    blocks += _int_field(table.n)
+    blocks.append(sep)
+    blocks += _int_field(table.t.astype(np.int64))
+    for col in (table.x, table.y, table.z, table.r):
+        blocks.append(sep)
+        blocks += _float_field(col, precision)
+    blocks.append(sep)
+    blocks += _int_field(table.parent)
+    blocks.append(np.full((1, rows), ord("\n"), dtype=np.uint8))
+    flat = np.concatenate(blocks, axis=0).T.ravel()
+    return flat[flat != 0].tobytes()
+
+
+def _float_field(x: np.ndarray, precision: Optional[int]) -> List[np.ndarray]:
+    """Render a float column as fixed-point digits, or via `repr` when that is not exact."""
+    finite = bool(np.isfinite(x).all())
+    amax = float(np.abs(x).max()) if finite else 0.0
+    if precision is None:
+        if finite:
+            for p in range(0, 16):
+                if amax * 10.0**p >= _EXACT_INT:
+                    break
+                k = np.rint(x * 10.0**p)
+                if np.array_equal(k / 10.0**p, x):
+                    return _int_field(k.astype(np.int64), decimals=p, neg=np.signbit(x))
+        text = np.array([repr(v) for v in x.tolist()], dtype=np.bytes_)
+    else:
+        p = max(0, int(precision))
+        if finite and amax * 10.0**p < _EXACT_INT:
+            y = x * 10.0**p
+            k = np.rint(y)
+            # `y` carries the rounding error of the product, so rows within that
+            # error of a tie may round differently from f-format (which rounds the
+            # exact binary value); take the digits of those rows from f-format
+            near = np.abs(np.abs(y - k) - 0.5) <= np.maximum(np.abs(y), 1.0) * 2.0**-50
+            k = k.astype(np.int64)
+            for row in np.flatnonzero(near).tolist():
+                k[row] = int(f"{x[row]:.{p}f}".replace(".", ""))
+            return _int_field(k, decimals=p, neg=np.signbit(x))
+        text = np.array([f"{v:.{p}f}" for v in x.tolist()], dtype=np.bytes_)
+    # NUL-padded fixed-width byte strings -> (width, rows) block
+    return [text.view(np.uint8).reshape(x.size, -1).T]
+
+
+def _int_field(k: np.ndarray, decimals: int = 0, neg: Optional[np.ndarray] = None) -> List[np.ndarray]:
+    """Render int64 values as ASCII digit blocks, optionally with a decimal point.
+
+    With `decimals > 0` the value is interpreted as ``k / 10**decimals``.
+    Leading zeros become NUL (dropped later); at least one digit is kept
+    before the decimal point. `neg` marks the rows written with a minus sign
+    (default ``k < 0``), so negative values that round to zero keep it.
+    """
+    size = k.size
+    neg = k < 0 if neg is None else neg
+    a = np.abs(k)
+    width = max(decimals + 1, len(str(int(a.max()))))
+    digits = np.empty((width, size), dtype=np.uint8)
+    v = a
+    for j in range(width - 1, -1, -1):
+        v, rem = np.divmod(v, 10)
+        digits[j] = rem
+    head = digits[: width - decimals - 1]
+    lead = np.logical_and.accumulate(head == 0, axis=0)
+    digits += ord("0")
+    head[lead] = 0
+
+    parts = [digits]
+    if decimals > 0:
+        dot = np.full((1, size), ord("."), dtype=np.uint8)
+        parts = [digits[: width - decimals], dot, digits[width - decimals :]]
+    if neg.any():
+        block = np.concatenate([np.zeros((1, size), dtype=np.uint8)] + parts, axis=0)
+        rows = np.flatnonzero(neg)
+        # The sign goes right before the first significant digit
+        block[lead.sum(axis=0)[rows], rows] = ord("-")
+        return [block]
+    return parts
+
+
+# NumPy backend -----------------------------------------------------------------------------------
+
+
+def _parse_swc_numpy(
+    source: Union[str, os.PathLike, Iterable[str], io.TextIOBase],
+    *,
+    strict: bool,
+    validate_reconnections: bool,
+    float_tol: float,
+) -> SWCParseResult:
+    """Bulk-parse an SWC source into an `SWCTable` and validate it with array operations."""
+    comments, reconnections, body, body_lines = split_source(source)
+    table = columns_from_body(body, body_lines, strict=strict)
+    _check_columns(
+        table,
+        reconnections,
+        strict=strict,
+        validate_reconnections=validate_reconnections,
+        float_tol=float_tol,
+    )
+    return SWCParseResult(table=table, reconnections=reconnections, comments=comments)
+
+
+def split_source(
+    source: Union[str, os.PathLike, Iterable[str], io.TextIOBase],
+) -> Tuple[List[str], List[Tuple[int, int]], List[str], List[int]]:
+    """Split a source into (comments, reconnections, stripped data rows, their line numbers).
+
+    Together with `columns_from_body` this is the NumPy backend's reader;
+    `swcviz.validate` uses both to load a file without failing fast. Not
+    exported from the package.
+    """
+    comments: List[str] = []
+    reconnections: List[Tuple[int, int]] = []
+    body: List[str] = []
+    body_lines: List[int] = []
+
+    for lineno, raw in _iter_lines(source):
+        line = raw.strip()
+        if not line:
+            continue
+        if line[0] == "#":
+            _collect_comment(raw, comments, reconnections)
+            continue
+        body.append(line)
+        body_lines.append(lineno)
+    return comments, reconnections, body, body_lines
+
+
+# One SWC data row; integer columns are parsed as integers, never via float64
+_ROW_DTYPE = np.dtype(
+    [
+        ("n", np.int64),
+        ("t", np.int64),
+        ("x", np.float64),
+        ("y", np.float64),
+        ("z", np.float64),
+        ("r", np.float64),
+        ("parent", np.int64),
+    ]
+)
+
+
+def columns_from_body(
+    body: List[str],
+    body_lines: List[int],
+    *,
+    strict: bool,
+    errors: Optional[List[Tuple[int, str]]] = None,
+) -> SWCTable:
+    """Convert stripped data rows into typed columns.
+
+    The rows are handed to NumPy's C tokenizer in one call, with n, T and
+    parent read as int64 so ids stay exact and tokens such as ``1e1`` or
+    ``3.00`` are not taken as integers. If it rejects the input, the rows are
+    re-scanned with `_parse_row` (which also accepts ``3.0``-style ids) so
+    the result and any error match the Python backend. If an `errors` list
+    is given, malformed rows are appended to it as (line, message) and
+    dropped instead of raising.
+    """
+    lines = np.asarray(body_lines, dtype=np.int64)
+    if not body:
+        return SWCTable(n=[], t=[], x=[], y=[], z=[], r=[], parent=[], line=lines)
+
+    try:
+        data = np.loadtxt(
+            body,
+            dtype=_ROW_DTYPE,
+            comments=None,
+            ndmin=1,
+            usecols=None if strict else range(7),
+        )
+    except ValueError:
+        data = None
+    if data is None:
+        data, lines = _rescan_body(body, body_lines, strict=strict, errors=errors)
+
+    return SWCTable(
+        n=np.ascontiguousarray(data["n"]),
+        t=data["t"].astype(np.int32),
+        x=np.ascontiguousarray(data["x"]),
+        y=np.ascontiguousarray(data["y"]),
+        z=np.ascontiguousarray(data["z"]),
+        r=np.ascontiguousarray(data["r"]),
+        parent=np.ascontiguousarray(data["parent"]),
+        line=lines,
+    )
+
+
+def _rescan_body(
+    body: List[str],
+    body_lines: List[int],
+    *,
+    strict: bool,
+    errors: Optional[List[Tuple[int, str]]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Row-by-row fallback that raises the same first error as the Python backend.
+
+    With an `errors` list, bad rows are recorded and skipped (duplicates are
+    left to the validator). Returns the rows as a `_ROW_DTYPE` array and their
+    line numbers.
+    """
+    seen: Dict[int, int] = {}
+    rows = []
+    kept: List[int] = []
+    for line, lineno in zip(body, body_lines):
+        try:
+            row = _parse_row(line.split(), lineno, strict)
+        except ValueError as e:
+            if errors is None:
+                raise
+            errors.append((lineno, str(e)))
+            continue
+        if errors is None:
+            if row[0] in seen:
                 raise ValueError(
-                    "Reconnection requires identical (x, y, z, r) but got:\n"
-                    f"  {a}: (x={ra.x}, y={ra.y}, z={ra.z}, r={ra.r})\n"
-                    f"  {b}: (x={rb.x}, y={rb.y}, z={rb.z}, r={rb.r})"
+                    f"Line {lineno}: duplicate node id {row[0]} (previously defined at line {seen[row[0]]})"
                 )
+            seen[row[0]] = lineno
+        rows.append(row)
+        kept.append(lineno)
+    return np.array(rows, dtype=_ROW_DTYPE).reshape(-1), np.asarray(kept, dtype=np.int64)
 
-    return SWCParseResult(
-        records=records, reconnections=reconnections, comments=comments
-    )
+
+def _check_columns(
+    cols: SWCTable,
+    reconnections: List[Tuple[int, int]],
+    *,
+    strict: bool,
+    validate_reconnections: bool,
+    float_tol: float,
+) -> None:
+    """Fail-fast validation used by `parse_swc` (see `swcviz.validate`)."""
+    # Imported here: swcviz.validate builds on this module
+    from .validate import validate_table
+
+    checks = ["duplicate_id"]
+    if strict:
+        checks.append("missing_parent")
+    if validate_reconnections:
+        checks.append("reconnection")
+    validate_table(cols, reconnections, checks=checks, float_tol=float_tol, fail_fast=True)
 
 
 # Helpers -----------------------------------------------------------------------------------------
@@ -218,7 +949,8 @@ def _iter_lines(
 ) -> Iterator[Tuple[int, str]]:
     """Yield (1-based line number, line) from various sources.
 
-    - Path-like or existing string path -> open and read
+    - Path-like or existing string path -> open and read (gzip/bz2/xz
+      files are decompressed on the fly, see `open_text`)
     - File-like object -> iterate its lines
     - Iterable of strings -> iterate
     - Other strings -> treat as content string
@@ -227,7 +959,7 @@ def _iter_lines(
     if isinstance(source, (str, os.PathLike)):
         path_str = os.fspath(source)
         if os.path.exists(path_str):
-            with open(path_str, "r", encoding="utf-8") as f:
+            with open_text(path_str) as f:
                 for i, line in enumerate(f, start=1):
                     yield i, line
             return
@@ -257,8 +989,44 @@ def _iter_lines(
             yield i, line
 
 
-def _close(a: float, b: float, tol: float) -> bool:
-    return isclose(a, b, rel_tol=0.0, abs_tol=tol)
+def _collect_comment(
+    raw: str, comments: List[str], reconnections: List[Tuple[int, int]]
+) -> None:
+    """Record a header/comment line and any reconnection directive it carries."""
+    comments.append(raw.rstrip("\n"))
+    m = RECONNECT_RE.match(raw)
+    if m:
+        i = int(m.group("i"))
+        j = int(m.group("j"))
+        # Normalize order for stable results
+        a, b = sorted((i, j))
+        reconnections.append((a, b))
+
+
+def _parse_row(
+    parts: List[str], lineno: int, strict: bool
+) -> Tuple[int, int, float, float, float, float, int]:
+    """Convert one split data row into (n, t, x, y, z, r, parent)."""
+    if len(parts) < 7:
+        raise ValueError(
+            f"Line {lineno}: expected 7 columns 'n T x y z r parent', got {len(parts)}"
+        )
+    if strict and len(parts) > 7:
+        raise ValueError(
+            f"Line {lineno}: expected exactly 7 columns, got {len(parts)}"
+        )
+
+    try:
+        n = int(_coerce_int(parts[0]))
+        t = int(_coerce_int(parts[1]))
+        x = float(parts[2])
+        y = float(parts[3])
+        z = float(parts[4])
+        r = float(parts[5])
+        parent = int(_coerce_int(parts[6]))
+    except Exception as e:  # noqa: BLE001
+        raise ValueError(f"Line {lineno}: failed to parse values -> {e}") from e
+    return n, t, x, y, z, r, parent
 
 
 def _coerce_int(value: str) -> int:
@@ -277,6 +1045,12 @@ def _coerce_int(value: str) -> int:
 
 __all__ = [
     "SWCRecord",
+    "SWCTable",
+    "SWCRecordView",
     "SWCParseResult",
+    "SWCChunk",
     "parse_swc",
+    "aparse_swc",
+    "iter_swc_chunks",
+    "write_swc",
 ]
@@ -12,18 +12,43 @@ Notes
 
 from __future__ import annotations
 
-from typing import Iterable, Mapping, Any
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+import asyncio
+import functools
+import gc
+import json
 import os
 import networkx as nx
+import numpy as np
 
-from .io import SWCRecord, SWCParseResult, parse_swc
+from .ancestors import AncestorIndex
+from .sections import SectionIndex
+from .spatial import SpatialIndex
+from ._util import (
+    RECONNECT_RE,
+    DisjointSet,
+    bfs_forest,
+    component_labels,
+    read_arrays,
+    read_meta,
+    write_arrays,
+)
+from .arrays import MorphologyArrays
+from .io import SWCRecord, SWCParseResult, SWCTable, parse_swc, aparse_swc, write_swc
+from .reconnect import with_reconnections
+from .cache import ParseCache
+from .validate import validate_table
 
 
 # ----------------------------------------------------------------------------------------------
 # Graph attribute computation
 # ----------------------------------------------------------------------------------------------
-def _graph_attributes(G: nx.Graph | nx.DiGraph) -> dict[str, Any]:
-    """Compute generic attributes for a graph.
+def _graph_attributes(G: nx.Graph | nx.DiGraph | MorphologyArrays) -> dict[str, Any]:
+    """Compute generic attributes for a graph or `MorphologyArrays`.
 
     Returns a dictionary including:
     - graph_type: "DiGraph" or "Graph"
@@ -39,43 +64,395 @@ def _graph_attributes(G: nx.Graph | nx.DiGraph) -> dict[str, Any]:
     - leaves_count: int (DiGraph: out-degree == 0; Graph: degree == 1)
     - self_loops: int
     - density: float (on undirected view)
+
+    Everything is derived from one edge array (row indices) via degree
+    counts and array component labels; the graph is never copied.
     """
-    directed = G.is_directed()
-    U = G.to_undirected()
+    if isinstance(G, MorphologyArrays):
+        return _edge_metrics(len(G), G.edges, G.directed, "MorphologyArrays")
+    index = dict(zip(G, range(len(G))))
+    edges = np.fromiter(
+        (index[n] for e in G.edges() for n in e[:2]),
+        dtype=np.int64,
+        count=2 * G.number_of_edges(),
+    ).reshape(-1, 2)
+    return _edge_metrics(len(index), edges, G.is_directed(), type(G).__name__)
+
 
-    nodes = G.number_of_nodes()
-    edges = G.number_of_edges()
-    components = nx.number_connected_components(U)
-    cycles = U.number_of_edges() - U.number_of_nodes() + components
+def _edge_metrics(size: int, edges: np.ndarray, directed: bool, graph_type: str) -> dict[str, Any]:
+    """`_graph_attributes` from an ``(E, 2)`` array of row indices."""
+    if directed and edges.size:
+        # Reciprocal pairs u->v, v->u are one edge in the undirected view
+        lo, hi = edges.min(axis=1), edges.max(axis=1)
+        undirected_edges = int(np.unique(lo * size + hi).size)
+    else:
+        undirected_edges = int(edges.shape[0])
+    components = int(np.count_nonzero(component_labels(size, edges) == np.arange(size)))
 
     if directed:
-        branch_points = [n for n in G.nodes if G.out_degree(n) > 1]
-        roots = [n for n in G.nodes if G.in_degree(n) == 0]
-        leaves = [n for n in G.nodes if G.out_degree(n) == 0]
-        roots_count: int | None = len(roots)
+        out_deg = np.bincount(edges[:, 0], minlength=size)
+        in_deg = np.bincount(edges[:, 1], minlength=size)
+        branch_points = int(np.count_nonzero(out_deg > 1))
+        roots_count: int | None = int(np.count_nonzero(in_deg == 0))
+        leaves = int(np.count_nonzero(out_deg == 0))
     else:
-        branch_points = [n for n in G.nodes if G.degree(n) > 2]
+        degree = np.bincount(edges.ravel(), minlength=size)
+        branch_points = int(np.count_nonzero(degree > 2))
         roots_count = None
-        leaves = [n for n in G.nodes if G.degree(n) == 1]
-
-    self_loops = nx.number_of_selfloops(G)
-    density = nx.density(U)
+        leaves = int(np.count_nonzero(degree == 1))
 
     return {
-        "graph_type": type(G).__name__,
+        "graph_type": graph_type,
         "directed": directed,
-        "nodes": nodes,
-        "edges": edges,
+        "nodes": size,
+        "edges": int(edges.shape[0]),
         "components": components,
-        "cycles": int(cycles),
-        "branch_points_count": len(branch_points),
+        "cycles": int(undirected_edges - size + components),
+        "branch_points_count": branch_points,
         "roots_count": roots_count,
-        "leaves_count": len(leaves),
-        "self_loops": int(self_loops),
-        "density": float(density),
+        "leaves_count": leaves,
+        "self_loops": int(np.count_nonzero(edges[:, 0] == edges[:, 1])),
+        "density": float(2.0 * undirected_edges / (size * (size - 1))) if size > 1 else 0.0,
+    }
+
+
+# networkx clears `G.__networkx_cache__` on every structural mutation
+_ATTRIBUTES_CACHE_KEY = "swcviz_graph_attributes"
+_ANCESTORS_CACHE_KEY = "swcviz_ancestor_index"
+_SECTIONS_CACHE_KEY = "swcviz_section_index"
+_SPATIAL_CACHE_KEY = "swcviz_spatial_index"
+
+
+def _cached_section_index(G: nx.Graph) -> SectionIndex:
+    """`SectionIndex` of the graph's arrays, memoized in its networkx cache.
+
+    Rows follow node order, as in `to_arrays()`; the index depends only on
+    the structure, so attribute edits keep it valid.
+    """
+    cache = G.__networkx_cache__
+    index = cache.get(_SECTIONS_CACHE_KEY)
+    if index is None:
+        index = cache[_SECTIONS_CACHE_KEY] = SectionIndex.from_arrays(MorphologyArrays.from_graph(G))
+    return index
+
+
+def _cached_graph_attributes(G: nx.Graph) -> dict[str, Any]:
+    """`_graph_attributes` memoized in the graph's networkx cache."""
+    cache = getattr(G, "__networkx_cache__", None)
+    if cache is None:
+        return _graph_attributes(G)
+    info = cache.get(_ATTRIBUTES_CACHE_KEY)
+    if info is None:
+        info = cache[_ATTRIBUTES_CACHE_KEY] = _graph_attributes(G)
+    return dict(info)
+
+
+def _node_geometry(G: nx.Graph, keys: tuple[str, ...] = ("x", "y", "z", "r")) -> np.ndarray:
+    """``(N, len(keys))`` snapshot of the given numeric node attributes, in node order.
+
+    Cached indexes store this snapshot and compare it on every lookup, since
+    attribute edits do not clear the networkx cache. A cache hit therefore
+    still costs one ``O(N)`` pass over the node dicts (about 0.04 s per 200k
+    nodes, against several tenths of a second to rebuild an index).
+    """
+    values = chain.from_iterable(map(itemgetter(*keys), G._node.values()))
+    return np.fromiter(values, dtype=np.float64, count=len(keys) * G.number_of_nodes()).reshape(
+        -1, len(keys)
+    )
+
+
+def _cached_spatial_index(G: nx.Graph, kind: str) -> SpatialIndex:
+    """Node or segment `SpatialIndex`, memoized in the graph's networkx cache.
+
+    Structural edits clear the cache; a snapshot of the coordinates (and,
+    for segments, the radii) is compared on every call so their edits
+    rebuild it too. That check makes a cache hit ``O(N)``, see `_node_geometry`.
+    """
+    if kind not in ("nodes", "segments"):
+        raise ValueError(f"kind must be 'nodes' or 'segments', got {kind!r}")
+    geometry = _node_geometry(G, ("x", "y", "z") if kind == "nodes" else ("x", "y", "z", "r"))
+    entries = G.__networkx_cache__.setdefault(_SPATIAL_CACHE_KEY, {})
+    entry = entries.get(kind)
+    if entry is not None and np.array_equal(entry[0], geometry, equal_nan=True):
+        return entry[1]
+    arrays = MorphologyArrays.from_graph(G)
+    if kind == "nodes":
+        index = SpatialIndex.from_points(arrays.xyz, keys=arrays.ids)
+    else:
+        u, v = arrays.edges[:, 0], arrays.edges[:, 1]
+        index = SpatialIndex(
+            arrays.xyz[u], arrays.xyz[v], arrays.r[u], arrays.r[v], keys=arrays.edge_ids()
+        )
+    entries[kind] = (geometry, index)
+    return index
+
+
+def _merged_nodes(
+    table: SWCTable, rep: np.ndarray, *, provenance: bool
+) -> Iterable[tuple[int, dict[str, Any]]]:
+    """(representative, attrs) per merge group, in order of first appearance.
+
+    Attributes come from the smallest id of each group; with `provenance`
+    the sorted member ids and source lines are attached as lists.
+    """
+    if not len(table):
+        return []
+    by_id = np.lexsort((table.n, rep))
+    grouped = rep[by_id]
+    start = np.flatnonzero(np.r_[True, grouped[1:] != grouped[:-1]])
+    end = np.r_[start[1:], by_id.size]
+    # Emit groups in the order their first row appears in the table
+    groups = np.argsort(np.minimum.reduceat(by_id, start), kind="stable")
+    rows = by_id[start][groups]
+    keys = grouped[start][groups].tolist()
+    attrs = [
+        {"n": n, "x": x, "y": y, "z": z, "r": r, "t": t}
+        for n, x, y, z, r, t in zip(
+            table.n[rows].tolist(),
+            table.x[rows].tolist(),
+            table.y[rows].tolist(),
+            table.z[rows].tolist(),
+            table.r[rows].tolist(),
+            table.t[rows].tolist(),
+        )
+    ]
+    if provenance:
+        ids = table.n[by_id].tolist()
+        by_line = table.line[np.lexsort((table.line, rep))].tolist()
+        for a, lo, hi in zip(attrs, start[groups].tolist(), end[groups].tolist()):
+            a["merged_ids"] = ids[lo:hi]
+            a["lines"] = by_line[lo:hi]
+    return zip(keys, attrs)
+
+
+def _table_from_nodes(G: nx.Graph, ids: list[int], parents: list[int]) -> SWCTable:
+    """Gather node attributes for `ids` (with matching `parents`) into an `SWCTable`."""
+    nodes = G.nodes
+    attrs = [nodes[n] for n in ids]
+    return SWCTable(
+        n=ids,
+        t=[a.get("t", 0) for a in attrs],
+        x=[a["x"] for a in attrs],
+        y=[a["y"] for a in attrs],
+        z=[a["z"] for a in attrs],
+        r=[a["r"] for a in attrs],
+        parent=parents,
+        line=[a.get("line", 0) for a in attrs],
+    )
+
+
+# ---- Compact model files ------------------------------------------------------------------------
+
+_MODEL_FORMAT = "swcviz.GeneralModel"
+_MODEL_VERSION = 1
+_MODEL_ARRAYS = (
+    "nodes", "flags", "t", "x", "y", "z", "r", "line",
+    "merged_offsets", "merged_ids", "lines_offsets", "lines", "edges", "parent",
+)
+_MODEL_ATTRS = {"n", "t", "x", "y", "z", "r", "line", "merged_ids", "lines"}
+# Per-node bits recording which optional attributes are present
+_HAS_N, _HAS_T, _HAS_XYZR, _HAS_LINE, _HAS_MERGED, _HAS_LINES = (1 << k for k in range(6))
+
+
+def _node_flags(keys: frozenset) -> int:
+    """`_HAS_*` bits for one set of node attribute names."""
+    extra = keys - _MODEL_ATTRS
+    if extra:
+        raise ValueError(
+            f"Cannot save node attribute(s) {sorted(extra)}; supported: {sorted(_MODEL_ATTRS)}"
+        )
+    geometry = keys & {"x", "y", "z", "r"}
+    if geometry and len(geometry) < 4:
+        raise ValueError("Nodes must define all or none of x, y, z, r")
+    bits = (
+        (_HAS_N, "n"),
+        (_HAS_T, "t"),
+        (_HAS_XYZR, "x"),
+        (_HAS_LINE, "line"),
+        (_HAS_MERGED, "merged_ids"),
+        (_HAS_LINES, "lines"),
+    )
+    return sum(bit for bit, name in bits if name in keys)
+
+
+def _model_arrays(G: nx.Graph) -> dict[str, np.ndarray]:
+    """Node columns, provenance CSR arrays, edge index and spanning forest of `G`."""
+    keys = list(G._node)
+    attrs = list(G._node.values())
+    size = len(attrs)
+    row_of = {n: k for k, n in enumerate(keys)}
+    nodes = np.fromiter(keys, dtype=np.int64, count=size)
+
+    kinds: dict[frozenset, int] = {}
+    flags = np.empty(size, dtype=np.uint8)
+    for k, a in enumerate(attrs):
+        names = frozenset(a)
+        f = kinds.get(names)
+        flags[k] = f if f is not None else kinds.setdefault(names, _node_flags(names))
+
+    t = np.zeros(size, dtype=np.int32)
+    xyzr = np.full((size, 4), np.nan)
+    line = np.zeros(size, dtype=np.int64)
+    merged: list[Any] = [()] * size
+    lines: list[Any] = [()] * size
+    # Columns are gathered per combination of present attributes
+    for f in set(kinds.values()):
+        rows = np.flatnonzero(flags == f)
+        sub = attrs if rows.size == size else [attrs[k] for k in rows.tolist()]
+        if f & _HAS_N and (np.fromiter(map(itemgetter("n"), sub), dtype=np.int64) != nodes[rows]).any():
+            raise ValueError("Cannot save nodes whose 'n' attribute differs from the node key")
+        if f & _HAS_XYZR:
+            xyzr[rows] = np.array(list(map(itemgetter("x", "y", "z", "r"), sub)), dtype=np.float64)
+        if f & _HAS_T:
+            t[rows] = np.fromiter(map(itemgetter("t"), sub), dtype=np.int32, count=rows.size)
+        if f & _HAS_LINE:
+            line[rows] = np.fromiter(map(itemgetter("line"), sub), dtype=np.int64, count=rows.size)
+        for bit, name, out in ((_HAS_MERGED, "merged_ids", merged), (_HAS_LINES, "lines", lines)):
+            if f & bit:
+                for k, values in zip(rows.tolist(), map(itemgetter(name), sub)):
+                    out[k] = values
+
+    # Edges (in `G.edges()` order) and the BFS spanning forest of `to_arrays`
+    adj = G._adj
+    if any(d for nbrs in adj.values() for d in nbrs.values()):
+        raise ValueError("Cannot save edge attributes")
+    edges = np.fromiter(
+        (
+            x
+            for u, nbrs in adj.items()
+            for v in nbrs
+            if row_of[v] >= row_of[u]
+            for x in (row_of[u], row_of[v])
+        ),
+        dtype=np.int64,
+    ).reshape(-1, 2)
+    _, parent_of = bfs_forest(adj, keys)
+    parent = np.fromiter((row_of.get(parent_of[n], -1) for n in keys), dtype=np.int64, count=size)
+    merged_offsets, merged_ids = _csr(merged)
+    lines_offsets, line_lists = _csr(lines)
+    return {
+        "nodes": nodes,
+        "flags": flags,
+        "t": t,
+        "x": xyzr[:, 0].copy(),
+        "y": xyzr[:, 1].copy(),
+        "z": xyzr[:, 2].copy(),
+        "r": xyzr[:, 3].copy(),
+        "line": line,
+        "merged_offsets": merged_offsets,
+        "merged_ids": merged_ids,
+        "lines_offsets": lines_offsets,
+        "lines": line_lists,
+        "edges": edges,
+        "parent": parent,
     }
 
 
+def _csr(lists: list[Any]) -> tuple[np.ndarray, np.ndarray]:
+    """Offsets and concatenated values of a list of int sequences."""
+    offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, lists), dtype=np.int64, count=len(lists)), out=offsets[1:])
+    values = np.fromiter(chain.from_iterable(lists), dtype=np.int64, count=int(offsets[-1]))
+    return offsets, values
+
+
+def _narrow(arrays: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Store int64 arrays as int32 where every value fits (loads widen on use)."""
+    info = np.iinfo(np.int32)
+    return {
+        k: a.astype(np.int32)
+        if a.dtype == np.int64 and (not a.size or (a.min() >= info.min and a.max() <= info.max))
+        else a
+        for k, a in arrays.items()
+    }
+
+
+def _read_model(path: str | os.PathLike[str], *, mmap: bool) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    """Metadata and arrays of a directory written by `GeneralModel.save`."""
+    path = os.fspath(path)
+    try:
+        meta = read_meta(path)
+    except (OSError, ValueError) as exc:
+        raise ValueError(f"{path!r} is not a saved GeneralModel: {exc}") from exc
+    if meta.get("format") != _MODEL_FORMAT or meta.get("version") != _MODEL_VERSION:
+        raise ValueError(
+            f"{path!r} has format {meta.get('format')!r} version {meta.get('version')!r}; "
+            f"expected {_MODEL_FORMAT!r} version {_MODEL_VERSION}"
+        )
+    return meta, read_arrays(path, _MODEL_ARRAYS, mmap=mmap)
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Suspend the cyclic garbage collector, which would otherwise rescan the
+    growing graph many times while millions of small dicts are allocated."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _fill_graph(
+    G: nx.Graph, nodes: Iterable[tuple[Any, dict[str, Any]]], edges: Iterable[Sequence[Any]]
+) -> None:
+    """Add `nodes` (``(id, attrs)`` pairs) and attribute-less `edges` to the
+    empty undirected graph `G`.
+
+    Equivalent to ``G.add_nodes_from(nodes); G.add_edges_from(edges)`` but
+    about twice as fast on large models: it writes networkx's adjacency
+    storage directly instead of going through the per-item checks and attr
+    copies of the public methods. This relies on the ``nx.Graph`` layout
+    used by every networkx 3.x release (``G._node[n]`` is the node's attr
+    dict, the adopted `nodes` dicts are kept as-is, and ``G._adj[u][v]`` is
+    one data dict per edge shared by both directions); it is the only place
+    in swcviz that touches that layout and `tests/test_model.py` checks it
+    against the public methods.
+    """
+    if G.is_directed() or G.is_multigraph() or len(G):
+        raise ValueError("_fill_graph expects an empty undirected simple graph")
+    node, adj = G._node, G._adj
+    for n, attrs in nodes:
+        node[n] = attrs
+        adj[n] = {}
+    for u, v in edges:
+        adj[u][v] = adj[v][u] = {}
+    nx._clear_cache(G)
+
+
+def _node_attrs(arrays: dict[str, np.ndarray]) -> list[dict[str, Any]]:
+    """Rebuild node attribute dicts (in node order) from `_model_arrays` output."""
+    flags = np.asarray(arrays["flags"])
+    out: list[dict[str, Any]] = [{} for _ in range(flags.size)]
+    # One pass per combination of present attributes (usually a single one)
+    for f in np.unique(flags).tolist():
+        rows = np.flatnonzero(flags == f)
+        names: list[str] = []
+        columns: list[list[Any]] = []
+        scalars = (
+            (_HAS_N, ("nodes",)),
+            (_HAS_XYZR, ("x", "y", "z", "r")),
+            (_HAS_T, ("t",)),
+            (_HAS_LINE, ("line",)),
+        )
+        for bit, keys in scalars:
+            if f & bit:
+                names += ["n" if k == "nodes" else k for k in keys]
+                columns += [np.asarray(arrays[k])[rows].tolist() for k in keys]
+        lists = ((_HAS_MERGED, "merged_ids", "merged_offsets"), (_HAS_LINES, "lines", "lines_offsets"))
+        for bit, key, offsets in lists:
+            if f & bit:
+                values = np.asarray(arrays[key]).tolist()
+                off = np.asarray(arrays[offsets])
+                names.append(key)
+                columns.append([values[lo:hi] for lo, hi in zip(off[rows].tolist(), off[rows + 1].tolist())])
+        for k, values in zip(rows.tolist(), zip(*columns)):
+            out[k] = dict(zip(names, values))
+    return out
+
+
 class SWCModel(nx.DiGraph):
     """Directed SWC morphology graph.
 
@@ -97,8 +474,46 @@ class SWCModel(nx.DiGraph):
     # ----------------------------------------------------------------------------------------------
     @classmethod
     def from_parse_result(cls, result: SWCParseResult) -> "SWCModel":
-        """Build a model from a parsed SWC result."""
-        return cls.from_records(result.records)
+        """Build a model from a parsed SWC result.
+
+        Header comments and reconnection pairs are kept in `model.graph`
+        (keys ``"comments"`` and ``"reconnections"``) so `to_swc` can write
+        them back.
+        """
+        model = cls.from_table(result.table)
+        model.graph["comments"] = list(result.comments)
+        model.graph["reconnections"] = list(result.reconnections)
+        return model
+
+    @classmethod
+    def from_table(cls, table: SWCTable) -> "SWCModel":
+        """Build a model directly from the columns of an `SWCTable`."""
+        model = cls()
+        ns = table.n.tolist()
+        model.add_nodes_from(
+            (n, {"t": t, "x": x, "y": y, "z": z, "r": r, "line": line})
+            for n, t, x, y, z, r, line in zip(
+                ns,
+                table.t.tolist(),
+                table.x.tolist(),
+                table.y.tolist(),
+                table.z.tolist(),
+                table.r.tolist(),
+                table.line.tolist(),
+            )
+        )
+        model.add_edges_from(
+            (p, n) for n, p in zip(ns, table.parent.tolist()) if p != -1
+        )
+        return model
+
+    @classmethod
+    def from_arrays(cls, arrays: MorphologyArrays) -> "SWCModel":
+        """Build a model from `MorphologyArrays` (edges taken as parent -> child)."""
+        model = cls()
+        model.add_nodes_from(arrays._node_items())
+        model.add_edges_from(arrays.edge_ids().tolist())
+        return model
 
     @classmethod
     def from_records(
@@ -107,33 +522,10 @@ class SWCModel(nx.DiGraph):
         """Build a model from SWC records.
 
         Accepts either a mapping of id->record or any iterable of SWCRecord.
+        The records are gathered into columns and inserted in bulk (see
+        `from_table`).
         """
-        model = cls()
-
-        # Materialize to a list once so we can iterate twice safely
-        if isinstance(records, Mapping):
-            rec_values = list(records.values())
-        else:
-            rec_values = list(records)
-
-        # First pass: add all nodes with attributes
-        for rec in rec_values:
-            model.add_node(
-                rec.n,
-                t=rec.t,
-                x=rec.x,
-                y=rec.y,
-                z=rec.z,
-                r=rec.r,
-                line=rec.line,
-            )
-
-        # Second pass: add edges parent -> child
-        for rec in rec_values:
-            if rec.parent != -1:
-                model.add_edge(rec.parent, rec.n)
-
-        return model
+        return cls.from_table(SWCTable.from_records(records))
 
     @classmethod
     def from_swc_file(
@@ -143,20 +535,55 @@ class SWCModel(nx.DiGraph):
         strict: bool = True,
         validate_reconnections: bool = True,
         float_tol: float = 1e-9,
+        backend: str = "python",
+        cache: ParseCache | None = None,
     ) -> "SWCModel":
         """Parse an SWC source then build a model.
 
         The `source` is passed through to `parse_swc`, which supports a path,
         a file-like object, a string with the full contents, or an iterable of lines.
+        `backend` selects the parser and `cache` (a `ParseCache`) serves file
+        paths from the on-disk parse cache.
         """
         result = parse_swc(
             source,
             strict=strict,
             validate_reconnections=validate_reconnections,
             float_tol=float_tol,
+            backend=backend,
+            cache=cache,
         )
         return cls.from_parse_result(result)
 
+    @classmethod
+    async def afrom_swc_file(
+        cls,
+        source: str | os.PathLike[str] | Iterable[str],
+        *,
+        strict: bool = True,
+        validate_reconnections: bool = True,
+        float_tol: float = 1e-9,
+        backend: str = "python",
+        cache: ParseCache | None = None,
+        executor: Executor | None = None,
+    ) -> "SWCModel":
+        """Asynchronous `from_swc_file` that keeps the event loop free.
+
+        Parsing runs via `aparse_swc` in `executor`; the graph is then built
+        in the loop's default thread pool.
+        """
+        result = await aparse_swc(
+            source,
+            strict=strict,
+            validate_reconnections=validate_reconnections,
+            float_tol=float_tol,
+            backend=backend,
+            cache=cache,
+            executor=executor,
+        )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, cls.from_parse_result, result)
+
     # ----------------------------------------------------------------------------------------------
     # Convenience queries
     # ----------------------------------------------------------------------------------------------
@@ -183,17 +610,100 @@ class SWCModel(nx.DiGraph):
         """Return the path from node n up to its root, inclusive.
 
         Example: For edges 1->2->3, `path_to_root(3)` returns `[3, 2, 1]`.
+        For many nodes, use `ancestor_index().paths_to_root(...)` instead.
         """
         path: list[int] = [n]
-        current = n
-        while True:
-            p = self.parent_of(current)
-            if p is None:
-                break
+        preds = self._pred[n]
+        while preds:
+            if len(preds) > 1:
+                raise ValueError(
+                    f"Node {path[-1]} has multiple parents in SWCModel; expected a tree/forest"
+                )
+            p = next(iter(preds))
             path.append(p)
-            current = p
+            preds = self._pred[p]
         return path
 
+    def ancestor_index(self) -> AncestorIndex:
+        """Return an `AncestorIndex` for batched depth, path-to-root, LCA and
+        path-distance queries over arrays of node ids.
+
+        The index is memoized until the graph structure changes; as for
+        `spatial_index`, a coordinate snapshot is compared on every call, so
+        moving nodes rebuilds it and weighted distances stay current. Taking
+        that snapshot makes a cache hit ``O(N)`` (one pass over the node
+        attributes), still much cheaper than a rebuild.
+        """
+        geometry = _node_geometry(self, ("x", "y", "z"))
+        cache = self.__networkx_cache__
+        entry = cache.get(_ANCESTORS_CACHE_KEY)
+        if entry is not None and np.array_equal(entry[0], geometry, equal_nan=True):
+            return entry[1]
+        arrays = MorphologyArrays.from_graph(self)
+        in_degree = np.bincount(arrays.edges[:, 1], minlength=len(arrays.ids))
+        if in_degree.size and in_degree.max() > 1:
+            n = int(arrays.ids[np.argmax(in_degree)])
+            raise ValueError(
+                f"Node {n} has multiple parents in SWCModel; expected a tree/forest"
+            )
+        index = AncestorIndex.from_arrays(arrays)
+        cache[_ANCESTORS_CACHE_KEY] = (geometry, index)
+        return index
+
+    # ----------------------------------------------------------------------------------------------
+    # Export
+    # ----------------------------------------------------------------------------------------------
+    def to_parse_result(self) -> SWCParseResult:
+        """Return the model as an `SWCParseResult` (one row per node, in node order).
+
+        Header comments and reconnection pairs stored in `self.graph` are carried over.
+        """
+        ids = list(self.nodes)
+        parents = []
+        for n in ids:
+            preds = self._pred[n]
+            if len(preds) > 1:
+                raise ValueError(
+                    f"Node {n} has multiple parents in SWCModel; expected a tree/forest"
+                )
+            parents.append(next(iter(preds)) if preds else -1)
+        table = _table_from_nodes(self, ids, parents)
+        return SWCParseResult(
+            table=table,
+            reconnections=list(self.graph.get("reconnections", [])),
+            comments=list(self.graph.get("comments", [])),
+        )
+
+    def to_arrays(self) -> MorphologyArrays:
+        """Return the model as `MorphologyArrays` (rows in node order)."""
+        return MorphologyArrays.from_graph(self)
+
+    def to_swc(self, dest: str | os.PathLike[str], *, precision: int | None = None) -> None:
+        """Write the model to an SWC file; see `swcviz.io.write_swc`."""
+        write_swc(self, dest, precision=precision)
+
+    def graph_attributes(self) -> dict[str, Any]:
+        """Return `_graph_attributes` for this model.
+
+        The result is memoized until the graph structure changes (any
+        networkx add/remove/clear call); attribute-only edits keep it.
+        """
+        return _cached_graph_attributes(self)
+
+    def spatial_index(self, kind: str = "nodes") -> SpatialIndex:
+        """Return a cached `SpatialIndex` over nodes or edge segments.
+
+        ``kind="nodes"``: items are node rows, ``keys`` the node ids.
+        ``kind="segments"``: items are edges with their end radii, ``keys``
+        the ``(E, 2)`` id pairs. Rebuilt when the structure, coordinates or
+        radii change; detecting those edits makes a cache hit ``O(N)``.
+        """
+        return _cached_spatial_index(self, kind)
+
+    def section_index(self) -> SectionIndex:
+        """Return the cached unbranched `SectionIndex` (rows in node order)."""
+        return _cached_section_index(self)
+
     def print_attributes(self, *, node_info: bool = False, edge_info: bool = False) -> None:
         """Print graph attributes and optional node/edge details.
 
@@ -204,7 +714,7 @@ class SWCModel(nx.DiGraph):
         edge_info: bool
             If True, print all edges (u -> v) with edge attributes if any.
         """
-        info = _graph_attributes(self)
+        info = self.graph_attributes()
         header = (
             f"SWCModel: nodes={info['nodes']}, edges={info['edges']}, "
             f"components={info['components']}, cycles={info['cycles']}, "
@@ -237,6 +747,7 @@ class GeneralModel(nx.Graph):
       `# CYCLE_BREAK reconnect i j`.
     - Node attributes include: `x, y, z, r` (identical across merged ids),
       representative `n`, optional `t`, and provenance lists `merged_ids`, `lines`.
+      Merged nodes are keyed by their smallest SWC id (the representative `n`).
     - Edges are undirected between merged nodes; self-loops are skipped if
       parent/child collapse into the same merged node.
     """
@@ -254,106 +765,73 @@ class GeneralModel(nx.Graph):
         *,
         validate_reconnections: bool = True,
         float_tol: float = 1e-9,
+        provenance: bool = True,
+        detect_reconnections: bool = False,
     ) -> "GeneralModel":
         """Build a merged undirected model from a parsed SWC result.
 
         If `validate_reconnections` is True, enforce identical (x, y, z, r)
         for each reconnect pair before merging (useful when `parse_swc` was
         called with validation disabled).
+
+        Nodes and edges are inserted in bulk from the table columns. With
+        ``provenance=False`` the per-node ``merged_ids``/``lines`` lists are
+        not built, which saves two lists per node on large models.
+
+        With ``detect_reconnections=True``, unannotated coincident nodes
+        (identical x, y, z, r within `float_tol`, see
+        `swcviz.reconnect.find_reconnections`) are merged as well.
         """
-        # Materialize record mapping
-        records = result.records
-
-        # ---- Union-Find for merges -------------------------------------------------------------
-        parent: dict[int, int] = {}
-        rank: dict[int, int] = {}
-
-        def uf_find(a: int) -> int:
-            # Path compression
-            pa = parent.get(a, a)
-            if pa != a:
-                parent[a] = uf_find(pa)
-            else:
-                parent.setdefault(a, a)
-                rank.setdefault(a, 0)
-            return parent[a]
-
-        def identical_xyzr(a: SWCRecord, b: SWCRecord) -> bool:
-            return (
-                abs(a.x - b.x) <= float_tol
-                and abs(a.y - b.y) <= float_tol
-                and abs(a.z - b.z) <= float_tol
-                and abs(a.r - b.r) <= float_tol
+        if detect_reconnections:
+            result = with_reconnections(result, float_tol=float_tol)
+        table = result.table
+        pairs = np.asarray(result.reconnections, dtype=np.int64).reshape(-1, 2)
+        checks = ["reconnection"] if validate_reconnections else []
+        if not validate_reconnections and not table.contains(pairs).all():
+            bad = pairs[~table.contains(pairs).all(axis=1)][0]
+            raise ValueError(
+                f"Reconnection pair ({bad[0]}, {bad[1]}) refers to undefined node id(s)"
             )
+        validate_table(table, pairs, checks=checks, float_tol=float_tol, fail_fast=True)
+
+        # ---- Union-find over row indices for merges --------------------------------------------
+        rows = table.rows_of(pairs)
+        dsu = DisjointSet(len(table))
+        dsu.union_pairs(rows[:, 0], rows[:, 1])
+        labels = dsu.labels()
+        # Each merged node is keyed by the smallest id in its group
+        smallest = np.full(len(table), np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(smallest, labels, table.n)
+        rep = smallest[labels]
 
-        def uf_union(a: int, b: int) -> None:
-            ra, rb = uf_find(a), uf_find(b)
-            if ra == rb:
-                return
-            # Union by rank; tie-breaker on smaller id for stability
-            rra, rrb = rank.get(ra, 0), rank.get(rb, 0)
-            if rra < rrb or (rra == rrb and ra > rb):
-                ra, rb = rb, ra
-                rra, rrb = rrb, rra
-            parent[rb] = ra
-            rank[ra] = max(rra, rrb + 1)
-
-        # Seed UF with all ids
-        for n in records.keys():
-            parent[n] = n
-            rank[n] = 0
-
-        # Apply merges from reconnection annotations
-        for i, j in result.reconnections:
-            if i not in records or j not in records:
-                raise ValueError(
-                    f"Reconnection pair ({i}, {j}) refers to undefined node id(s)"
-                )
-            if validate_reconnections:
-                if not identical_xyzr(records[i], records[j]):
-                    raise ValueError(
-                        "Reconnection requires identical (x, y, z, r) but got:\n"
-                        f"  {i}: (x={records[i].x}, y={records[i].y}, z={records[i].z}, r={records[i].r})\n"
-                        f"  {j}: (x={records[j].x}, y={records[j].y}, z={records[j].z}, r={records[j].r})"
-                    )
-            uf_union(i, j)
-
-        # Build groups by representative
-        groups: dict[int, list[int]] = {}
-        for n in records.keys():
-            r = uf_find(n)
-            groups.setdefault(r, []).append(n)
-
-        # Create the Graph nodes with merged attributes
         model = cls()
-        for rep, ids in groups.items():
-            # Sort ids for stable ordering and reproducibility
-            ids_sorted = sorted(ids)
-            first = records[ids_sorted[0]]
-            # Attributes are taken from the first (coordinates identical by contract)
-            attrs = {
-                "n": ids_sorted[0],
-                "x": first.x,
-                "y": first.y,
-                "z": first.z,
-                "r": first.r,
-                # Representative type; may vary across merged ids, but keep one for convenience
-                "t": first.t,
-                # Provenance
-                "merged_ids": ids_sorted,
-                "lines": sorted(records[i].line for i in ids_sorted),
-            }
-            model.add_node(rep, **attrs)
-
-        # Add undirected edges between merged representatives (skip self-loops)
-        for rec in records.values():
-            if rec.parent == -1:
-                continue
-            u = uf_find(rec.parent)
-            v = uf_find(rec.n)
-            if u != v:
-                model.add_edge(u, v)
+        model.graph["comments"] = list(result.comments)
+        model.add_nodes_from(_merged_nodes(table, rep, provenance=provenance))
+
+        # Undirected edges between merged representatives (skip self-loops).
+        # Undefined parents (strict=False) stay as bare nodes, keyed by their id.
+        child = np.flatnonzero(table.parent != -1)
+        u = table.parent[child]
+        known = table.contains(u)
+        u[known] = rep[table.rows_of(u[known])]
+        v = rep[child]
+        keep = u != v
+        model.add_edges_from(zip(u[keep].tolist(), v[keep].tolist()))
+
+        return model
+
+    @classmethod
+    def from_arrays(cls, arrays: MorphologyArrays) -> "GeneralModel":
+        """Build a model from `MorphologyArrays` (edge direction is dropped).
 
+        Nodes carry ``n, x, y, z, r, t, line``; merge provenance lists are not
+        part of the arrays and are therefore absent.
+        """
+        model = cls()
+        model.add_nodes_from(
+            (n, dict(attrs, n=n)) for n, attrs in arrays._node_items()
+        )
+        model.add_edges_from(arrays.edge_ids().tolist())
         return model
 
     @classmethod
@@ -364,20 +842,220 @@ class GeneralModel(nx.Graph):
         strict: bool = True,
         validate_reconnections: bool = True,
         float_tol: float = 1e-9,
+        backend: str = "python",
+        cache: ParseCache | None = None,
+        provenance: bool = True,
+        detect_reconnections: bool = False,
     ) -> "GeneralModel":
-        """Parse an SWC source and build a merged undirected model."""
+        """Parse an SWC source and build a merged undirected model.
+
+        `backend` and `cache` are forwarded to `parse_swc`; `provenance` and
+        `detect_reconnections` to `from_parse_result`.
+        """
         result = parse_swc(
             source,
             strict=strict,
             validate_reconnections=validate_reconnections,
             float_tol=float_tol,
+            backend=backend,
+            cache=cache,
         )
         return cls.from_parse_result(
             result,
             validate_reconnections=validate_reconnections,
             float_tol=float_tol,
+            provenance=provenance,
+            detect_reconnections=detect_reconnections,
+        )
+
+    @classmethod
+    async def afrom_swc_file(
+        cls,
+        source: str | os.PathLike[str] | Iterable[str],
+        *,
+        strict: bool = True,
+        validate_reconnections: bool = True,
+        float_tol: float = 1e-9,
+        backend: str = "python",
+        cache: ParseCache | None = None,
+        executor: Executor | None = None,
+        provenance: bool = True,
+        detect_reconnections: bool = False,
+    ) -> "GeneralModel":
+        """Asynchronous `from_swc_file` that keeps the event loop free.
+
+        Parsing runs via `aparse_swc` in `executor` (pass a process pool to
+        parse several files in parallel); the merged graph is then built in
+        the loop's default thread pool.
+        """
+        result = await aparse_swc(
+            source,
+            strict=strict,
+            validate_reconnections=validate_reconnections,
+            float_tol=float_tol,
+            backend=backend,
+            cache=cache,
+            executor=executor,
+        )
+        loop = asyncio.get_running_loop()
+        build = functools.partial(
+            cls.from_parse_result,
+            result,
+            validate_reconnections=validate_reconnections,
+            float_tol=float_tol,
+            provenance=provenance,
+            detect_reconnections=detect_reconnections,
+        )
+        return await loop.run_in_executor(None, build)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str], *, mmap: bool = True) -> "GeneralModel":
+        """Load a model written by `save`.
+
+        With `mmap` the arrays are memory-mapped (``np.load(mmap_mode="r")``)
+        and only read while the graph is assembled.
+        """
+        meta, arrays = _read_model(path, mmap=mmap)
+        ids = np.asarray(arrays["nodes"], dtype=np.int64)
+        nodes = ids.tolist()
+        model = cls()
+        model.graph.update(meta["graph"])
+        with _gc_paused():
+            edges = ids[np.asarray(arrays["edges"])].tolist()
+            _fill_graph(model, zip(nodes, _node_attrs(arrays)), edges)
+        return model
+
+    @classmethod
+    def load_arrays(cls, path: str | os.PathLike[str], *, mmap: bool = True) -> MorphologyArrays:
+        """Load a model written by `save` as `MorphologyArrays`, without
+        building the graph.
+
+        Equivalent to ``GeneralModel.load(path).to_arrays()`` but costs only
+        the array reads (the spanning forest is stored at save time), so it
+        suits plotting and morphometrics on large saved models.
+        """
+        _, arrays = _read_model(path, mmap=mmap)
+        flags = np.asarray(arrays["flags"])
+        if not (flags & _HAS_XYZR).all():
+            raise ValueError("Saved model has nodes without x, y, z, r")
+        # Like `MorphologyArrays.from_graph`: `line`, else the first of `lines`, else 0
+        start = np.asarray(arrays["lines_offsets"], dtype=np.int64)
+        lines = np.asarray(arrays["lines"], dtype=np.int64)
+        first = (flags & _HAS_LINES).astype(bool) & (start[1:] > start[:-1])
+        line = np.where(flags & _HAS_LINE, arrays["line"], 0).astype(np.int64)
+        use = first & ~(flags & _HAS_LINE).astype(bool)
+        line[use] = lines[start[:-1][use]]
+        return MorphologyArrays(
+            ids=arrays["nodes"],
+            xyz=np.column_stack([arrays["x"], arrays["y"], arrays["z"]]),
+            r=arrays["r"],
+            t=arrays["t"],
+            parent=arrays["parent"],
+            edges=arrays["edges"],
+            directed=False,
+            line=line,
         )
 
+    # ------------------------------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------------------------------
+    def to_parse_result(self) -> SWCParseResult:
+        """Return the model as an `SWCParseResult` that rebuilds an identical graph.
+
+        Each connected component is written as a breadth-first tree rooted at
+        its smallest node id. Every edge that would close a cycle is written
+        as a duplicate of its endpoint (fresh id, same x, y, z, r) plus a
+        ``# CYCLE_BREAK reconnect`` pair, which `from_parse_result` merges
+        back into the original node. Comments stored in `self.graph` are
+        kept, except stale reconnect directives.
+        """
+        ids, parent_of = bfs_forest(self._adj, self.nodes)
+        parents = [parent_of[n] for n in ids]
+
+        # Edges outside the BFS forest become duplicated endpoints + reconnect pairs
+        rows = list(ids)
+        next_id = max(ids, default=0) + 1
+        reconnections: list[tuple[int, int]] = []
+        for u, v in self.edges():
+            if parent_of[v] == u or parent_of[u] == v:
+                continue
+            rows.append(v)
+            parents.append(u)
+            reconnections.append((v, next_id))
+            next_id += 1
+
+        table = _table_from_nodes(self, rows, parents)
+        n_col = table.n.copy()
+        n_col[len(ids):] = [dup for _, dup in reconnections]
+        table = SWCTable(
+            n=n_col,
+            t=table.t,
+            x=table.x,
+            y=table.y,
+            z=table.z,
+            r=table.r,
+            parent=table.parent,
+            line=table.line,
+        )
+        comments = [
+            c for c in self.graph.get("comments", []) if not RECONNECT_RE.match(c)
+        ]
+        return SWCParseResult(table=table, reconnections=reconnections, comments=comments)
+
+    def to_arrays(self) -> MorphologyArrays:
+        """Return the model as `MorphologyArrays` (rows in node order)."""
+        return MorphologyArrays.from_graph(self)
+
+    def to_swc(self, dest: str | os.PathLike[str], *, precision: int | None = None) -> None:
+        """Write the model to an SWC file; see `swcviz.io.write_swc`."""
+        write_swc(self, dest, precision=precision)
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Save the model as a directory of ``.npy`` arrays plus ``meta.json``.
+
+        Node ids and ``t, x, y, z, r, line`` are stored as columns, edges as
+        an ``(E, 2)`` index array and the ``merged_ids``/``lines`` provenance
+        lists in CSR layout, with per-node flags for absent attributes, so
+        `load` restores nodes, attributes, edges and `self.graph` exactly.
+        The directory is written next to `path` and moved into place.
+
+        Raises ``ValueError`` for node attributes outside that set, edge
+        attributes, or graph attributes that are not JSON-serializable.
+        """
+        arrays = _narrow(_model_arrays(self))
+        meta = {"format": _MODEL_FORMAT, "version": _MODEL_VERSION, "graph": dict(self.graph)}
+        try:
+            json.dumps(meta)
+        except TypeError as exc:
+            raise ValueError(f"Graph attributes are not JSON-serializable: {exc}") from exc
+        write_arrays(os.fspath(path), arrays, meta)
+
+    def graph_attributes(self) -> dict[str, Any]:
+        """Return `_graph_attributes` for this model.
+
+        The result is memoized until the graph structure changes (any
+        networkx add/remove/clear call); attribute-only edits keep it.
+        """
+        return _cached_graph_attributes(self)
+
+    def spatial_index(self, kind: str = "nodes") -> SpatialIndex:
+        """Return a cached `SpatialIndex` over nodes or edge segments.
+
+        ``kind="nodes"``: items are node rows, ``keys`` the node ids.
+        ``kind="segments"``: items are edges with their end radii, ``keys``
+        the ``(E, 2)`` id pairs. Rebuilt when the structure, coordinates or
+        radii change; detecting those edits makes a cache hit ``O(N)``.
+        """
+        return _cached_spatial_index(self, kind)
+
+    def section_index(self) -> SectionIndex:
+        """Return the cached unbranched `SectionIndex` (rows in node order).
+
+        Sections follow the breadth-first spanning forest of `to_arrays()`;
+        edges closing cycles belong to no section.
+        """
+        return _cached_section_index(self)
+
     def print_attributes(self, *, node_info: bool = False, edge_info: bool = False) -> None:
         """Print graph attributes and optional node/edge details.
 
@@ -388,7 +1066,7 @@ class GeneralModel(nx.Graph):
         edge_info: bool
             If True, print all edges (u -- v) with edge attributes if any.
         """
-        info = _graph_attributes(self)
+        info = self.graph_attributes()
         header = (
             f"GeneralModel: nodes={info['nodes']}, edges={info['edges']}, "
             f"components={info['components']}, cycles={info['cycles']}, "
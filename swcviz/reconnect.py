@@ -0,0 +1,184 @@
+"""Detection of reconnection candidates.
+
+SWC files that break cycles by duplicating a point are supposed to record
+each duplicate with a ``# CYCLE_BREAK reconnect i j`` header line, which
+`GeneralModel` uses to merge the copies again. Many files never got those
+annotations. `find_reconnections` recovers them: it reports every pair of
+nodes whose x, y, z and r agree within `float_tol` (the same test the
+``reconnection`` validation check applies).
+
+Values are quantized onto a 4D grid (x, y, z, r) whose spacing is much
+larger than the tolerance. Nodes within the tolerance of a cell face are
+also entered in the neighbouring cell, so every matching pair shares at
+least one cell; candidates are then compared only within cells. This takes
+one sort of ``O(N)`` entries instead of ``O(N**2)`` comparisons.
+
+Example
+-------
+>>> from swcviz import parse_swc, GeneralModel
+>>> from swcviz.reconnect import find_reconnections, reconnection_lines
+>>> rows = [
+...     "1 1 0 0 0 1 -1",
+...     "2 3 2 0 0 0.5 1",
+...     "3 3 2 2 0 0.5 2",
+...     "4 3 0 2 0 0.5 3",
+...     "5 3 2 0 0 0.5 4",  # duplicate of node 2 closing the loop
+... ]
+>>> result = parse_swc(rows)
+>>> pairs = find_reconnections(result)
+>>> pairs.tolist()
+[[2, 5]]
+>>> reconnection_lines(pairs)
+['# CYCLE_BREAK reconnect 2 5']
+>>> gm = GeneralModel.from_parse_result(result, detect_reconnections=True)
+>>> gm.number_of_nodes(), gm.number_of_edges()
+(4, 4)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, List, Tuple
+
+import numpy as np
+
+from .arrays import MorphologyArrays
+from .io import SWCParseResult, SWCTable
+
+# Grid spacing in units of the tolerance; larger cells put fewer nodes
+# within the tolerance of a face (about 2 / _CELL_SCALE per axis)
+_CELL_SCALE = 64.0
+
+
+def find_reconnections(
+    source: Any,
+    *,
+    float_tol: float = 1e-9,
+    include_edges: bool = False,
+) -> np.ndarray:
+    """Node id pairs with identical (x, y, z, r) within `float_tol`.
+
+    Parameters
+    ----------
+    source
+        An `SWCParseResult`, `SWCTable`, `MorphologyArrays` or model.
+    float_tol
+        Absolute tolerance per value, as in ``parse_swc(float_tol=...)``.
+    include_edges
+        Also report parent/child pairs (zero-length edges). They are left
+        out by default since they are not cycle breaks.
+
+    Returns
+    -------
+    np.ndarray
+        ``(K, 2)`` int64 id pairs with ``i < j``, sorted. A group of ``k``
+        coincident nodes yields all ``k * (k - 1) / 2`` pairs. Rows with
+        non-finite values are never matched.
+    """
+    if float_tol < 0:
+        raise ValueError("float_tol must be >= 0")
+    ids, values, parent = _columns(source)
+    rows = _coincident_rows(values, float(float_tol))
+    if not include_edges and rows.size:
+        edge = (parent[rows[:, 0]] == rows[:, 1]) | (parent[rows[:, 1]] == rows[:, 0])
+        rows = rows[~edge]
+    pairs = np.sort(ids[rows], axis=1)
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def reconnection_lines(pairs: Iterable[Tuple[int, int]] | np.ndarray) -> List[str]:
+    """``# CYCLE_BREAK reconnect i j`` header lines for id pairs."""
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    return [f"# CYCLE_BREAK reconnect {i} {j}" for i, j in pairs.tolist()]
+
+
+def with_reconnections(
+    result: SWCParseResult,
+    *,
+    float_tol: float = 1e-9,
+    include_edges: bool = False,
+) -> SWCParseResult:
+    """Copy of `result` with detected pairs added to its reconnections.
+
+    Existing pairs are kept first (in their order); detected pairs already
+    present in either orientation are not repeated. The result can be
+    passed to `GeneralModel.from_parse_result` or written with `write_swc`,
+    which emits the new header lines.
+    """
+    found = find_reconnections(result, float_tol=float_tol, include_edges=include_edges)
+    known = {tuple(sorted(p)) for p in result.reconnections}
+    added = [p for p in map(tuple, found.tolist()) if p not in known]
+    return SWCParseResult(
+        table=result.table,
+        reconnections=list(result.reconnections) + added,
+        comments=list(result.comments),
+    )
+
+
+# ---- Helpers -----------------------------------------------------------------------------------
+
+
+def _columns(source: Any) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Node ids, ``(N, 4)`` x/y/z/r values and parent rows of `source`."""
+    if isinstance(source, SWCParseResult):
+        source = source.table
+    if isinstance(source, SWCTable):
+        values = np.column_stack([source.x, source.y, source.z, source.r])
+        parent = np.full(len(source), -1, dtype=np.int64)
+        known = source.contains(source.parent)
+        parent[known] = source.rows_of(source.parent[known])
+        return source.n, values, parent
+    arrays = MorphologyArrays.coerce(source)
+    return arrays.ids, np.column_stack([arrays.xyz, arrays.r]), arrays.parent
+
+
+def _coincident_rows(values: np.ndarray, tol: float) -> np.ndarray:
+    """Row pairs ``(i, j)``, ``i < j``, whose values all differ by at most `tol`."""
+    finite = np.flatnonzero(np.isfinite(values).all(axis=1))
+    v = values[finite]
+    if v.shape[0] < 2:
+        return np.empty((0, 2), dtype=np.int64)
+    # Keep the keys far from int64 overflow when `tol` is below float spacing
+    scale = float(np.abs(v).max())
+    cell = _CELL_SCALE * max(tol, float(np.spacing(scale)) if scale else 0.0, np.finfo(np.float64).tiny)
+    key = np.floor(v / cell).astype(np.int64)
+    # Slack so rounding in `key * cell` never hides a node near a face
+    slack = tol + 1e-6 * cell
+    offset = v - key * cell
+    side = np.where(offset <= slack, -1, 0) + np.where(offset >= cell - slack, 1, 0)
+
+    # Home entries plus one copy per neighbouring cell a node may match into
+    entry_row = [np.arange(v.shape[0], dtype=np.int64)]
+    entry_key = [key]
+    near = side != 0
+    for mask in range(1, 16):
+        use = np.array([(mask >> d) & 1 for d in range(4)], dtype=bool)
+        sel = np.flatnonzero(near[:, use].all(axis=1))
+        if sel.size:
+            entry_row.append(sel)
+            entry_key.append(key[sel] + side[sel] * use)
+    row = np.concatenate(entry_row)
+    keys = np.concatenate(entry_key)
+    home = np.zeros(row.size, dtype=bool)
+    home[: v.shape[0]] = True
+
+    order = np.lexsort(keys.T[::-1])
+    row, keys, home = row[order], keys[order], home[order]
+    change = np.r_[True, (keys[1:] != keys[:-1]).any(axis=1)]
+    group = np.cumsum(change) - 1
+    stop = np.r_[np.flatnonzero(change)[1:], row.size][group]
+
+    # All entry pairs within a cell; at least one side must live there
+    counts = stop - np.arange(row.size) - 1
+    first = np.repeat(np.arange(row.size, dtype=np.int64), counts)
+    second = first + 1 + np.arange(first.size, dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+    keep = home[first] | home[second]
+    i, j = row[first[keep]], row[second[keep]]
+    keep = (i != j) & (np.abs(v[i] - v[j]) <= tol).all(axis=1)
+    i, j = np.minimum(i[keep], j[keep]), np.maximum(i[keep], j[keep])
+    # A pair straddling a face is seen from both cells
+    size = v.shape[0]
+    pair = np.unique(i * size + j)
+    return finite[np.column_stack([pair // size, pair % size])]
+
+
+__all__ = ["find_reconnections", "reconnection_lines", "with_reconnections"]
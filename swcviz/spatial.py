@@ -0,0 +1,415 @@
+"""Uniform-grid spatial index over nodes and segments.
+
+`SpatialIndex` stores capsules: segments ``a -> b`` with radii ``ra, rb``
+(points are zero-length, zero-radius capsules). Every capsule is registered
+in the grid cells overlapped by its bounding box, and queries gather the
+candidates of the cells around each query point with NumPy operations,
+for a whole batch of points at once:
+
+- `nearest`: closest item per point (widening the search box until the
+  best distance is certain)
+- `within`: all items within a radius of each point, in CSR layout
+
+Wide searches start on coarser grids (each ``4x`` the previous spacing,
+built on first use) and descend through the occupied cells only, so empty
+space far away from the morphology is skipped in large blocks; nearest
+queries additionally drop cells beyond the best distance seen so far.
+
+Distances are measured to the capsule surface: the distance to the segment
+axis minus the radius interpolated at the closest axis point (negative
+inside). For points this is the plain Euclidean distance.
+
+Models cache their indices (`model.spatial_index("nodes")` /
+``("segments")``) and rebuild them when the structure, coordinates or radii
+change; `FrustaSet.spatial_index()` indexes its segments.
+
+Example
+-------
+>>> from swcviz import GeneralModel
+>>> gm = GeneralModel.from_swc_file("data/example.swc")
+>>> index = gm.spatial_index()
+>>> rows, dist = index.nearest([[10.0, 0.0, 0.0], [0.0, 5.0, 2.0]])
+>>> index.keys[rows]  # node ids
+array([...])
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+# Queries are processed in chunks to bound the candidate arrays
+_QUERY_CHUNK = 1024
+# Target occupancy used to pick the default cell size
+_ITEMS_PER_CELL = 4.0
+# Spacing ratio between successive grid levels
+_LEVEL_FACTOR = 4
+
+
+class SpatialIndex:
+    """Uniform-grid index over capsules (or points).
+
+    Parameters
+    ----------
+    a, b
+        ``(M, 3)`` segment end points; ``b`` defaults to ``a`` (points).
+    ra, rb
+        ``(M,)`` end radii; default 0, ``rb`` defaults to ``ra``.
+    keys
+        Optional per-item labels (node ids, edge id pairs) kept as `keys`.
+    cell_size
+        Finest grid spacing; by default chosen for a few items per occupied
+        cell, and never below the median item extent.
+    """
+
+    def __init__(
+        self,
+        a: Iterable[Any] | np.ndarray,
+        b: Optional[Iterable[Any] | np.ndarray] = None,
+        ra: Optional[Iterable[float] | np.ndarray] = None,
+        rb: Optional[Iterable[float] | np.ndarray] = None,
+        *,
+        keys: Optional[np.ndarray] = None,
+        cell_size: Optional[float] = None,
+    ) -> None:
+        a = np.ascontiguousarray(a, dtype=np.float64).reshape(-1, 3)
+        b = a if b is None else np.ascontiguousarray(b, dtype=np.float64).reshape(-1, 3)
+        size = a.shape[0]
+        ra = np.zeros(size) if ra is None else np.ascontiguousarray(ra, dtype=np.float64).reshape(-1)
+        rb = ra if rb is None else np.ascontiguousarray(rb, dtype=np.float64).reshape(-1)
+        if not (b.shape[0] == ra.size == rb.size == size):
+            raise ValueError("SpatialIndex inputs must have the same number of items")
+        self.a, self.b, self.ra, self.rb = a, b, ra, rb
+        self.keys = keys
+
+        pad = np.maximum(ra, rb)[:, None]
+        self._box_lo = np.minimum(a, b) - pad
+        self._box_hi = np.maximum(a, b) + pad
+        if size:
+            self.origin = self._box_lo.min(axis=0)
+            self.extent = self._box_hi.max(axis=0) - self.origin
+        else:
+            self.origin = np.zeros(3)
+            self.extent = np.zeros(3)
+        if cell_size is None:
+            cell_size = self._default_cell_size()
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = float(cell_size)
+        self._levels: Dict[int, _Grid] = {}
+        self._grid(0)
+
+    @classmethod
+    def from_points(
+        cls, xyz: np.ndarray, *, keys: Optional[np.ndarray] = None, **kwargs: Any
+    ) -> "SpatialIndex":
+        """Index bare points (e.g. node coordinates)."""
+        return cls(xyz, keys=keys, **kwargs)
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[Any], **kwargs: Any) -> "SpatialIndex":
+        """Index `Segment`-like objects (``a, b, ra, rb``), e.g. `FrustaSet.segments`."""
+        segments = list(segments)
+        return cls(
+            [s.a for s in segments] or np.empty((0, 3)),
+            [s.b for s in segments] or np.empty((0, 3)),
+            [s.ra for s in segments],
+            [s.rb for s in segments],
+            **kwargs,
+        )
+
+    def __len__(self) -> int:
+        return int(self.a.shape[0])
+
+    def __repr__(self) -> str:
+        return f"SpatialIndex(items={len(self)}, cell_size={self.cell_size:.4g})"
+
+    # ---- Queries -------------------------------------------------------------------------------
+
+    def distance(self, points: Iterable[Any] | np.ndarray, rows: Iterable[int] | np.ndarray) -> np.ndarray:
+        """Surface distance from ``points[i]`` to item ``rows[i]``."""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        return self._distance(points, np.asarray(rows, dtype=np.int64))
+
+    def nearest(self, points: Iterable[Any] | np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Closest item to each point.
+
+        Returns ``(rows, distances)``; rows are ``-1`` (distance ``inf``) when
+        the index is empty.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        rows = np.full(points.shape[0], -1, dtype=np.int64)
+        best = np.full(points.shape[0], np.inf)
+        if not len(self):
+            return rows, best
+        for lo in range(0, points.shape[0], _QUERY_CHUNK):
+            chunk = slice(lo, lo + _QUERY_CHUNK)
+            rows[chunk], best[chunk] = self._nearest(points[chunk])
+        return rows, best
+
+    def within(
+        self, points: Iterable[Any] | np.ndarray, radius: float | Iterable[float] | np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Items within `radius` (scalar or per point) of each point.
+
+        Returns ``(rows, offsets)``: the items of ``points[i]`` are
+        ``rows[offsets[i]:offsets[i + 1]]``, in ascending row order.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        radius = np.broadcast_to(np.asarray(radius, dtype=np.float64), points.shape[:1])
+        if (radius < 0).any():
+            raise ValueError("radius must be >= 0")
+        size = len(self)
+        pairs = [np.empty(0, dtype=np.int64)]
+        for lo in range(0, points.shape[0] if size else 0, _QUERY_CHUNK):
+            idx = np.arange(lo, min(lo + _QUERY_CHUNK, points.shape[0]))
+            owner, item = self._candidates(points[idx], radius[idx])
+            hit = self._distance(points[idx][owner], item) <= radius[idx][owner]
+            # An item spanning several cells is a candidate once per cell
+            pairs.append(np.unique(idx[owner[hit]] * size + item[hit]))
+        pair = np.concatenate(pairs)
+        offsets = np.zeros(points.shape[0] + 1, dtype=np.int64)
+        if not size:
+            return pair, offsets
+        np.cumsum(np.bincount(pair // size, minlength=points.shape[0]), out=offsets[1:])
+        return pair % size, offsets
+
+    # ---- Internals -----------------------------------------------------------------------------
+
+    def _default_cell_size(self) -> float:
+        """Spacing aiming at a few items per occupied cell.
+
+        Starts from the mean spacing of a uniform fill of the bounding box,
+        then shrinks it for clustered data (neurites fill a small part of
+        their box), treating occupied cells as lying along curves. Never
+        smaller than the median item extent.
+        """
+        size = self._box_lo.shape[0]
+        if not size:
+            return 1.0
+        h = max(float(np.prod(np.maximum(self.extent, 1e-9)) / size) ** (1.0 / 3.0), 1e-9)
+        centers = np.floor((0.5 * (self._box_lo + self._box_hi) - self.origin) / h).astype(np.int64)
+        per_cell = size / np.unique(centers, axis=0).shape[0]
+        if per_cell > _ITEMS_PER_CELL:
+            h *= _ITEMS_PER_CELL / per_cell
+        item = float(np.median((self._box_hi - self._box_lo).max(axis=1)))
+        return max(h, item, 1e-9)
+
+    def _grid(self, level: int) -> "_Grid":
+        grid = self._levels.get(level)
+        if grid is None:
+            cell = self.cell_size * _LEVEL_FACTOR**level
+            grid = self._levels[level] = _Grid(
+                self.origin, self.extent, cell, self.a, self.b, np.maximum(self.ra, self.rb)
+            )
+        return grid
+
+    def _level_for(self, radius: np.ndarray) -> np.ndarray:
+        """Level whose cells are at least half the box half-width, so a
+        ``+-radius`` box spans at most five cells per axis."""
+        ratio = np.maximum(radius / (2.0 * self.cell_size), 1.0)
+        level = np.ceil(np.log(ratio) / np.log(_LEVEL_FACTOR) - 1e-9).astype(np.int64)
+        # Past the level holding everything in one cell there is nothing to gain
+        span = max(float(self.extent.max()) / self.cell_size, 1.0)
+        return np.minimum(level, int(np.ceil(np.log(span) / np.log(_LEVEL_FACTOR))))
+
+    def _candidates(self, points: np.ndarray, radius: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(query, item) pairs for items registered in the finest cells within
+        `radius` of each point, grouped by query."""
+        owner, pos = self._cells(points, radius)
+        return self._grid(0).gather(owner, pos)
+
+    def _cells(
+        self, points: np.ndarray, radius: np.ndarray, bound: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Occupied finest cells within `radius` of each point, as ``(query,
+        key position)`` pairs.
+
+        Each query starts on the level where its ball spans a few cells and
+        descends to the finest grid, keeping only occupied cells that touch
+        the ball, so empty space is discarded a whole coarse cell at a time.
+        With `bound` (updated in place), the distance to one item of every
+        kept cell tightens a per-query upper bound on the nearest distance
+        and cells farther away than that bound are dropped too.
+        """
+        level = self._level_for(radius)
+        owner = np.empty(0, dtype=np.int64)
+        cells = np.empty((0, 3), dtype=np.int64)
+        pos = np.empty(0, dtype=np.int64)
+        for lv in range(int(level.max()) if level.size else 0, -1, -1):
+            grid = self._grid(lv)
+            if owner.size:
+                owner, cells = grid.children(owner, cells)
+            start = np.flatnonzero(level == lv)
+            if start.size:
+                o, c = grid.box(points[start], radius[start])
+                owner, cells = np.concatenate([owner, start[o]]), np.concatenate([cells, c])
+            owner, cells, pos, gap = grid.touching(points, radius, owner, cells)
+            if bound is not None and owner.size:
+                np.minimum.at(bound, owner, self._distance(points[owner], grid.items[grid.start[pos]]))
+                keep = gap <= np.maximum(bound[owner], 0.0) ** 2
+                owner, cells, pos = owner[keep], cells[keep], pos[keep]
+        order = np.argsort(owner, kind="stable")
+        return owner[order], pos[order]
+
+    def _nearest(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        rows = np.full(points.shape[0], -1, dtype=np.int64)
+        best = np.full(points.shape[0], np.inf)
+        lo, hi = self.origin, self.origin + self.extent
+        # Start the search at the distance to the bounding box
+        gap = np.linalg.norm(np.maximum(np.maximum(lo - points, points - hi), 0.0), axis=1)
+        reach = np.maximum(gap, 0.5 * self.cell_size)
+        pending = np.arange(points.shape[0])
+        while pending.size:
+            p, r = points[pending], reach[pending]
+            bound = best[pending]
+            owner, pos = self._cells(p, r, bound)
+            owner, item = self._grid(0).gather(owner, pos)
+            q, d, found = _group_min(owner, self._distance(p[owner], item), item)
+            q = pending[q]
+            better = d < best[q]
+            rows[q[better]], best[q[better]] = found[better], d[better]
+            # Every item within `reach` of a point has been seen (cells are
+            # only dropped beyond a distance some item already achieves), so
+            # a point is settled once its best distance is within reach.
+            pending = pending[best[pending] > r]
+            reach[pending] = np.where(np.isinf(best[pending]), 2.0 * reach[pending], best[pending])
+        return rows, best
+
+    def _distance(self, points: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        a, ab = self.a[rows], self.b[rows] - self.a[rows]
+        denom = np.einsum("ij,ij->i", ab, ab)
+        t = np.einsum("ij,ij->i", points - a, ab) / np.where(denom > 0, denom, 1.0)
+        t = np.clip(t, 0.0, 1.0)
+        axis = np.linalg.norm(points - (a + t[:, None] * ab), axis=1)
+        return axis - (self.ra[rows] + t * (self.rb[rows] - self.ra[rows]))
+
+
+class _Grid:
+    """One grid level: item rows bucketed by cell key (CSR over sorted keys).
+
+    Segments longer than a cell are registered piecewise (pieces of at most
+    one cell length), so a long edge costs cells along its length instead
+    of the whole volume of its bounding box.
+    """
+
+    def __init__(
+        self,
+        origin: np.ndarray,
+        extent: np.ndarray,
+        cell: float,
+        a: np.ndarray,
+        b: np.ndarray,
+        pad: np.ndarray,
+    ) -> None:
+        self.origin = origin
+        self.cell = cell
+        self.shape = np.floor(extent / cell).astype(np.int64) + 1
+        pieces = np.maximum(np.ceil(np.abs(b - a).max(axis=1) / cell), 1).astype(np.int64)
+        item = np.repeat(np.arange(a.shape[0], dtype=np.int64), pieces)
+        k = np.arange(item.size, dtype=np.int64) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+        step = (b - a) / pieces[:, None]
+        p0 = a[item] + k[:, None] * step[item]
+        p1 = p0 + step[item]
+        lo = np.minimum(p0, p1) - pad[item, None]
+        hi = np.maximum(p0, p1) + pad[item, None]
+        owner, cells = self.box_cells(self.cell_of(lo), self.cell_of(hi))
+        # Neighbouring pieces may put an item in the same cell twice
+        size = max(a.shape[0], 1)
+        pair = np.unique(self.ravel(cells) * size + item[owner])
+        keys, self.items = pair // size, pair % size
+        self.keys, first = np.unique(keys, return_index=True)
+        self.start = first
+        self.stop = np.append(first[1:], keys.size)
+
+    def cell_of(self, xyz: np.ndarray) -> np.ndarray:
+        return np.floor((xyz - self.origin) / self.cell).astype(np.int64)
+
+    def ravel(self, cells: np.ndarray) -> np.ndarray:
+        return (cells[:, 0] * self.shape[1] + cells[:, 1]) * self.shape[2] + cells[:, 2]
+
+    def box_cells(self, c0: np.ndarray, c1: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """All cells of the boxes ``c0..c1`` (inclusive), clipped to the grid.
+
+        Returns ``(owner, cells)``: box index and ``(K, 3)`` cell coordinates.
+        """
+        c0 = np.maximum(c0, 0)
+        c1 = np.minimum(c1, self.shape - 1)
+        span = np.maximum(c1 - c0 + 1, 0)
+        counts = span.prod(axis=1)
+        owner = np.repeat(np.arange(c0.shape[0], dtype=np.int64), counts)
+        first = np.cumsum(counts) - counts
+        local = np.arange(owner.size, dtype=np.int64) - first[owner]
+        span = span[owner]
+        k = local % span[:, 2]
+        j = (local // span[:, 2]) % span[:, 1]
+        i = local // (span[:, 2] * span[:, 1])
+        return owner, c0[owner] + np.column_stack([i, j, k])
+
+    def box(self, points: np.ndarray, radius: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(query, cell) pairs for the ``+-radius`` box around each point."""
+        pad = radius[:, None]
+        return self.box_cells(self.cell_of(points - pad), self.cell_of(points + pad))
+
+    def children(self, owner: np.ndarray, cells: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Split cells of the next coarser level into this level's cells."""
+        f = _LEVEL_FACTOR
+        local = np.arange(f**3, dtype=np.int64)
+        sub = np.column_stack([local // (f * f), (local // f) % f, local % f])
+        cells = (cells[:, None, :] * f + sub[None, :, :]).reshape(-1, 3)
+        owner = np.repeat(owner, f**3)
+        inside = (cells < self.shape).all(axis=1)
+        return owner[inside], cells[inside]
+
+    def touching(
+        self, points: np.ndarray, radius: np.ndarray, owner: np.ndarray, cells: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Keep the occupied cells within ``radius[owner]`` of ``points[owner]``.
+
+        Returns ``(owner, cells, pos, gap2)``: kept pairs, the position of each
+        cell in `keys` and its squared distance to the point.
+        """
+        lo = self.origin + cells * self.cell
+        p = points[owner]
+        gap = np.maximum(np.maximum(lo - p, p - (lo + self.cell)), 0.0)
+        gap2 = np.einsum("ij,ij->i", gap, gap)
+        near = np.flatnonzero(gap2 <= radius[owner] ** 2)
+        keys = self.ravel(cells[near])
+        pos = np.minimum(np.searchsorted(self.keys, keys), max(self.keys.size - 1, 0))
+        if self.keys.size:
+            hit = self.keys[pos] == keys
+            near, pos = near[hit], pos[hit]
+        else:
+            near, pos = near[:0], pos[:0]
+        return owner[near], cells[near], pos, gap2[near]
+
+    def gather(self, owner: np.ndarray, pos: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(query, item) pairs for the items of the cells at `pos` in `keys`."""
+        counts = self.stop[pos] - self.start[pos]
+        query = np.repeat(owner, counts)
+        first = np.cumsum(counts) - counts
+        slot = np.repeat(self.start[pos] - first, counts) + np.arange(query.size, dtype=np.int64)
+        return query, self.items[slot]
+
+
+def _group_min(
+    owner: np.ndarray, d: np.ndarray, item: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-owner minimum of `d` for pairs grouped by (sorted) `owner`.
+
+    Returns ``(owners, minima, items)``; ties go to the first pair.
+    """
+    if not owner.size:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, np.empty(0), empty
+    change = np.r_[False, owner[1:] != owner[:-1]]
+    head = np.flatnonzero(np.r_[True, change[1:]])
+    low = np.minimum.reduceat(d, head)
+    group = np.cumsum(change)
+    at = np.flatnonzero(d == low[group])
+    at = at[np.r_[True, group[at][1:] != group[at][:-1]]]
+    return owner[head], low, item[at]
+
+
+__all__ = ["SpatialIndex"]
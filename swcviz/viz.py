@@ -6,28 +6,56 @@
 
 from __future__ import annotations
 
-from typing import Optional, Sequence
+from typing import Any, List, Optional, Sequence, Tuple
 
+import numpy as np
 import plotly.graph_objects as go
 
+from .arrays import MorphologyArrays
 from .geometry import FrustaSet, PointSet
+from .sections import SectionIndex
 from .config import apply_layout
 
 
+def _centroid_lines(gm: Any) -> Tuple[List[Any], List[Any], List[Any]]:
+    """Polylines with None separators for a model or `MorphologyArrays`.
+
+    Each unbranched section (from the cached `SectionIndex`) is one run of
+    points; edges outside the spanning forest (cycles) follow as ``u, v``
+    pairs.
+    """
+    arrays = MorphologyArrays.coerce(gm)
+    sections = SectionIndex.of(gm if hasattr(gm, "section_index") else arrays)
+    count = len(sections)
+    loose = arrays.edges[sections.edge_sections(arrays.edges) < 0]
+    # Row of every output point (-1 marks a separator)
+    runs = np.full(sections.nodes.size + count + 3 * loose.shape[0], -1, dtype=np.int64)
+    pos = np.arange(sections.nodes.size) + np.repeat(np.arange(count), sections.lengths)
+    runs[pos] = sections.nodes
+    tail = runs[sections.nodes.size + count :].reshape(-1, 3)
+    tail[:, :2] = loose
+    gap = runs < 0
+    out = []
+    for axis in range(3):
+        coord = np.empty(runs.size, dtype=object)
+        coord[~gap] = arrays.xyz[runs[~gap], axis]
+        coord[gap] = None
+        out.append(coord.tolist())
+    return out[0], out[1], out[2]
+
+
+def _node_coords(gm: Any) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    arrays = MorphologyArrays.coerce(gm)
+    return arrays.x, arrays.y, arrays.z
+
+
 def plot_centroid(gm, *, marker_size: float = 2.0, line_width: float = 2.0, show_nodes: bool = True) -> go.Figure:
-    """Plot centroid skeleton from a GeneralModel.
+    """Plot centroid skeleton from a GeneralModel (or `MorphologyArrays`).
 
     Edges are drawn as line segments in 3D using Scatter3d.
     """
-    xs = []
-    ys = []
-    zs = []
-
     # Build polyline segments with None separators for Plotly
-    for u, v in gm.edges:
-        xs.extend([gm.nodes[u]["x"], gm.nodes[v]["x"], None])
-        ys.extend([gm.nodes[u]["y"], gm.nodes[v]["y"], None])
-        zs.extend([gm.nodes[u]["z"], gm.nodes[v]["z"], None])
+    xs, ys, zs = _centroid_lines(gm)
 
     edge_trace = go.Scatter3d(
         x=xs,
@@ -41,9 +69,7 @@ def plot_centroid(gm, *, marker_size: float = 2.0, line_width: float = 2.0, show
     data = [edge_trace]
 
     if show_nodes:
-        xn = [gm.nodes[n]["x"] for n in gm.nodes]
-        yn = [gm.nodes[n]["y"] for n in gm.nodes]
-        zn = [gm.nodes[n]["z"] for n in gm.nodes]
+        xn, yn, zn = _node_coords(gm)
         node_trace = go.Scatter3d(
             x=xn,
             y=yn,
@@ -113,16 +139,12 @@ def plot_frusta_with_centroid(
     show_nodes: bool = False,
     node_size: float = 2.0,
 ) -> go.Figure:
-    """Overlay frusta mesh with centroid skeleton from a `GeneralModel`.
+    """Overlay frusta mesh with centroid skeleton from a `GeneralModel` (or `MorphologyArrays`).
 
     Parameters mirror `plot_centroid` and `plot_frusta` with an extra `radius_scale`.
     """
     # Build centroid polyline
-    xs, ys, zs = [], [], []
-    for u, v in gm.edges:
-        xs.extend([gm.nodes[u]["x"], gm.nodes[v]["x"], None])
-        ys.extend([gm.nodes[u]["y"], gm.nodes[v]["y"], None])
-        zs.extend([gm.nodes[u]["z"], gm.nodes[v]["z"], None])
+    xs, ys, zs = _centroid_lines(gm)
     centroid = go.Scatter3d(
         x=xs,
         y=ys,
@@ -134,9 +156,7 @@ def plot_frusta_with_centroid(
 
     traces = [centroid]
     if show_nodes:
-        xn = [gm.nodes[n]["x"] for n in gm.nodes]
-        yn = [gm.nodes[n]["y"] for n in gm.nodes]
-        zn = [gm.nodes[n]["z"] for n in gm.nodes]
+        xn, yn, zn = _node_coords(gm)
         nodes = go.Scatter3d(
             x=xn,
             y=yn,
@@ -196,9 +216,9 @@ def plot_frusta_slider(
         init_idx = min(range(len(scales)), key=lambda idx: abs(scales[idx] - 1.0))
     else:
         init_idx = 0
-    init_scale = scales[init_idx]
-    init_fr = base if init_scale == 1.0 else base.scaled(init_scale)
-    x0, y0, z0, _, _, _ = init_fr.to_mesh3d_arrays()
+    # One vertex array per scale; the faces never change
+    frame_verts = base.scaled_many(scales)
+    x0, y0, z0 = frame_verts[init_idx].T
 
     mesh = go.Mesh3d(
         x=x0,
@@ -214,9 +234,8 @@ def plot_frusta_slider(
     )
 
     frames = []
-    for s in scales:
-        fr_s = base if s == 1.0 else base.scaled(s)
-        xs, ys, zs, _, _, _ = fr_s.to_mesh3d_arrays()
+    for s, verts in zip(scales, frame_verts):
+        xs, ys, zs = verts.T
         frames.append(
             go.Frame(
                 name=f"scale={s:.2f}",
@@ -251,8 +270,30 @@ def plot_frusta_slider(
             "x": 0.0,
             "y": 0,
             "buttons": [
-                {"label": "▶ Play", "method": "animate", "args": [None, {"fromcurrent": True, "frame": {"duration": 0}, "transition": {"duration": 0}}]},
-                {"label": "❚❚ Pause", "method": "animate", "args": [[None], {"mode": "immediate", "frame": {"duration": 0}, "transition": {"duration": 0}}]},
+                {
+                    "label": "▶ Play",
+                    "method": "animate",
+                    "args": [
+                        None,
+                        {
+                            "fromcurrent": True,
+                            "frame": {"duration": 0},
+                            "transition": {"duration": 0},
+                        },
+                    ],
+                },
+                {
+                    "label": "❚❚ Pause",
+                    "method": "animate",
+                    "args": [
+                        [None],
+                        {
+                            "mode": "immediate",
+                            "frame": {"duration": 0},
+                            "transition": {"duration": 0},
+                        },
+                    ],
+                },
             ],
         }
     ]
@@ -272,6 +313,7 @@ def plot_model(
     # Frusta build options (used if frusta is None and gm provided)
     sides: int = 16,
     end_caps: bool = False,
+    weld: bool = False,
     # Frusta appearance
     color: str = "lightblue",
     opacity: float = 0.8,
@@ -294,12 +336,17 @@ def plot_model(
 ) -> go.Figure:
     """Master visualization combining centroid, frusta, slider, and overlay points.
 
-    - If `frusta` is not provided and `gm` is, a `FrustaSet` is built from `gm`.
+    - `gm` may be a `GeneralModel` or `MorphologyArrays`.
+    - If `frusta` is not provided and `gm` is, a `FrustaSet` is built from `gm`
+      (`weld=True` shares rings along unbranched sections, see `welded_tubes_array`).
     - If `slider=True` and `show_frusta=True`, a Plotly slider controls `radius_scale`.
     - `points` overlays arbitrary xyz positions as small markers.
     """
 
     traces: list[go.BaseTraceType] = []
+    if gm is not None:
+        # Gather coordinates once for both the frusta and the centroid
+        gm = MorphologyArrays.coerce(gm)
     frames: list[go.Frame] | None = None
 
     # Build frusta if needed
@@ -307,15 +354,11 @@ def plot_model(
     if show_frusta and base_fr is None:
         if gm is None:
             raise ValueError("plot_model: provide either `frusta` or a `gm` to build from")
-        base_fr = FrustaSet.from_general_model(gm, sides=sides, end_caps=end_caps)
+        base_fr = FrustaSet.from_general_model(gm, sides=sides, end_caps=end_caps, weld=weld)
 
     # Centroid traces
     if show_centroid and gm is not None:
-        xs, ys, zs = [], [], []
-        for u, v in gm.edges:
-            xs.extend([gm.nodes[u]["x"], gm.nodes[v]["x"], None])
-            ys.extend([gm.nodes[u]["y"], gm.nodes[v]["y"], None])
-            zs.extend([gm.nodes[u]["z"], gm.nodes[v]["z"], None])
+        xs, ys, zs = _centroid_lines(gm)
         centroid = go.Scatter3d(
             x=xs,
             y=ys,
@@ -327,9 +370,7 @@ def plot_model(
         traces.append(centroid)
 
         if show_nodes:
-            xn = [gm.nodes[n]["x"] for n in gm.nodes]
-            yn = [gm.nodes[n]["y"] for n in gm.nodes]
-            zn = [gm.nodes[n]["z"] for n in gm.nodes]
+            xn, yn, zn = _node_coords(gm)
             nodes = go.Scatter3d(
                 x=xn,
                 y=yn,
@@ -373,9 +414,9 @@ def plot_model(
                 init_idx = min(range(len(scales)), key=lambda idx: abs(scales[idx] - 1.0))
             else:
                 init_idx = 0
-            init_scale = scales[init_idx]
-            init_fr = base_fr if init_scale == 1.0 else base_fr.scaled(init_scale)
-            x0, y0, z0, _, _, _ = init_fr.to_mesh3d_arrays()
+            # One vertex array per scale; the faces never change
+            frame_verts = base_fr.scaled_many(scales)
+            x0, y0, z0 = frame_verts[init_idx].T
 
             mesh = go.Mesh3d(
                 x=x0,
@@ -394,9 +435,8 @@ def plot_model(
             traces = [mesh] + traces
 
             frames = []
-            for s in scales:
-                fr_s = base_fr if s == 1.0 else base_fr.scaled(s)
-                xs, ys, zs, _, _, _ = fr_s.to_mesh3d_arrays()
+            for s, verts in zip(scales, frame_verts):
+                xs, ys, zs = verts.T
                 frames.append(
                     go.Frame(
                         name=f"scale={s:.2f}",
@@ -430,8 +470,30 @@ def plot_model(
                     "x": 0.0,
                     "y": 0,
                     "buttons": [
-                        {"label": "▶ Play", "method": "animate", "args": [None, {"fromcurrent": True, "frame": {"duration": 0}, "transition": {"duration": 0}}]},
-                        {"label": "❚❚ Pause", "method": "animate", "args": [[None], {"mode": "immediate", "frame": {"duration": 0}, "transition": {"duration": 0}}]},
+                        {
+                            "label": "▶ Play",
+                            "method": "animate",
+                            "args": [
+                                None,
+                                {
+                                    "fromcurrent": True,
+                                    "frame": {"duration": 0},
+                                    "transition": {"duration": 0},
+                                },
+                            ],
+                        },
+                        {
+                            "label": "❚❚ Pause",
+                            "method": "animate",
+                            "args": [
+                                [None],
+                                {
+                                    "mode": "immediate",
+                                    "frame": {"duration": 0},
+                                    "transition": {"duration": 0},
+                                },
+                            ],
+                        },
                     ],
                 }
             ]
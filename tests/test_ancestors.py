@@ -0,0 +1,81 @@
+import math
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from swcviz import parse_swc, AncestorIndex, SWCModel
+
+
+SWC = """
+1 1 0 0 0 1 -1
+2 3 3 0 0 0.5 1
+3 3 3 4 0 0.4 2
+4 3 0 0 2 0.4 1
+5 3 0 2 2 0.3 4
+10 3 9 9 9 0.2 -1
+11 3 9 9 10 0.2 10
+""".strip()
+
+
+def test_ancestor_index_queries():
+    model = SWCModel.from_parse_result(parse_swc(SWC))
+    index = model.ancestor_index()
+    assert model.ancestor_index() is index
+
+    assert index.depth_of([1, 3, 5, 11]).tolist() == [0, 2, 2, 1]
+    assert index.ancestor([3, 3, 3, 3], [0, 1, 2, 3]).tolist() == [3, 2, 1, -1]
+    assert index.lca([3, 3, 5, 3], [5, 2, 5, 11]).tolist() == [1, 2, 5, -1]
+    assert index.distance([3, 3], [5, 11], weighted=False).tolist() == [4, -1]
+    d = index.distance([3, 3], [5, 11])
+    assert d[0] == pytest.approx(3 + 4 + 2 + math.hypot(2, 0))
+    assert d[1] == np.inf
+
+    assert index.path_to_root(3).tolist() == model.path_to_root(3) == [3, 2, 1]
+    flat, offsets = index.paths_to_root([5, 1, 11])
+    assert flat.tolist() == [5, 4, 1, 1, 11, 10] and offsets.tolist() == [0, 3, 4, 6]
+    assert index.path(3, 5).tolist() == [3, 2, 1, 4, 5]
+    with pytest.raises(ValueError):
+        index.path(3, 11)
+    with pytest.raises(KeyError):
+        index.depth_of([99])
+
+    # Structural edits rebuild the index
+    model.add_node(6, x=0.0, y=0.0, z=0.0, r=1.0, t=3)
+    model.add_edge(5, 6)
+    assert model.ancestor_index().depth_of([6]).tolist() == [3]
+
+    # Moving a node rebuilds it too, so weighted distances follow the coordinates
+    index = model.ancestor_index()
+    model.nodes[6]["x"] = 5.0
+    assert model.ancestor_index() is not index
+    assert model.ancestor_index().distance([5], [6])[0] == pytest.approx(math.hypot(5.0, 2.0, 2.0))
+    assert model.ancestor_index() is model.ancestor_index()
+
+
+def test_ancestor_index_matches_networkx_on_random_tree():
+    rng = np.random.default_rng(3)
+    size = 400
+    parent = np.array([-1] + [int(rng.integers(0, i)) for i in range(1, size)])
+    ids = rng.permutation(size) * 3 + 1
+    index = AncestorIndex(ids, parent)
+    G = nx.DiGraph((int(ids[p]), int(ids[c])) for c, p in enumerate(parent) if p >= 0)
+    root = int(ids[0])
+
+    a, b = rng.choice(ids, 200), rng.choice(ids, 200)
+    lca = index.lca(a, b)
+    hops = index.distance(a, b, weighted=False)
+    depth = nx.shortest_path_length(G, root)
+    for x, y, c, h in zip(a.tolist(), b.tolist(), lca.tolist(), hops.tolist()):
+        assert c == nx.lowest_common_ancestor(G, x, y)
+        assert h == depth[x] + depth[y] - 2 * depth[c]
+    assert index.depth_of(ids).tolist() == [depth[int(n)] for n in ids]
+
+
+def test_ancestor_index_rejects_cycles_and_multiple_parents():
+    with pytest.raises(ValueError):
+        AncestorIndex([1, 2, 3], [2, 0, 1])
+    model = SWCModel.from_parse_result(parse_swc(SWC))
+    model.add_edge(3, 5)
+    with pytest.raises(ValueError):
+        model.ancestor_index()
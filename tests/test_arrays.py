@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from swcviz import parse_swc, MorphologyArrays, SWCModel, GeneralModel, FrustaSet, plot_centroid
+from swcviz.model import _graph_attributes
+
+
+SWC = """
+# CYCLE_BREAK reconnect 4 6
+1 1 0 0 0 1 -1
+2 3 1 0 0 0.5 1
+3 3 2 0 0 0.4 2
+4 3 2 1 0 0.4 2
+5 3 1 1 0 0.3 1
+6 3 2 1 0 0.4 5
+7 3 9 9 9 0.2 -1
+""".strip()
+
+
+def test_arrays_from_table_match_swc_model():
+    result = parse_swc(SWC)
+    arrays = MorphologyArrays.from_table(result.table)
+    assert len(arrays) == 7 and arrays.directed
+    assert arrays.xyz.shape == (7, 3) and arrays.xyz.flags.c_contiguous
+    assert arrays.ids[arrays.parent[arrays.rows_of([3, 6])]].tolist() == [2, 5]
+    assert arrays.parent[arrays.rows_of([1, 7])].tolist() == [-1, -1]
+
+    model = SWCModel.from_parse_result(result)
+    from_model = model.to_arrays()
+    assert sorted(map(tuple, from_model.edge_ids().tolist())) == sorted(
+        map(tuple, arrays.edge_ids().tolist())
+    )
+    rebuilt = SWCModel.from_arrays(arrays)
+    assert set(rebuilt.edges) == set(model.edges)
+    assert rebuilt.nodes[4] == model.nodes[4]
+    assert _graph_attributes(arrays) == dict(_graph_attributes(model), graph_type="MorphologyArrays")
+
+
+def test_general_model_arrays_roundtrip_and_metrics():
+    gm = GeneralModel.from_parse_result(parse_swc(SWC))
+    arrays = gm.to_arrays()
+    assert not arrays.directed
+    assert arrays.edge_count == gm.number_of_edges()
+    # BFS forest parents: every non-root row points at a neighbour
+    nbrs = {tuple(sorted(e)) for e in arrays.edges.tolist()}
+    child = np.flatnonzero(arrays.parent >= 0)
+    assert all(tuple(sorted((c, p))) in nbrs for c, p in zip(child, arrays.parent[child]))
+    assert (arrays.parent == -1).sum() == 2
+
+    info = _graph_attributes(arrays)
+    expected = _graph_attributes(gm)
+    assert info == dict(expected, graph_type="MorphologyArrays")
+    assert info["cycles"] == 1 and info["components"] == 2
+
+    back = GeneralModel.from_arrays(arrays)
+    assert set(map(frozenset, back.edges)) == set(map(frozenset, gm.edges))
+    assert back.nodes[4]["x"] == gm.nodes[4]["x"]
+    assert set(arrays.to_networkx().edges) == set(back.edges)
+
+
+def test_geometry_and_viz_accept_arrays():
+    gm = GeneralModel.from_parse_result(parse_swc(SWC))
+    arrays = gm.to_arrays()
+    fr_model = FrustaSet.from_general_model(gm, sides=6)
+    fr_arrays = FrustaSet.from_general_model(arrays, sides=6)
+    assert fr_arrays.segments == fr_model.segments
+    assert np.array_equal(fr_arrays.vertices, fr_model.vertices)
+
+    a = plot_centroid(arrays).data[0]
+    b = plot_centroid(gm).data[0]
+    assert list(a.x) == list(b.x) and list(a.z) == list(b.z)
+    with pytest.raises(TypeError, match="Expected MorphologyArrays"):
+        MorphologyArrays.coerce([1, 2, 3])
@@ -0,0 +1,100 @@
+from pathlib import Path
+
+import pytest
+
+from swcviz import load_many, iter_load_many, GeneralModel, SWCModel, SWCParseResult
+
+
+GOOD = """
+# CYCLE_BREAK reconnect 2 3
+1 1 0 0 0 1 -1
+2 3 2 0 0 0.5 1
+3 3 2 0 0 0.5 1
+""".strip()
+
+BAD = """
+1 1 0 0 0 1 -1
+2 3 2 0 0 0.5 99
+""".strip()
+
+
+def _write_files(tmp_path: Path) -> list[Path]:
+    paths = []
+    for k, text in enumerate([GOOD, BAD, GOOD]):
+        p = tmp_path / f"cell{k}.swc"
+        p.write_text(text)
+        paths.append(p)
+    return paths
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_many_in_order_with_per_file_errors(tmp_path: Path, workers: int):
+    """Results follow input order; a bad file is reported without aborting the batch."""
+    paths = _write_files(tmp_path)
+    results = load_many(paths, workers=workers)
+
+    assert [r.index for r in results] == [0, 1, 2]
+    assert [r.ok for r in results] == [True, False, True]
+    assert isinstance(results[0].value, GeneralModel)
+    assert set(results[2].value.nodes) == {1, 2}
+    assert "parent id 99 does not exist" in str(results[1].error)
+    with pytest.raises(ValueError):
+        results[1].unwrap()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_many_reports_missing_files(tmp_path: Path, workers: int):
+    """A path that does not exist fails with FileNotFoundError, not a parse error."""
+    results = load_many([tmp_path / "nope.swc"], workers=workers)
+    assert isinstance(results[0].error, FileNotFoundError)
+
+
+def test_load_many_model_kinds(tmp_path: Path):
+    p = tmp_path / "cell.swc"
+    p.write_text(GOOD)
+    assert isinstance(load_many([p], workers=1, model="swc")[0].value, SWCModel)
+    assert isinstance(load_many([p], workers=1, model="raw")[0].value, SWCParseResult)
+    with pytest.raises(ValueError, match=r"Unknown model"):
+        load_many([p], model="mesh")
+
+
+def test_iter_load_many_yields_every_file(tmp_path: Path):
+    paths = _write_files(tmp_path)
+    seen = sorted(r.index for r in iter_load_many(paths, workers=2, model="raw"))
+    assert seen == [0, 1, 2]
+
+
+def test_aload_many_bounds_concurrency(tmp_path: Path):
+    """Async loading keeps input order, captures errors and never exceeds `limit` in flight."""
+    import asyncio
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from swcviz import aload_many, parse_swc
+
+    paths = _write_files(tmp_path) * 3
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    class CountingPool(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            def run():
+                with lock:
+                    state["active"] += 1
+                    state["peak"] = max(state["peak"], state["active"])
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    with lock:
+                        state["active"] -= 1
+
+            return super().submit(run)
+
+    with CountingPool(max_workers=8) as pool:
+        results = asyncio.run(aload_many(paths, limit=2, model="raw", executor=pool))
+
+    assert [r.index for r in results] == list(range(9))
+    assert [r.ok for r in results] == [True, False, True] * 3
+    assert results[0].value.table == parse_swc(GOOD).table
+    assert 1 <= state["peak"] <= 2
+    with pytest.raises(ValueError, match="limit must be >= 1"):
+        asyncio.run(aload_many(paths, limit=0))
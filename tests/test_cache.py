@@ -0,0 +1,94 @@
+import os
+from pathlib import Path
+
+import numpy as np
+
+from swcviz import ParseCache, GeneralModel, parse_swc
+
+
+SWC = """
+# CYCLE_BREAK reconnect 2 3
+1 1 0 0 0 1 -1
+2 3 2 0 0 0.5 1
+3 3 2 0 0 0.5 1
+""".strip()
+
+
+def test_cache_miss_then_hit_loads_memory_mapped(tmp_path: Path):
+    """Second parse of an unchanged file is served from memory-mapped sidecars."""
+    src = tmp_path / "cell.swc"
+    src.write_text(SWC)
+    cache = ParseCache(tmp_path / "cache")
+
+    first = cache.parse(src)
+    second = cache.parse(src)
+
+    assert cache.stats().misses == 1
+    assert cache.stats().hits == 1
+    assert cache.stats().bytes_saved == src.stat().st_size
+    assert isinstance(second.table.x, np.memmap)
+    assert second.table == first.table
+    assert second.reconnections == [(2, 3)]
+    assert second.comments == first.comments
+
+
+def test_cache_store_failure_still_returns_result(tmp_path: Path):
+    """An unusable cache directory skips caching instead of failing the parse."""
+    src = tmp_path / "cell.swc"
+    src.write_text(SWC)
+    blocked = tmp_path / "not-a-dir"
+    blocked.write_text("")
+    cache = ParseCache(blocked)
+
+    for _ in range(2):
+        result = cache.parse(src)
+        assert result.table == parse_swc(src).table
+    assert cache.stats().misses == 2 and cache.stats().hits == 0
+
+
+def test_cache_invalidates_on_content_change_but_not_on_touch(tmp_path: Path):
+    src = tmp_path / "cell.swc"
+    src.write_text(SWC)
+    cache = ParseCache(tmp_path / "cache")
+    cache.parse(src)
+
+    # Same bytes, new mtime: content hash still matches
+    st = src.stat()
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    cache.parse(src)
+    assert cache.stats().hits == 1
+
+    # Different content: entry is rebuilt
+    src.write_text(SWC.replace("0.5 1\n3", "0.5 1\n4 3 9 0 0 0.1 1\n3"))
+    result = cache.parse(src)
+    assert cache.stats().misses == 2
+    assert 4 in result.table
+
+
+def test_cache_eviction_by_total_size(tmp_path: Path):
+    cache = ParseCache(tmp_path / "cache", max_bytes=None)
+    for k in range(3):
+        p = tmp_path / f"cell{k}.swc"
+        p.write_text(SWC)
+        cache.parse(p)
+    total = cache.size_bytes()
+    assert total > 0
+    removed = cache.evict(total // 2)
+    assert removed >= 1
+    assert cache.size_bytes() <= total // 2
+    assert cache.stats().evictions == removed
+
+
+def test_cache_used_by_parse_swc_and_models(tmp_path: Path):
+    """The `cache=` keyword is threaded through parse_swc and model builders."""
+    src = tmp_path / "cell.swc"
+    src.write_text(SWC)
+    cache = ParseCache(tmp_path / "cache")
+    parse_swc(src, cache=cache)
+    gm = GeneralModel.from_swc_file(src, cache=cache)
+    assert set(gm.nodes) == {1, 2}
+    assert cache.stats().hits == 1
+
+    # Content strings bypass the cache
+    parse_swc(SWC, cache=cache)
+    assert cache.stats().misses == 1
@@ -1,4 +1,9 @@
-from swcviz import Segment, frustum_mesh, batch_frusta, FrustaSet, GeneralModel
+import dataclasses
+
+import numpy as np
+import pytest
+from swcviz.geometry import batch_spheres, sphere_mesh
+from swcviz import Segment, frustum_mesh, batch_frusta, FrustaSet, GeneralModel, PointSet
 
 
 def test_single_frustum_mesh_counts():
@@ -23,6 +28,67 @@ def test_batch_frusta_reindexing():
     assert max(max(face) for face in f) < len(v)
 
 
+def _reference_frustum(seg, sides, end_caps):
+    """Scalar per-vertex construction of one frustum (vertex and face order)."""
+    from swcviz.geometry import v_add, v_cross, v_mul, v_unit
+
+    W = v_unit(seg.vector())
+    if W == (0.0, 0.0, 0.0):
+        W = (0.0, 0.0, 1.0)
+    U = v_unit(v_cross((1.0, 0.0, 0.0) if abs(W[0]) <= 0.9 else (0.0, 1.0, 0.0), W))
+    V = v_cross(W, U)
+    verts = []
+    for center, r in ((seg.a, seg.ra), (seg.b, seg.rb)):
+        for k in range(sides):
+            t = 2.0 * np.pi * (k / sides)
+            verts.append(v_add(center, v_add(v_mul(U, r * np.cos(t)), v_mul(V, r * np.sin(t)))))
+    faces = []
+    for i in range(sides):
+        i1 = (i + 1) % sides
+        faces += [(i, i + sides, i1 + sides), (i, i1 + sides, i1)]
+    if end_caps and seg.ra > 0:
+        verts.append(seg.a)
+        faces += [(len(verts) - 1, (i + 1) % sides, i) for i in range(sides)]
+    if end_caps and seg.rb > 0:
+        verts.append(seg.b)
+        faces += [(len(verts) - 1, i + sides, (i + 1) % sides + sides) for i in range(sides)]
+    return verts, faces
+
+
+@pytest.mark.parametrize("end_caps", [False, True])
+def test_batch_frusta_array_matches_per_segment_construction(end_caps):
+    """The vectorized engine reproduces per-segment vertices and topology,
+    including zero-radius ends (no cap) and degenerate zero-length axes."""
+    from swcviz import batch_frusta_array
+
+    rng = np.random.default_rng(1)
+    segs = [
+        Segment(tuple(a), tuple(b), float(ra), float(rb))
+        for a, b, ra, rb in zip(
+            rng.normal(size=(40, 3)),
+            rng.normal(size=(40, 3)),
+            rng.choice([0.0, 1.0], 40),
+            rng.choice([0.0, 0.5], 40),
+        )
+    ]
+    segs += [Segment((0, 0, 0), (0, 0, 0), 1.0, 1.0), Segment((0, 0, 0), (3, 0.1, 0), 1.0, 1.0)]
+    expected_v, expected_f = [], []
+    for seg in segs:
+        v, f = _reference_frustum(seg, 7, end_caps)
+        expected_f += [tuple(x + len(expected_v) for x in face) for face in f]
+        expected_v += v
+
+    v, f = batch_frusta(segs, sides=7, end_caps=end_caps)
+    assert f == expected_f
+    np.testing.assert_allclose(v, expected_v, rtol=0, atol=1e-12)
+
+    a = np.array([s.a for s in segs], dtype=float)
+    b = np.array([s.b for s in segs], dtype=float)
+    va, fa = batch_frusta_array(a, b, [s.ra for s in segs], [s.rb for s in segs], sides=7, end_caps=end_caps)
+    assert fa.tolist() == [list(face) for face in expected_f]
+    np.testing.assert_allclose(va, expected_v, rtol=0, atol=1e-12)
+
+
 def test_frustaset_from_general_model_and_arrays():
     """Build `FrustaSet` from a `GeneralModel` and confirm Mesh3d arrays match vertices/faces lengths."""
     swc = """
@@ -38,3 +104,134 @@ def test_frustaset_from_general_model_and_arrays():
     # Basic shape checks
     assert len(x) == len(y) == len(z) == len(fr.vertices)
     assert len(i) == len(j) == len(k) == len(fr.faces)
+    # Segments are kept as arrays; Segment objects are built only on request
+    assert fr._segments is None and fr.a.shape == (fr.segment_count, 3)
+    assert [seg.b for seg in fr.segments] == [tuple(p) for p in fr.b.tolist()]
+    assert [seg.ra for seg in fr.segments] == fr.ra.tolist()
+    rebuilt = FrustaSet.from_segments(fr.segments, sides=8)
+    assert np.array_equal(rebuilt.vertices, fr.vertices) and np.array_equal(rebuilt.faces, fr.faces)
+    # Array-backed sets compare by identity instead of raising on array truth values
+    assert fr == fr and fr != FrustaSet.from_general_model(gm, sides=8, end_caps=False)
+    ps = PointSet.from_points([(0.0, 0.0, 0.0)])
+    assert ps == ps and ps != ps.scaled(2.0)
+
+
+@pytest.mark.parametrize("end_caps", [False, True])
+def test_scaled_moves_vertices_like_a_remesh(end_caps):
+    """`scaled` / `scaled_many` match a rebuild from scaled segments and share faces."""
+    swc = """
+1 1 0 0 0 1 -1
+2 3 1 0 0 0.5 1
+3 3 1 1 0 0 2
+4 3 2 0 1 0.4 2
+""".strip()
+    fr = FrustaSet.from_general_model(GeneralModel.from_swc_file(swc), sides=8, end_caps=end_caps)
+    frames = fr.scaled_many([0.5, 1.0, 2.0])
+    assert frames.shape == (3,) + fr.vertices.shape
+    assert np.array_equal(frames[1], fr.vertices)
+
+    doubled = fr.scaled(2.0)
+    assert doubled.faces is fr.faces
+    # Only arrays are scaled; end points are shared and no Segment list is built
+    assert doubled.a is fr.a and np.array_equal(doubled.rb, 2.0 * fr.rb)
+    assert fr._segments is None and doubled._segments is None
+    assert np.allclose(doubled.vertices, frames[2])
+    # Node 3 has radius 0, so caps stay where a rebuild keeps them
+    derived = dataclasses.replace(fr, radial=None)
+    ref, ref_faces = batch_frusta(doubled.segments, sides=8, end_caps=end_caps)
+    assert np.allclose(doubled.vertices, ref) and np.array_equal(doubled.faces, ref_faces)
+    assert np.allclose(derived.scaled(0.5).vertices, fr.scaled(0.5).vertices)
+    assert np.allclose(doubled.scaled(0.5).vertices, fr.vertices)
+
+    ps = PointSet.from_array(np.array([[0.0, 0.0, 0.0], [1.0, 2.0, 3.0]]), base_radius=0.5, dtype=np.float32)
+    ref, _ = batch_spheres(ps.points.tolist(), radius=1.5)
+    assert ps.scaled(3.0).faces is ps.faces
+    assert ps.scaled_many([3.0]).dtype == np.float32
+    assert np.allclose(ps.scaled(3.0).vertices, ref, atol=1e-6)
+
+
+@pytest.mark.parametrize("end_caps", [False, True])
+def test_welded_frustaset_shares_rings_along_sections(end_caps):
+    """`weld=True` places one ring per section node, transported without twist."""
+    swc = """
+# CYCLE_BREAK reconnect 5 7
+1 1 0 0 0 1 -1
+2 3 1 0 0 0.5 1
+3 3 2 0 0 0.5 2
+4 3 3 1 0 0.4 3
+5 3 3 2 1 0.3 4
+6 3 1 -1 0 0.3 2
+7 3 3 2 1 0.3 6
+""".strip()
+    gm = GeneralModel.from_swc_file(swc)
+    sides = 8
+    plain = FrustaSet.from_general_model(gm, sides=sides, end_caps=end_caps)
+    welded = FrustaSet.from_general_model(gm, sides=sides, end_caps=end_caps, weld=True)
+    arrays = gm.to_arrays()
+    sections = arrays.sections()
+    loose = int((sections.edge_sections(arrays.edges) < 0).sum())
+    assert welded.welded and loose == 1
+    caps = welded.faces.shape[0] - 2 * sides * plain.segment_count
+    assert welded.faces.max() == len(welded.vertices) - 1
+    assert len(welded.vertices) == (sections.nodes.size + 2 * loose) * sides + caps // sides
+    # All radii are > 0, so every section and the loose frustum is capped at both ends
+    assert caps == (2 * (len(sections) + loose) * sides if end_caps else 0)
+
+    # Rings sit on the node circles; the first ring axis stays in its plane
+    rings = welded.vertices[: sections.nodes.size * sides].reshape(-1, sides, 3)
+    centers = arrays.xyz[sections.nodes]
+    assert np.allclose(np.linalg.norm(rings - centers[:, None], axis=2), arrays.r[sections.nodes][:, None])
+    straight = sections.section_nodes(0)[:3]
+    assert np.allclose(arrays.xyz[straight][:, 1:], 0.0)
+    assert np.allclose(rings[0, 0] - centers[0], (rings[1, 0] - centers[1]) * 2.0)
+    assert np.allclose(welded.scaled(2.0).vertices, welded.scaled_many([2.0])[0])
+
+
+def test_pointset_per_point_radii_from_template():
+    """Per-point radii scale the template sphere; `batch_spheres` matches `sphere_mesh`."""
+    pts = [(0.0, 0.0, 0.0), (1.0, 2.0, 3.0)]
+    v0, f0 = sphere_mesh(pts[1], 0.5, stacks=4, slices=6)
+    verts, faces = batch_spheres(pts, radius=0.5, stacks=4, slices=6)
+    assert np.allclose(verts[len(v0):], v0)
+    assert faces[len(f0):] == [tuple(i + len(v0) for i in f) for f in f0]
+
+    ps = PointSet.from_txt(
+        "0 0 0 0.5\n1 2 3 2.0\n", column_names=["size"], radius_column="size", stacks=4, slices=6
+    )
+    assert ps.radii.tolist() == [0.5, 2.0]
+    spheres = ps.vertices.reshape(2, -1, 3) - ps.points[:, None, :]
+    assert np.allclose(np.linalg.norm(spheres, axis=2), [[0.5], [2.0]])
+    assert np.allclose(ps.scaled(2.0).vertices.reshape(2, -1, 3)[1] - ps.points[1], 2.0 * spheres[1])
+    with pytest.raises(ValueError, match="radii"):
+        PointSet.from_array(np.zeros((2, 3)), radii=[1.0])
+    with pytest.raises(ValueError, match="size"):
+        PointSet.from_txt("0 0 0\n", radius_column="size")
+
+
+def test_pointset_from_compressed_txt(tmp_path):
+    """`PointSet.from_txt` reads gzip-compressed point files directly."""
+    import gzip
+
+    p = tmp_path / "points.txt.gz"
+    p.write_bytes(gzip.compress(b"# x y z\n0 0 0\n1 2 3\n"))
+    ps = PointSet.from_txt(p, base_radius=0.1)
+    assert ps.points.tolist() == [[0.0, 0.0, 0.0], [1.0, 2.0, 3.0]]
+
+
+def test_pointset_from_txt_bulk_columns_and_mesh():
+    txt = "# x y z size label\n0 0 0 0.5 a\n1 2 3 1.5 b\n"
+    ps = PointSet.from_txt(txt, base_radius=0.2, column_names=["size"])
+    assert ps.points.shape == (2, 3)
+    assert ps.columns["size"].tolist() == [0.5, 1.5]
+    assert ps.columns["col4"].tolist() == ["a", "b"]
+
+    verts, faces = batch_spheres(ps.points.tolist(), radius=0.2)
+    assert np.allclose(ps.vertices, verts)
+    assert np.array_equal(ps.faces, faces)
+    x, y, z, i, j, k = ps.scaled(2.0).to_mesh3d_arrays()
+    assert len(x) == len(verts) and len(i) == len(faces)
+
+    with pytest.raises(ValueError, match=r"Line 3: could not parse floats"):
+        PointSet.from_txt("0 0 0\n\n1 2 x\n")
+    with pytest.raises(ValueError, match=r"Line 1: expected exactly 3 columns"):
+        PointSet.from_txt("0 0 0 1\n", allow_extra_columns=False)
@@ -1,6 +1,7 @@
 from pathlib import Path
 import pytest
-from swcviz import parse_swc, SWCParseResult
+import numpy as np
+from swcviz import parse_swc, iter_swc_chunks, write_swc, SWCParseResult, SWCRecord, SWCTable
 
 
 def test_parse_basic_from_string():
@@ -117,3 +118,233 @@ def test_parse_example_data_directory_if_present():
         result = parse_swc(swc_path, strict=True, validate_reconnections=False)
         assert isinstance(result, SWCParseResult)
         assert len(result.records) > 0
+
+
+@pytest.mark.parametrize(
+    "swc",
+    [
+        "# h\n1 1 0 0 0 1 -1\n2 3 1 0 0 0.5 1\n3.0 3 2 0 0 0.5 2.0\n",
+        "# CYCLE_BREAK reconnect 3 2\n1 1 0 0 0 1 -1\n\n2 3 2 0 0 0.5 1\n3 3 2 0 0 0.5 1\n",
+        "# only comments\n",
+        # ids above 2**53 must not be rounded through float64
+        "9007199254740993 1 0 0 0 1 -1\n9007199254740992 3 1 0 0 0.5 9007199254740993\n",
+    ],
+)
+def test_numpy_backend_matches_python(swc):
+    """The bulk NumPy backend yields the same records, pairs and comments."""
+    py = parse_swc(swc, backend="python")
+    fast = parse_swc(swc, backend="numpy")
+    assert fast.table == py.table
+    assert fast.records == py.records
+    assert fast.reconnections == py.reconnections
+    assert fast.comments == py.comments
+
+
+@pytest.mark.parametrize(
+    "swc",
+    [
+        "1 1 0 0 0 1 -1\n2 3 1 0 0 0.5\n",  # too few columns
+        "1 1 0 0 0 1 -1\n2 3 1 0 0 0.5 1 99\n",  # extra column in strict mode
+        "1 1 0 0 0 1 -1\n2 3 1 x 0 0.5 1\n",  # non-numeric value
+        "1 1 0 0 0 1 -1\n2 3.5 1 0 0 0.5 1\n",  # non-integral type
+        "1 1 0 0 0 1 -1\n1e1 3 1 0 0 0.5 1\n",  # exponent id
+        "1 1 0 0 0 1 -1\n3.00 3 1 0 0 0.5 1\n",  # decimal id other than n.0
+        "1 1 0 0 0 1 -1\n2 3 1 0 0 0.5 1e0\n",  # exponent parent
+        "1 1 0 0 0 1 -1\n1 3 1 0 0 0.5 1\n2 x\n",  # duplicate before malformed row
+        "1 1 0 0 0 1 -1\n2 3 1 0 0 0.5 1\n2 3 1 0 0 0.5 1\n",  # duplicate id
+        "1 1 0 0 0 1 -1\n2 3 1 0 0 0.5 99\n",  # missing parent
+        "# CYCLE_BREAK reconnect 2 7\n1 1 0 0 0 1 -1\n2 3 1 0 0 0.5 1\n",
+        "# CYCLE_BREAK reconnect 2 3\n1 1 0 0 0 1 -1\n2 3 1 0 0 0.5 1\n3 3 1 0 0 0.6 1\n",
+    ],
+)
+def test_numpy_backend_error_messages_match_python(swc):
+    """Malformed input raises the same line-numbered message on both backends."""
+    with pytest.raises(ValueError) as py_err:
+        parse_swc(swc, backend="python")
+    with pytest.raises(ValueError) as np_err:
+        parse_swc(swc, backend="numpy")
+    assert str(np_err.value) == str(py_err.value)
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError, match=r"Unknown parse backend"):
+        parse_swc("1 1 0 0 0 1 -1", backend="fortran")
+
+
+def test_table_columns_and_id_index():
+    """`SWCParseResult.table` exposes typed columns and vectorized id -> row lookups."""
+    swc = """
+5 1 0 0 0 1 -1
+2 3 1 0 0 0.5 5
+9 3 2 0 0 0.4 2
+""".strip()
+    table = parse_swc(swc).table
+    assert isinstance(table, SWCTable)
+    assert len(table) == 3
+    assert table.n.dtype == np.int64 and table.t.dtype == np.int32
+    assert table.x.dtype == np.float64 and table.line.dtype == np.int64
+    assert table.rows_of([9, 5]).tolist() == [2, 0]
+    assert table.contains([2, 3]).tolist() == [True, False]
+    assert 9 in table and 4 not in table
+    with pytest.raises(KeyError):
+        table.row_of(4)
+
+
+def test_records_view_is_lazy_mapping():
+    """`records` yields `SWCRecord` objects on demand, in file order."""
+    swc = """
+5 1 0 0 0 1 -1
+2 3 1 0 0 0.5 5
+""".strip()
+    result = parse_swc(swc)
+    records = result.records
+    assert list(records) == [5, 2]
+    assert records[2] == SWCRecord(n=2, t=3, x=1.0, y=0.0, z=0.0, r=0.5, parent=5, line=2)
+    assert [rec.n for rec in records.values()] == [5, 2]
+    assert dict(records.items())[5].parent == -1
+    with pytest.raises(KeyError):
+        records[7]
+
+
+def test_parse_result_from_records_roundtrip():
+    result = parse_swc("# CYCLE_BREAK reconnect 2 3\n1 1 0 0 0 1 -1\n2 3 1 0 0 0.5 1\n3 3 1 0 0 0.5 1")
+    rebuilt = SWCParseResult.from_records(
+        result.records.values(), result.reconnections, result.comments
+    )
+    assert rebuilt.table == result.table
+    assert rebuilt.reconnections == [(2, 3)]
+
+
+def test_iter_swc_chunks_batches_match_full_parse():
+    """Chunks have bounded size, concatenate to the full table, and carry directives."""
+    lines = ["# CYCLE_BREAK reconnect 2 3", "1 1 0 0 0 1 -1"]
+    lines += [f"{i} 3 {i} 0 0 0.5 {i - 1}" for i in range(2, 11)]
+    lines.insert(6, "# mid-file note")
+    chunks = list(iter_swc_chunks(lines, chunk_rows=4))
+
+    assert [len(c.table) for c in chunks] == [4, 4, 2]
+    assert [c.start_row for c in chunks] == [0, 4, 8]
+    assert chunks[0].reconnections == [(2, 3)]
+    assert chunks[1].comments == ["# mid-file note"]
+    full = parse_swc(lines, validate_reconnections=False).table
+    assert np.concatenate([c.table.n for c in chunks]).tolist() == full.n.tolist()
+    assert np.concatenate([c.table.line for c in chunks]).tolist() == full.line.tolist()
+
+
+def test_iter_swc_chunks_reports_line_of_malformed_row():
+    lines = ["1 1 0 0 0 1 -1"] + [f"{i} 3 0 0 0 1 {i - 1}" for i in range(2, 6)] + ["6 3 0 0 x 1 5"]
+    chunks = iter_swc_chunks(lines, chunk_rows=3)
+    assert len(next(chunks).table) == 3
+    with pytest.raises(ValueError, match=r"^Line 6: failed to parse values"):
+        next(chunks)
+
+
+def test_iter_swc_chunks_header_only_source():
+    chunks = list(iter_swc_chunks("# just a header\n"))
+    assert len(chunks) == 1
+    assert len(chunks[0].table) == 0
+    assert chunks[0].comments == ["# just a header"]
+
+
+@pytest.mark.parametrize("suffix", [".swc.gz", ".swc.bz2", ".swc.xz", ".swc"])
+def test_parse_compressed_files(tmp_path: Path, suffix: str):
+    """gzip/bz2/xz inputs are detected by extension and decompressed on the fly."""
+    import bz2
+    import gzip
+    import lzma
+
+    text = "# CYCLE_BREAK reconnect 2 3\n1 1 0 0 0 1 -1\n2 3 2 0 0 0.5 1\n3 3 2 0 0 0.5 1\n"
+    openers = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+    p = tmp_path / f"cell{suffix}"
+    opener = openers.get(p.suffix)
+    if opener is None:
+        p.write_text(text)
+    else:
+        with opener(p, "wt", encoding="utf-8") as f:
+            f.write(text)
+
+    for backend in ("python", "numpy"):
+        result = parse_swc(p, backend=backend)
+        assert result.table.n.tolist() == [1, 2, 3]
+        assert result.reconnections == [(2, 3)]
+
+
+def test_parse_compressed_detected_by_magic_bytes(tmp_path: Path):
+    import gzip
+
+    p = tmp_path / "cell.swc"  # no compression suffix
+    p.write_bytes(gzip.compress(b"1 1 0 0 0 1 -1\n2 3 1 0 0 0.5 1\n"))
+    assert parse_swc(p).table.n.tolist() == [1, 2]
+
+
+def test_write_swc_roundtrip_exact(tmp_path: Path):
+    """Writing and re-parsing reproduces the columns, comments and reconnections exactly."""
+    swc = """
+# header line
+# CYCLE_BREAK reconnect 3 2
+1 1 8878.525222 -2745.038908 0 11.418385 -1
+2 3 0.1 0.2 0.30000000000000004 1e-07 1
+3 3 0.1 0.2 0.30000000000000004 1e-07 1
+10 -2 -5 12345678.5 3 2 3
+""".strip()
+    result = parse_swc(swc)
+    out = tmp_path / "out.swc"
+    write_swc(result, out)
+    again = parse_swc(out)
+    for name in ("n", "t", "x", "y", "z", "r", "parent"):
+        assert np.array_equal(getattr(again.table, name), getattr(result.table, name))
+    assert again.comments == result.comments
+    assert again.reconnections == [(2, 3)]
+    # Decimals are chosen per column: r needs 7 for 1e-07, z falls back to repr
+    assert out.read_text().splitlines()[2] == "1 1 8878.525222 -2745.038908 0.0 11.4183850 -1"
+
+
+def test_write_swc_precision_and_gzip(tmp_path: Path):
+    import gzip
+
+    result = parse_swc("1 1 0.123456 0 0 1 -1\n2 3 1 0 0 0.5 1")
+    out = tmp_path / "out.swc.gz"
+    write_swc(result, out, precision=2, comments=["written by test"])
+    text = gzip.decompress(out.read_bytes()).decode()
+    assert text.splitlines() == [
+        "# written by test",
+        "1 1 0.12 0.00 0.00 1.00 -1",
+        "2 3 1.00 0.00 0.00 0.50 1",
+    ]
+
+
+@pytest.mark.parametrize("precision", [0, 2, 3])
+def test_write_swc_precision_rounds_like_f_format(precision):
+    """Half-way decimals and negative zeros render exactly as ``f"{v:.{p}f}"``."""
+    import io
+
+    values = [26.225, 3.295, -84.535, 0.125, 2.5, -0.0, -0.001, 1e-7]
+    rows = [f"{i + 1} 3 {v!r} {v!r} {v!r} 1 -1" for i, v in enumerate(values)]
+    buf = io.StringIO()
+    write_swc(parse_swc("\n".join(rows)), buf, precision=precision)
+    fields = [line.split()[2] for line in buf.getvalue().splitlines()]
+    assert fields == [f"{v:.{precision}f}" for v in values]
+
+
+def test_parse_result_accepts_records_like_before():
+    """The record-based constructor keeps working and builds the same table."""
+    parsed = parse_swc("1 1 0 0 0 1 -1\n2 3 1 0 0 0.5 1")
+    records = dict(parsed.records.items())
+    by_keyword = SWCParseResult(records=records, reconnections=[(1, 2)], comments=["c"])
+    by_position = SWCParseResult(list(records.values()), [(1, 2)], ["c"])
+    for result in (by_keyword, by_position):
+        assert result.table == parsed.table
+        assert result.records[2] == records[2]
+        assert result.reconnections == [(1, 2)] and result.comments == ["c"]
+    with pytest.raises(ValueError, match="exactly one"):
+        SWCParseResult(table=parsed.table, records=records)
+
+
+def test_write_swc_adds_missing_reconnect_directives():
+    import io
+
+    result = parse_swc("1 1 0 0 0 1 -1\n2 3 1 0 0 0.5 1\n3 3 1 0 0 0.5 1")
+    result = SWCParseResult(table=result.table, reconnections=[(2, 3)], comments=[])
+    buf = io.StringIO()
+    write_swc(result, buf)
+    assert buf.getvalue().splitlines()[0] == "# CYCLE_BREAK reconnect 2 3"
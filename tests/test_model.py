@@ -88,6 +88,51 @@ def test_general_model_reconnection_merge_and_print(capsys):
     assert "nodes=" in out and "edges=" in out
 
 
+def test_general_model_bulk_build_provenance():
+    """Merged nodes keep first-appearance order, smallest-id attributes and sorted provenance."""
+    swc = """
+# CYCLE_BREAK reconnect 5 3
+# CYCLE_BREAK reconnect 3 6
+1 1 0 0 0 1 -1
+5 3 1 0 0 0.5 1
+2 3 2 0 0 0.5 1
+3 3 1 0 0 0.5 2
+6 3 1 0 0 0.5 2
+4 3 3 0 0 0.5 6
+""".strip()
+    result = parse_swc(swc)
+    gm = GeneralModel.from_parse_result(result)
+    rep = next(n for n, a in gm.nodes(data=True) if a["n"] == 3)
+    assert list(gm.nodes) == [1, rep, 2, 4]
+    assert gm.nodes[rep]["merged_ids"] == [3, 5, 6]
+    assert gm.nodes[rep]["lines"] == [4, 6, 7]
+    assert gm.nodes[rep]["x"] == 1.0
+    assert set(map(frozenset, gm.edges)) == {
+        frozenset(e) for e in [(1, rep), (1, 2), (2, rep), (rep, 4)]
+    }
+
+    lean = GeneralModel.from_parse_result(result, provenance=False)
+    assert "merged_ids" not in lean.nodes[rep] and "lines" not in lean.nodes[rep]
+    assert set(lean.edges) == set(gm.edges)
+
+
+def test_general_model_long_reconnection_chain():
+    """A long chain of reconnect pairs collapses into one node keyed by the smallest id."""
+    k = 5000
+    rows = ["1 1 0 0 0 1 -1"] + [f"{i} 3 1 0 0 0.5 1" for i in range(2, k + 2)]
+    header = [f"# CYCLE_BREAK reconnect {i} {i + 1}" for i in range(k, 1, -1)]
+    gm = GeneralModel.from_parse_result(parse_swc("\n".join(header + rows)))
+    assert list(gm.nodes) == [1, 2]
+    assert gm.nodes[2]["merged_ids"] == list(range(2, k + 2))
+    assert list(gm.edges) == [(1, 2)]
+
+    bad = "# CYCLE_BREAK reconnect 2 9\n1 1 0 0 0 1 -1\n2 3 1 0 0 0.5 1"
+    with pytest.raises(ValueError, match=r"\(2, 9\) refers to undefined"):
+        GeneralModel.from_parse_result(
+            parse_swc(bad, validate_reconnections=False), validate_reconnections=False
+        )
+
+
 def test_swcmodel_print_attributes_no_crash(capsys):
     """Smoke test for SWCModel.print_attributes with and without details.
 
@@ -131,3 +176,193 @@ def test_optional_data_directory_models_if_present():
                 assert indeg == 0
             else:
                 assert indeg == 1
+
+
+def test_models_write_back_to_swc(tmp_path: Path):
+    """SWCModel and GeneralModel round-trip through `to_swc` and the parser."""
+    swc = """
+# CYCLE_BREAK reconnect 3 5
+1 1 0 0 0 1 -1
+2 3 1 0 0 0.5 1
+3 3 2 0 0 0.5 2
+4 3 1 1 0 0.5 1
+5 3 2 0 0 0.5 4
+""".strip()
+    m = SWCModel.from_swc_file(swc)
+    p = tmp_path / "m.swc"
+    m.to_swc(p)
+    m2 = SWCModel.from_swc_file(p)
+    assert set(m2.edges) == set(m.edges)
+    assert m2.graph["reconnections"] == [(3, 5)]
+
+    gm = GeneralModel.from_swc_file(swc)
+    assert gm.number_of_edges() == 4  # 1-2, 2-3, 1-4, 4-3 form a cycle
+    gm.to_swc(p)
+    gm2 = GeneralModel.from_swc_file(p)
+    assert set(gm2.nodes) == set(gm.nodes)
+    assert {frozenset(e) for e in gm2.edges} == {frozenset(e) for e in gm.edges}
+    for n in gm:
+        assert (gm2.nodes[n]["x"], gm2.nodes[n]["r"]) == (gm.nodes[n]["x"], gm.nodes[n]["r"])
+
+
+def test_async_model_loading(tmp_path):
+    """`afrom_swc_file` / `aparse_swc` match their blocking counterparts."""
+    import asyncio
+    from swcviz import aparse_swc
+
+    swc = """
+# CYCLE_BREAK reconnect 2 3
+1 1 0 0 0 1 -1
+2 3 2 0 0 0.5 1
+3 3 2 0 0 0.5 1
+""".strip()
+    p = tmp_path / "cell.swc"
+    p.write_text(swc)
+
+    async def main():
+        return await asyncio.gather(
+            aparse_swc(p, backend="numpy"),
+            GeneralModel.afrom_swc_file(p),
+            SWCModel.afrom_swc_file(str(p)),
+        )
+
+    result, gm, sm = asyncio.run(main())
+    assert result.reconnections == [(2, 3)]
+    assert set(gm.nodes) == set(GeneralModel.from_swc_file(p).nodes) == {1, 2}
+    assert set(sm.edges) == {(1, 2), (1, 3)}
+
+
+def _reference_attributes(G):
+    """The original networkx-based metrics, for parity checks."""
+    import networkx as nx
+
+    U = G.to_undirected()
+    components = nx.number_connected_components(U)
+    if G.is_directed():
+        branch = sum(1 for n in G if G.out_degree(n) > 1)
+        roots = sum(1 for n in G if G.in_degree(n) == 0)
+        leaves = sum(1 for n in G if G.out_degree(n) == 0)
+    else:
+        branch = sum(1 for n in G if G.degree(n) > 2)
+        roots = None
+        leaves = sum(1 for n in G if G.degree(n) == 1)
+    return {
+        "graph_type": type(G).__name__,
+        "directed": G.is_directed(),
+        "nodes": G.number_of_nodes(),
+        "edges": G.number_of_edges(),
+        "components": components,
+        "cycles": U.number_of_edges() - U.number_of_nodes() + components,
+        "branch_points_count": branch,
+        "roots_count": roots,
+        "leaves_count": leaves,
+        "self_loops": nx.number_of_selfloops(G),
+        "density": nx.density(U),
+    }
+
+
+@pytest.mark.parametrize("directed", [True, False])
+def test_graph_attributes_match_networkx_reference(directed):
+    import networkx as nx
+    from swcviz.model import _graph_attributes
+
+    G = nx.gnm_random_graph(300, 320, seed=3, directed=directed)
+    G.add_edges_from([(5, 5), (7, 8), (8, 7), (400, 401)])
+    info = _graph_attributes(G)
+    expected = _reference_attributes(G)
+    assert info.pop("density") == pytest.approx(expected.pop("density"))
+    assert info == expected
+
+
+def test_graph_attributes_cached_until_mutation():
+    gm = GeneralModel.from_parse_result(parse_swc("1 1 0 0 0 1 -1\n2 3 1 0 0 0.5 1"))
+    first = gm.graph_attributes()
+    assert first["nodes"] == 2 and first["leaves_count"] == 2
+    assert "swcviz_graph_attributes" in gm.__networkx_cache__
+    first["nodes"] = -1  # callers get a copy
+    assert gm.graph_attributes()["nodes"] == 2
+
+    gm.add_node(3, x=0.0, y=0.0, z=0.0, r=1.0)
+    gm.add_edge(2, 3)
+    info = gm.graph_attributes()
+    assert (info["nodes"], info["edges"], info["leaves_count"]) == (3, 2, 2)
+    gm.remove_edge(1, 2)
+    assert gm.graph_attributes()["components"] == 2
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_general_model_save_load_round_trip(tmp_path: Path, mmap):
+    """save/load restores nodes, attributes, provenance, edges and graph data
+    exactly; load_arrays matches to_arrays without building the graph."""
+    import numpy as np
+
+    swc = """
+# CYCLE_BREAK reconnect 5 3
+# CYCLE_BREAK reconnect 3 6
+1 1 0 0 0 1 -1
+2 3 1 0 0 0.5 1
+3 3 2 0 0 0.5 2
+4 3 3 0 0 0.5 3
+5 3 2 0 0 0.5 1
+6 3 2 0 0 0.5 4
+""".strip()
+    gm = GeneralModel.from_swc_file(swc.splitlines())
+    gm.add_node(42)  # bare node (e.g. an undefined parent with strict=False)
+    gm.add_node(43, n=43, x=1.0, y=2.0, z=3.0, r=0.1, line=9)
+    gm.add_edge(43, 1)
+
+    path = tmp_path / "model"
+    gm.save(path)
+    loaded = GeneralModel.load(path, mmap=mmap)
+    assert list(loaded.nodes) == list(gm.nodes)
+    assert dict(loaded.nodes(data=True)) == dict(gm.nodes(data=True))
+    assert loaded.nodes[3]["merged_ids"] == [3, 5, 6]
+    assert {frozenset(e) for e in loaded.edges} == {frozenset(e) for e in gm.edges}
+    assert loaded.graph == gm.graph
+
+    gm.remove_node(42)
+    gm.save(path)  # overwrites in place
+    arrays, expected = GeneralModel.load_arrays(path, mmap=mmap), gm.to_arrays()
+    for name in ("ids", "xyz", "r", "t", "parent", "edges", "line"):
+        np.testing.assert_array_equal(getattr(arrays, name), getattr(expected, name))
+
+
+def test_fill_graph_matches_public_networkx_methods():
+    """`_fill_graph` (the one place that writes networkx's private adjacency
+    storage) builds the same graph as add_nodes_from/add_edges_from."""
+    from swcviz.model import _fill_graph
+
+    nodes = [(1, {"x": 0.0}), (2, {"x": 1.0}), (3, {}), (4, {"r": 0.5})]
+    edges = [(1, 2), (2, 3), (3, 1), (4, 4)]
+    fast, public = GeneralModel(), GeneralModel()
+    _fill_graph(fast, [(n, dict(d)) for n, d in nodes], edges)
+    public.add_nodes_from(nodes)
+    public.add_edges_from(edges)
+
+    assert list(fast.nodes(data=True)) == list(public.nodes(data=True))
+    assert list(fast.edges(data=True)) == list(public.edges(data=True))
+    assert {n: dict(nbrs) for n, nbrs in fast.adj.items()} == {
+        n: dict(nbrs) for n, nbrs in public.adj.items()
+    }
+    # One data dict per edge, shared by both directions, as networkx keeps it
+    assert fast[1][2] is fast[2][1] and fast[1][2] is not fast[2][3]
+    fast.edges[1, 2]["w"] = 1.0
+    assert fast[2][1] == {"w": 1.0} and fast[2][3] == {}
+    fast.add_edge(1, 4)
+    fast.remove_node(2)
+    assert sorted(fast.edges) == [(1, 3), (1, 4), (4, 4)]
+    with pytest.raises(ValueError, match="empty undirected"):
+        _fill_graph(fast, [], [])
+
+
+def test_general_model_save_rejects_unsupported_data(tmp_path: Path):
+    gm = GeneralModel.from_parse_result(parse_swc("1 1 0 0 0 1 -1\n2 3 1 0 0 0.5 1"))
+    gm.nodes[2]["color"] = "red"
+    with pytest.raises(ValueError, match="color"):
+        gm.save(tmp_path / "a")
+    del gm.nodes[2]["color"]
+    gm.graph["bounds"] = {1, 2}
+    with pytest.raises(ValueError, match="JSON"):
+        gm.save(tmp_path / "b")
+    with pytest.raises(ValueError, match="not a saved GeneralModel"):
+        GeneralModel.load(tmp_path / "missing")
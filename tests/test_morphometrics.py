@@ -0,0 +1,107 @@
+import math
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from swcviz import parse_swc, SWCModel, GeneralModel, MorphologyArrays
+from swcviz.morphometrics import (
+    node_metrics,
+    node_metrics_many,
+    section_metrics,
+    section_metrics_many,
+    sholl,
+    sholl_many,
+)
+
+
+# Soma 1 with two stems; stem 2-3 bifurcates at 3 into 4 and 5-6.
+SWC = """
+1 1 0 0 0 1 -1
+2 3 1 0 0 1 1
+3 3 2 0 0 1 2
+4 3 3 0 0 1 3
+5 3 2 1 0 0.5 3
+6 3 2 2 0 0.5 5
+7 3 -1 0 0 1 1
+""".strip()
+
+
+def test_node_and_section_metrics_small_tree():
+    model = SWCModel.from_parse_result(parse_swc(SWC))
+    nodes = node_metrics(model)
+    by_id = {int(n): k for k, n in enumerate(nodes.ids)}
+    rows = [by_id[n] for n in range(1, 8)]
+    assert nodes.depth[rows].tolist() == [0, 1, 2, 3, 3, 4, 1]
+    assert nodes.path_length[rows].tolist() == pytest.approx([0, 1, 2, 3, 3, 4, 1])
+    assert nodes.branch_order[rows].tolist() == [0, 0, 0, 1, 1, 1, 0]
+    assert nodes.strahler[rows].tolist() == [2, 2, 2, 1, 1, 1, 1]
+
+    sections = section_metrics(model)
+    assert len(sections) == 4
+    spans = {(int(s), int(e)): k for k, (s, e) in enumerate(zip(sections.start, sections.end))}
+    assert set(spans) == {(1, 3), (3, 4), (3, 6), (1, 7)}
+    k = spans[(1, 3)]
+    assert sections.length[k] == pytest.approx(2.0)
+    assert sections.volume[k] == pytest.approx(2 * math.pi)
+    assert sections.area[k] == pytest.approx(4 * math.pi)
+    assert nodes.section[by_id[6]] == nodes.section[by_id[5]] == spans[(3, 6)]
+    assert nodes.section[by_id[1]] == -1
+
+    radii = np.array([0.5, 1.5, 2.5, 3.5])
+    assert sholl(model, radii).tolist() == [2, 1, 2, 0]
+    assert sholl(GeneralModel.from_parse_result(parse_swc(SWC)), radii).tolist() == [2, 1, 2, 0]
+    with pytest.raises(ValueError):
+        sholl(model, radii[::-1])
+
+
+def _random_tree(rng, size):
+    parent = np.array([-1] + [int(rng.integers(max(0, i - 5), i)) for i in range(1, size)])
+    ids = np.arange(size, dtype=np.int64) + 1
+    return MorphologyArrays(
+        ids=ids,
+        xyz=rng.normal(size=(size, 3)),
+        r=rng.uniform(0.1, 1.0, size),
+        t=np.full(size, 3, dtype=np.int32),
+        parent=parent,
+        edges=np.column_stack([parent[1:], np.arange(1, size)]),
+        directed=True,
+    )
+
+
+def _reference_strahler(G, root):
+    value = {}
+    for n in reversed(list(nx.dfs_preorder_nodes(G, root))):
+        kids = [value[c] for c in G.successors(n)]
+        if not kids:
+            value[n] = 1
+        else:
+            top = max(kids)
+            value[n] = top + (kids.count(top) >= 2)
+    return value
+
+
+def test_metrics_match_networkx_reference_in_batch():
+    rng = np.random.default_rng(7)
+    trees = [_random_tree(rng, size) for size in (1, 40, 300)]
+    batch = node_metrics_many(trees)
+    sections = section_metrics_many(trees)
+    for arr, nodes, secs in zip(trees, batch, sections):
+        G = arr.to_networkx()
+        root = int(arr.ids[0])
+        lengths = nx.shortest_path_length(G, root, weight=lambda u, v, d: float(
+            np.linalg.norm(arr.xyz[u - 1] - arr.xyz[v - 1])
+        ))
+        assert nodes.path_length == pytest.approx([lengths[int(n)] for n in arr.ids])
+        strahler = _reference_strahler(G, root)
+        assert nodes.strahler.tolist() == [strahler[int(n)] for n in arr.ids]
+        assert secs.length.sum() == pytest.approx(sum(
+            np.linalg.norm(arr.xyz[u - 1] - arr.xyz[v - 1]) for u, v in G.edges
+        ))
+        assert len(secs) == len(set(nodes.section.tolist()) - {-1})
+        assert node_metrics(arr).branch_order.tolist() == nodes.branch_order.tolist()
+
+    profiles = sholl_many(trees, np.linspace(0.1, 3.0, 8))
+    assert profiles.shape == (3, 8)
+    assert profiles[0].tolist() == [0] * 8
+    assert profiles[2].tolist() == sholl(trees[2], np.linspace(0.1, 3.0, 8)).tolist()
@@ -0,0 +1,58 @@
+import numpy as np
+
+from swcviz import (
+    GeneralModel,
+    parse_swc,
+    write_swc,
+    find_reconnections,
+    reconnection_lines,
+    with_reconnections,
+)
+
+
+def test_find_reconnections_matches_brute_force():
+    """Hashed detection agrees with an all-pairs comparison, including values
+    that straddle quantization cell faces."""
+    rng = np.random.default_rng(3)
+    tol = 1e-3
+    base = rng.integers(0, 4, size=(60, 4)) * 0.064
+    xyzr = np.repeat(base, 5, axis=0) + rng.uniform(-tol, tol, size=(300, 4))
+    swc = "\n".join(f"{k + 1} 3 {x} {y} {z} {r} -1" for k, (x, y, z, r) in enumerate(xyzr))
+    result = parse_swc(swc)
+
+    pairs = find_reconnections(result, float_tol=tol)
+
+    close = (np.abs(xyzr[:, None, :] - xyzr[None, :, :]) <= tol).all(axis=2)
+    i, j = np.nonzero(np.triu(close, k=1))
+    np.testing.assert_array_equal(pairs, np.column_stack([i + 1, j + 1]))
+    assert find_reconnections(result, float_tol=0.0).shape == (0, 2)
+
+
+def test_detected_reconnections_feed_model_construction(tmp_path):
+    """Coincident nodes become reconnection pairs, header lines and merges;
+    zero-length parent/child edges are skipped unless requested."""
+    swc = """
+1 1 0 0 0 1 -1
+2 3 5 0 0 1 1
+3 3 5 5 0 1 2
+4 3 0 5 0 1 3
+5 3 0 0 0 1 4
+6 3 0 5 0 1 4
+""".strip()
+    result = parse_swc(swc)
+
+    pairs = find_reconnections(result)
+    assert pairs.tolist() == [[1, 5]]
+    assert reconnection_lines(pairs) == ["# CYCLE_BREAK reconnect 1 5"]
+    assert find_reconnections(result, include_edges=True).tolist() == [[1, 5], [4, 6]]
+
+    gm = GeneralModel.from_parse_result(result, detect_reconnections=True)
+    assert sorted(gm.nodes) == [1, 2, 3, 4, 6]
+    assert gm.has_edge(4, 1) and gm.number_of_edges() == 5
+
+    # Written back, the detected pairs are annotated and merge on reload
+    path = tmp_path / "annotated.swc"
+    write_swc(with_reconnections(result), path)
+    assert "# CYCLE_BREAK reconnect 1 5" in path.read_text()
+    reloaded = GeneralModel.from_swc_file(str(path))
+    assert sorted(reloaded.nodes) == sorted(gm.nodes)
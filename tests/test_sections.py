@@ -0,0 +1,70 @@
+import numpy as np
+
+from swcviz import parse_swc, SectionIndex, SWCModel, GeneralModel, FrustaSet
+
+
+# Soma 1 with stems 2-3 (bifurcating into 4 and 5-6) and 7
+SWC = """
+1 1 0 0 0 1 -1
+2 3 1 0 0 1 1
+3 3 2 0 0 1 2
+4 3 3 0 0 1 3
+5 3 2 1 0 0.5 3
+6 3 2 2 0 0.5 5
+7 3 -1 0 0 1 1
+""".strip()
+
+
+def _sections_by_ids(index):
+    return [index.ids_of(index.section_nodes(s)).tolist() for s in range(len(index))]
+
+
+def test_section_index_csr_and_tree():
+    model = SWCModel.from_parse_result(parse_swc(SWC))
+    index = model.section_index()
+    assert model.section_index() is index
+    paths = _sections_by_ids(index)
+    assert sorted(paths) == [[1, 2, 3], [1, 7], [3, 4], [3, 5, 6]]
+
+    stem = paths.index([1, 2, 3])
+    assert index.section_parent[stem] == -1
+    kids = sorted(paths[s] for s in index.section_children(stem))
+    assert kids == [[3, 4], [3, 5, 6]]
+    assert all(index.section_parent[s] == stem for s in index.section_children(stem))
+    assert index.lengths.tolist() == [len(p) for p in paths]
+    assert index.node_section[model.to_arrays().rows_of([1])].tolist() == [-1]
+
+    model.add_node(8, t=3, x=2.0, y=3.0, z=0.0, r=0.5)
+    model.add_edge(6, 8)
+    assert model.section_index() is not index
+    assert [3, 5, 6, 8] in _sections_by_ids(model.section_index())
+
+
+def test_section_index_random_forest_and_cycles():
+    rng = np.random.default_rng(5)
+    parent = np.array([-1] + [int(rng.integers(max(0, i - 4), i)) if i % 97 else -1 for i in range(1, 600)])
+    index = SectionIndex(parent)
+    covered = np.zeros(parent.size, dtype=int)
+    for s in range(len(index)):
+        rows = index.section_nodes(s)
+        assert (parent[rows[1:]] == rows[:-1]).all()
+        covered[rows[1:]] += 1
+    assert (covered == (parent >= 0)).all()
+
+    # Merging 4 and 6 closes the loop 1-2-4-5-1
+    cyclic = """
+# CYCLE_BREAK reconnect 4 6
+1 1 0 0 0 1 -1
+2 3 1 0 0 0.5 1
+3 3 2 0 0 0.4 2
+4 3 2 1 0 0.4 2
+5 3 1 1 0 0.3 1
+6 3 2 1 0 0.4 5
+""".strip()
+    gm = GeneralModel.from_parse_result(parse_swc(cyclic))
+    frusta = FrustaSet.from_general_model(gm, sides=4)
+    assert frusta.sections.shape == (gm.number_of_edges(),)
+    assert (frusta.sections == -1).sum() == 1
+    assert frusta.scaled(2.0).sections is frusta.sections
+    arrays = gm.to_arrays()
+    assert arrays.sections() is arrays.sections()
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from swcviz import parse_swc, GeneralModel, FrustaSet, SpatialIndex
+
+
+SWC = """
+1 1 0 0 0 1 -1
+2 3 4 0 0 0.5 1
+3 3 8 0 0 0.5 2
+4 3 8 4 0 0.5 3
+5 3 0 0 9 0.5 1
+""".strip()
+
+
+def test_spatial_index_matches_brute_force():
+    rng = np.random.default_rng(11)
+    pts = rng.uniform(0, 50, size=(3000, 3))
+    index = SpatialIndex.from_points(pts)
+    queries = rng.uniform(-20, 70, size=(300, 3))
+
+    rows, dist = index.nearest(queries)
+    brute = np.linalg.norm(queries[:, None, :] - pts[None, :, :], axis=2)
+    assert np.allclose(dist, brute.min(axis=1))
+    assert np.allclose(brute[np.arange(300), rows], dist)
+
+    hits, offsets = index.within(queries, 4.0)
+    for q in range(300):
+        assert hits[offsets[q] : offsets[q + 1]].tolist() == np.flatnonzero(brute[q] <= 4.0).tolist()
+
+    a = rng.uniform(0, 50, size=(400, 3))
+    b = a + rng.normal(0, 3, size=(400, 3))
+    segs = SpatialIndex(a, b, rng.uniform(0.1, 1, 400), rng.uniform(0.1, 1, 400))
+    rows, dist = segs.nearest(queries)
+    for q in range(0, 300, 7):
+        d = segs.distance(np.repeat(queries[q : q + 1], 400, axis=0), np.arange(400))
+        assert dist[q] == pytest.approx(d.min())
+
+    empty = SpatialIndex.from_points(np.empty((0, 3)))
+    assert empty.nearest(queries[:2])[0].tolist() == [-1, -1]
+    assert empty.within(queries[:2], 1.0)[1].tolist() == [0, 0, 0]
+
+
+def test_model_spatial_index_cached_and_invalidated():
+    gm = GeneralModel.from_parse_result(parse_swc(SWC))
+    index = gm.spatial_index()
+    assert gm.spatial_index() is index
+    rows, dist = index.nearest([[7.0, 0.5, 0.0], [0.0, 0.0, 8.0]])
+    assert index.keys[rows].tolist() == [3, 5]
+    assert dist == pytest.approx([np.hypot(1.0, 0.5), 1.0])
+
+    segs = gm.spatial_index("segments")
+    rows, dist = segs.nearest([[6.0, 1.5, 0.0]])
+    assert sorted(segs.keys[rows[0]].tolist()) == [2, 3]
+    assert dist[0] == pytest.approx(1.0)
+    hits, offsets = segs.within([[6.0, 1.5, 0.0]], 1.9)
+    assert sorted(map(sorted, segs.keys[hits].tolist())) == [[2, 3], [3, 4]]
+
+    gm.nodes[5]["z"] = 20.0
+    moved = gm.spatial_index()
+    assert moved is not index
+    assert moved.keys[moved.nearest([[0.0, 0.0, 8.0]])[0]].tolist() == [1]
+    # Radii only feed the segment index
+    segs = gm.spatial_index("segments")
+    gm.nodes[3]["r"] = 2.0
+    assert gm.spatial_index() is moved
+    assert gm.spatial_index("segments") is not segs
+    with pytest.raises(ValueError):
+        gm.spatial_index("faces")
+
+    frusta = FrustaSet.from_general_model(gm, sides=4)
+    assert frusta.spatial_index() is frusta.spatial_index()
+    assert len(frusta.spatial_index()) == frusta.segment_count
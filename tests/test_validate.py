@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from swcviz import parse_swc, validate_swc, validate_table, SWCTable, ValidationReport
+
+
+BROKEN = """
+# CYCLE_BREAK reconnect 2 7
+# CYCLE_BREAK reconnect 3 99
+1 1 0 0 0 1 -1
+2 3 1 0 0 0.5 1
+3 3 2 0 0 -0.5 2
+4 3 3 0 0 nan 42
+2 3 9 9 9 0.5 1
+5 3 4 0 0 0.5 6
+6 3 5 0 0 0.5 5
+7 3 1 0 0 0.7 1
+8 3 abc 0 0 0.5 1
+""".strip()
+
+
+def test_report_lists_every_violation_with_lines():
+    report = validate_swc(BROKEN)
+    assert isinstance(report, ValidationReport)
+    assert not report.ok
+    assert report.rows == 9
+    assert report.counts() == {
+        "row": 1,
+        "duplicate_id": 1,
+        "missing_parent": 1,
+        "parent_cycle": 2,
+        "radius": 2,
+        "reconnection": 2,
+    }
+    assert [v.line for v in report.by_code("row")] == [11]
+    assert [v.line for v in report.by_code("duplicate_id")] == [7]
+    assert [(v.line, v.node) for v in report.by_code("missing_parent")] == [(6, 4)]
+    assert sorted(v.node for v in report.by_code("parent_cycle")) == [5, 6]
+    assert [v.line for v in report.by_code("radius")] == [5, 6]
+    assert report.lines() == [4, 5, 6, 7, 8, 9, 11]
+    with pytest.raises(ValueError, match="9 violation"):
+        report.raise_for_errors()
+
+
+def test_cycle_detection_ignores_tails_and_long_chains():
+    size = 5000
+    n = np.arange(1, size + 1)
+    parent = np.r_[-1, n[:-1]]
+    # Close a 3-cycle far from the root and hang a tail off it
+    parent[[size - 3, size - 2, size - 1]] = [size, size - 2, size - 1]
+    zeros = np.zeros(size)
+    table = SWCTable(n=n, t=np.ones(size), x=zeros, y=zeros, z=zeros, r=zeros + 1,
+                     parent=parent, line=n)
+    report = validate_table(table)
+    assert sorted(v.node for v in report.by_code("parent_cycle")) == [size - 2, size - 1, size]
+    assert report.counts() == {"parent_cycle": 3}
+
+
+def test_fail_fast_matches_parse_swc():
+    swc = """
+1 1 0 0 0 1 -1
+2 3 1 0 0 0.5 8
+3 3 1 0 0 0.5 9
+""".strip()
+    result = parse_swc(swc, strict=False)
+    with pytest.raises(ValueError, match=r"Line 2: parent id 8 does not exist for node 2"):
+        validate_table(result.table, fail_fast=True)
+    with pytest.raises(ValueError, match=r"Line 2: parent id 8"):
+        parse_swc(swc)
+    assert validate_table(result.table, checks=["radius", "duplicate_id"]).ok
+    with pytest.raises(ValueError, match="Unknown validation check"):
+        validate_table(result.table, checks=["nope"])
+
+
+def test_non_strict_skips_parents_and_extra_columns():
+    swc = """
+1 1 0 0 0 1 -1 extra
+2 3 1 0 0 0.5 8
+""".strip()
+    assert validate_swc(swc, strict=False).ok
+    assert validate_swc(swc).counts() == {"row": 1, "missing_parent": 1}